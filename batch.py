@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Qt 없이 여러 녹음 파일을 한 번에 전사 및 요약하는 명령줄 도구
+
+사용 예:
+    python batch.py "recordings/*.mp4" meeting.m4a --summary both --jobs 4 > report.json
+
+진행 로그는 표준 에러로, 파일별 처리 시간과 실패 내역은 JSON으로 표준 출력에 기록됩니다.
+하나라도 실패하면 종료 코드 1을 반환합니다.
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+import threading
+from contextlib import redirect_stdout
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from utils.api import OpenAIAPI
+from utils.pipeline import MeetingPipeline
+from utils.storage import Storage, TRANSCRIPT_FORMATS
+from utils.sqlite_storage import SQLiteStorage
+
+# 디렉토리를 입력으로 받았을 때 처리할 파일 확장자
+MEDIA_EXTENSIONS = {'.mp3', '.mp4', '.wav', '.m4a', '.avi', '.mov', '.webm', '.ogg', '.flac'}
+
+# 요약 옵션별 요약 유형 목록
+SUMMARY_OPTIONS = {
+    "paragraph": ["paragraph"],
+    "timestamped": ["timestamped"],
+    "both": ["paragraph", "timestamped"]
+}
+
+# 결과 저장 방식별 저장소 클래스
+STORAGE_BACKENDS = {
+    "files": Storage,
+    "sqlite": SQLiteStorage
+}
+
+# 여러 작업의 로그가 한 줄 안에서 섞이지 않도록 출력 잠금
+_print_lock = threading.Lock()
+
+def log(message):
+    """표준 에러로 로그 출력"""
+    with _print_lock:
+        print(message, file=sys.stderr, flush=True)
+
+def expand_inputs(patterns):
+    """
+    파일 경로, 글롭 패턴, 디렉토리를 처리할 파일 목록으로 펼칩니다.
+    
+    Args:
+        patterns (list): 파일 경로 또는 글롭 패턴 목록
+    
+    Returns:
+        list: 중복이 제거된 파일 경로 목록 (입력 순서 유지)
+    """
+    files = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) or [pattern]
+        for path in matches:
+            if os.path.isdir(path):
+                files.extend(
+                    os.path.join(path, name) for name in sorted(os.listdir(path))
+                    if os.path.splitext(name)[1].lower() in MEDIA_EXTENSIONS
+                )
+            else:
+                files.append(path)
+    
+    return list(dict.fromkeys(os.path.abspath(path) for path in files))
+
+def process_file(file_path, summary_types, api, storage, verbose, remove_silence=False, export_prometheus=False):
+    """
+    파일 하나를 파이프라인으로 처리하고 처리 결과를 반환합니다.
+    
+    Returns:
+        dict: file, success, seconds, timings (단계별 시간), error
+    """
+    name = os.path.basename(file_path)
+    
+    def on_progress(progress, status):
+        log(f"[{name}] {progress}% {status}")
+    
+    def on_log(message):
+        if verbose:
+            log(f"[{name}] {message}")
+    
+    start = time.monotonic()
+    pipeline = MeetingPipeline(
+        file_path, summary_types, api=api, storage=storage,
+        on_progress=on_progress, on_log=on_log, remove_silence=remove_silence,
+        export_prometheus=export_prometheus
+    )
+    try:
+        results = pipeline.run()
+    except Exception as e:
+        results = {"success": False, "error": str(e)}
+    
+    report = {
+        "file": file_path,
+        "success": bool(results and results.get("success")),
+        "seconds": round(time.monotonic() - start, 3)
+    }
+    if pipeline.metrics is not None:
+        report["timings"] = pipeline.metrics.stage_seconds()
+    if not report["success"]:
+        report["error"] = (results or {}).get("error", "알 수 없는 오류")
+    return report
+
+def main():
+    parser = argparse.ArgumentParser(description="여러 녹음 파일을 Qt 없이 전사 및 요약합니다.")
+    parser.add_argument("inputs", nargs="+", help="처리할 파일, 글롭 패턴 또는 디렉토리")
+    parser.add_argument("--summary", choices=SUMMARY_OPTIONS.keys(), default="paragraph",
+                        help="생성할 요약 유형 (기본값: paragraph)")
+    parser.add_argument("--jobs", type=int, default=2, help="동시에 처리할 파일 수 (기본값: 2)")
+    parser.add_argument("--results-dir", help="결과 저장 디렉토리 (기본값: ./results)")
+    parser.add_argument("--storage", choices=STORAGE_BACKENDS.keys(), default="files",
+                        help="결과 저장 방식: 결과 폴더의 개별 파일 또는 결과 폴더의 meetings.db (기본값: files)")
+    parser.add_argument("--transcript-format", choices=TRANSCRIPT_FORMATS, default="json",
+                        help="전사 결과 파일 형식: JSON 또는 압축된 이진 형식 .trx (기본값: json)")
+    parser.add_argument("--remove-silence", action="store_true",
+                        help="업로드 전에 긴 무음 구간 제거 (타임스탬프는 원본 기준)")
+    parser.add_argument("--prometheus", action="store_true",
+                        help="단계별 처리 시간을 Prometheus 텍스트 형식(결과 폴더의 metrics_<작업 ID>.prom)으로도 저장")
+    parser.add_argument("--verbose", action="store_true", help="파이프라인 로그를 모두 출력")
+    args = parser.parse_args()
+    
+    files = expand_inputs(args.inputs)
+    if not files:
+        log("처리할 파일이 없습니다.")
+        return 2
+    
+    summary_types = SUMMARY_OPTIONS[args.summary]
+    # 모든 작업이 연결 풀과 캐시를 공유하도록 하나의 클라이언트/저장소 사용
+    api = OpenAIAPI()
+    storage = STORAGE_BACKENDS[args.storage](args.results_dir, transcript_format=args.transcript_format)
+    
+    log(f"{len(files)}개 파일 처리 시작 (동시 작업: {args.jobs})")
+    start = time.monotonic()
+    reports = []
+    
+    # 표준 출력에는 JSON 결과만 남도록 라이브러리의 print 출력은 표준 에러로 보냄
+    with redirect_stdout(sys.stderr), ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        futures = [
+            executor.submit(process_file, file_path, summary_types, api, storage,
+                            args.verbose, args.remove_silence, args.prometheus)
+            for file_path in files
+        ]
+        for future in as_completed(futures):
+            report = future.result()
+            reports.append(report)
+            status = "완료" if report["success"] else f"실패: {report['error']}"
+            log(f"[{os.path.basename(report['file'])}] {status} ({report['seconds']:.1f}초)")
+    
+    api.close()
+    storage.close()
+    
+    # 입력 순서대로 정렬하여 출력
+    order = {file_path: index for index, file_path in enumerate(files)}
+    reports.sort(key=lambda report: order[report["file"]])
+    failed = [report for report in reports if not report["success"]]
+    
+    summary = {
+        "total": len(reports),
+        "succeeded": len(reports) - len(failed),
+        "failed": len(failed),
+        "seconds": round(time.monotonic() - start, 3),
+        "results_dir": storage.base_dir,
+        "storage": args.storage,
+        "files": reports
+    }
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+오디오 변환 경로별 최대 메모리 사용량(peak RSS) 벤치마크
+
+입력 길이를 늘려가며 단일 파일 변환(convert_to_mp3, ffmpeg 한 번 인코딩)과
+ffmpeg 스트리밍 청크 변환(convert_to_mp3_chunks)의 peak RSS를 비교합니다.
+각 측정은 별도 프로세스에서 실행되어 서로의 메모리 사용량에 영향을 주지 않습니다.
+(peak RSS 측정에 resource 모듈을 사용하므로 Linux/macOS에서 실행해야 합니다.)
+
+사용 예:
+    python benchmarks/convert_memory.py --durations 5 30 60
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+import tempfile
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 자식 프로세스에서 실행할 측정 코드
+CHILD_CODE = """
+import json, os, sys, time, resource
+sys.path.insert(0, {project_dir!r})
+from utils.audio import AudioProcessor
+
+start = time.perf_counter()
+if {method!r} == "chunks":
+    outputs = [path for path, _ in AudioProcessor.convert_to_mp3_chunks({input_path!r})]
+else:
+    outputs = [AudioProcessor.convert_to_mp3({input_path!r})]
+elapsed = time.perf_counter() - start
+
+output_size = sum(os.path.getsize(path) for path in outputs)
+for path in outputs:
+    os.remove(path)
+
+scale = 1 if sys.platform == "darwin" else 1024  # ru_maxrss 단위: macOS는 바이트, Linux는 KB
+print(json.dumps({{
+    "seconds": elapsed,
+    "output_bytes": output_size,
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / (1024 * 1024),
+    "ffmpeg_peak_rss_mb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale / (1024 * 1024),
+}}))
+"""
+
+def generate_input(duration_minutes, directory):
+    """
+    회의 녹음과 비슷한 스테레오 44.1kHz 테스트 파일을 생성합니다.
+    
+    Args:
+        duration_minutes (int): 길이 (분)
+        directory (str): 파일을 만들 디렉토리
+        
+    Returns:
+        str: 생성된 파일 경로
+    """
+    path = os.path.join(directory, f"input_{duration_minutes}m.mp3")
+    # 7초마다 1초씩 무음이 들어간 노이즈 (말소리와 쉬는 구간 흉내)
+    source = (
+        f"anoisesrc=d={duration_minutes * 60}:c=pink:r=44100:a=0.3,"
+        "volume='if(lt(mod(t,7),1),0,1)':eval=frame"
+    )
+    subprocess.run(
+        ["ffmpeg", "-nostdin", "-loglevel", "error", "-y",
+         "-f", "lavfi", "-i", source, "-ac", "2", "-b:a", "128k", path],
+        check=True
+    )
+    return path
+
+def measure(method, input_path):
+    """별도 프로세스에서 변환을 실행하고 측정 결과를 반환합니다."""
+    code = CHILD_CODE.format(project_dir=PROJECT_DIR, method=method, input_path=input_path)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "unknown"}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description="오디오 변환 peak RSS 벤치마크")
+    parser.add_argument("--durations", type=int, nargs="+", default=[5, 15, 30, 60],
+                        help="측정할 입력 길이 목록 (분)")
+    parser.add_argument("--methods", nargs="+", default=["single", "chunks"],
+                        choices=["single", "chunks"], help="측정할 변환 경로")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+    
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for duration in args.durations:
+            input_path = generate_input(duration, work_dir)
+            for method in args.methods:
+                measurement = measure(method, input_path)
+                measurement.update({"method": method, "duration_minutes": duration})
+                results.append(measurement)
+                print(json.dumps(measurement, ensure_ascii=False))
+    
+    print()
+    print(f"{'길이(분)':>8} {'경로':>8} {'시간(s)':>8} {'peak RSS(MB)':>13} {'ffmpeg RSS(MB)':>15}")
+    for row in results:
+        if "error" in row:
+            print(f"{row['duration_minutes']:>8} {row['method']:>8}  오류: {row['error']}")
+            continue
+        print(f"{row['duration_minutes']:>8} {row['method']:>8} {row['seconds']:>8.1f} "
+              f"{row['peak_rss_mb']:>13.1f} {row['ffmpeg_peak_rss_mb']:>15.1f}")
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "results": results},
+                      f, ensure_ascii=False, indent=2)
+
+if __name__ == "__main__":
+    main()
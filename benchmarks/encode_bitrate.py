@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+단일 파일 MP3 변환 방식별 인코딩 시간과 출력 크기 벤치마크
+
+이전 방식(pydub으로 전체 디코딩 후 64k 내보내기 → 크기 확인 → 16kHz로 다시 내보내기 →
+앞부분만 잘라 다시 내보내기)과, 입력 길이로 비트레이트를 미리 계산해 한 번만 인코딩하는
+현재 방식(AudioProcessor.convert_to_mp3)을 비교합니다.
+
+사용 예:
+    python benchmarks/encode_bitrate.py --durations 10 60 240
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from convert_memory import generate_input
+from utils.audio import AudioProcessor, MAX_FILE_SIZE
+from utils.environment import find_ffmpeg
+
+def load_audio(input_file_path):
+    """
+    이전 방식처럼 pydub으로 파일 전체를 디코딩하여 불러옵니다. (비교용)
+    
+    Args:
+        input_file_path (str): 입력 파일 경로
+        
+    Returns:
+        AudioSegment: 불러온 오디오
+    """
+    from pydub import AudioSegment
+    
+    ffmpeg_path, ffprobe_path = find_ffmpeg()
+    if ffmpeg_path:
+        AudioSegment.converter = ffmpeg_path
+    if ffprobe_path:
+        AudioSegment.ffprobe = ffprobe_path
+    
+    file_ext = os.path.splitext(input_file_path)[1].lower()
+    if file_ext == '.mp3':
+        return AudioSegment.from_mp3(input_file_path)
+    if file_ext == '.wav':
+        return AudioSegment.from_wav(input_file_path)
+    return AudioSegment.from_file(input_file_path)
+
+def legacy_convert_to_mp3(input_file_path):
+    """
+    이전 convert_to_mp3의 내보내기/크기 확인/다시 내보내기 반복 (비교용)
+    
+    Returns:
+        tuple: (출력 파일 경로, 인코딩 횟수)
+    """
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
+    temp_file_path = temp_file.name
+    temp_file.close()
+    
+    audio = load_audio(input_file_path).set_channels(1)
+    encodes = 1
+    
+    if len(audio.raw_data) > MAX_FILE_SIZE:
+        audio.export(temp_file_path, format="mp3", bitrate="64k")
+        if os.path.getsize(temp_file_path) > MAX_FILE_SIZE:
+            audio = audio.set_frame_rate(16000)
+            audio.export(temp_file_path, format="mp3", bitrate="64k")
+            encodes += 1
+        if os.path.getsize(temp_file_path) > MAX_FILE_SIZE:
+            new_duration = int(len(audio) * (MAX_FILE_SIZE / os.path.getsize(temp_file_path)) * 0.95)
+            audio = audio[:new_duration]
+            audio.export(temp_file_path, format="mp3", bitrate="64k")
+            encodes += 1
+    else:
+        audio.export(temp_file_path, format="mp3")
+    
+    return temp_file_path, encodes
+
+def single_pass_convert_to_mp3(input_file_path):
+    """현재 convert_to_mp3 (한 번만 인코딩)"""
+    return AudioProcessor.convert_to_mp3(input_file_path), 1
+
+METHODS = {
+    "legacy": legacy_convert_to_mp3,
+    "single": single_pass_convert_to_mp3
+}
+
+def measure(method, input_path):
+    """변환을 한 번 실행하고 시간, 출력 크기, 인코딩 횟수를 반환합니다."""
+    start = time.perf_counter()
+    try:
+        output_path, encodes = METHODS[method](input_path)
+    except Exception as e:
+        return {"error": str(e).strip().splitlines()[-1] if str(e).strip() else type(e).__name__}
+    elapsed = time.perf_counter() - start
+    
+    output_size = os.path.getsize(output_path)
+    os.remove(output_path)
+    return {
+        "seconds": elapsed,
+        "output_bytes": output_size,
+        "within_limit": output_size <= MAX_FILE_SIZE,
+        "encodes": encodes
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="MP3 변환 인코딩 시간/출력 크기 벤치마크")
+    parser.add_argument("--durations", type=int, nargs="+", default=[10, 60, 240],
+                        help="측정할 입력 길이 목록 (분)")
+    parser.add_argument("--methods", nargs="+", default=list(METHODS),
+                        choices=list(METHODS), help="측정할 변환 방식")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+    
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for duration in args.durations:
+            input_path = generate_input(duration, work_dir)
+            for method in args.methods:
+                measurement = measure(method, input_path)
+                measurement.update({"method": method, "duration_minutes": duration})
+                results.append(measurement)
+                print(json.dumps(measurement, ensure_ascii=False), file=sys.stderr)
+    
+    print()
+    print(f"{'길이(분)':>8} {'방식':>8} {'시간(s)':>8} {'출력(MB)':>9} {'인코딩':>6}")
+    for row in results:
+        if "error" in row:
+            print(f"{row['duration_minutes']:>8} {row['method']:>8}  오류: {row['error']}")
+            continue
+        print(f"{row['duration_minutes']:>8} {row['method']:>8} {row['seconds']:>8.1f} "
+              f"{row['output_bytes'] / (1024 * 1024):>9.1f} {row['encodes']:>6}")
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "results": results},
+                      f, ensure_ascii=False, indent=2)
+
+if __name__ == "__main__":
+    main()
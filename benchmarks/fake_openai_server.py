@@ -0,0 +1,324 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+부하 테스트용 로컬 OpenAI 호환 서버
+
+API 사용료 없이 파이프라인 전체를 부하 테스트할 수 있도록, 앱이 사용하는 두 엔드포인트를 흉내 냅니다.
+    POST /v1/audio/transcriptions  verbose_json 형식 (text, segments)
+    POST /v1/chat/completions      일반 응답과 스트리밍(SSE) 응답
+    GET  /stats                    엔드포인트별 요청 수, 주입한 오류 수
+
+응답 지연은 분포로 지정하고(fixed:초, uniform:최소:최대, normal:평균:표준편차,
+lognormal:중앙값:시그마, exp:평균), 429/5xx 오류를 확률로 섞을 수 있습니다.
+전사 응답의 길이는 업로드 크기와 --assumed-kbps로 추정합니다.
+
+앱을 이 서버에 연결하려면 .env 또는 환경 변수에 OPENAI_BASE_URL=http://127.0.0.1:8765/v1 을 설정합니다.
+
+사용 예:
+    python benchmarks/fake_openai_server.py --port 8765 --transcribe-latency lognormal:2:0.5 \\
+        --chat-latency uniform:0.5:1.5 --rate-429 0.05 --rate-5xx 0.02
+"""
+
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+DEFAULT_PORT = 8765
+
+# 전사 응답 세그먼트 길이 (초)
+SEGMENT_SECONDS = 4.0
+
+# 가짜 전사/요약 텍스트에 사용할 문장
+SENTENCES = (
+    "이번 분기 예산 집행 현황을 공유드리겠습니다.",
+    "다음 주까지 출시 일정을 다시 검토해 주세요.",
+    "고객 리뷰에서 품질 문제가 반복해서 언급되었습니다.",
+    "채용은 상반기 안에 마무리하는 것으로 결정했습니다.",
+    "서버 비용 절감 방안에 대해 질문이 있습니다.",
+    "보안 점검 결과는 다음 회의에서 보고하겠습니다.",
+)
+
+def parse_latency(spec):
+    """
+    지연 분포 문자열을 지연 시간(초)을 만드는 함수로 바꿉니다.
+    
+    Args:
+        spec (str): 'fixed:초', 'uniform:최소:최대', 'normal:평균:표준편차', 'lognormal:중앙값:시그마', 'exp:평균'
+    
+    Returns:
+        callable: random.Random을 받아 지연 시간(초)을 반환하는 함수
+    """
+    name, *values = spec.split(":")
+    try:
+        values = [float(value) for value in values]
+        if name == "fixed":
+            (seconds,) = values
+            return lambda rng: seconds
+        if name == "uniform":
+            low, high = values
+            return lambda rng: rng.uniform(low, high)
+        if name == "normal":
+            mean, deviation = values
+            return lambda rng: max(0.0, rng.gauss(mean, deviation))
+        if name == "lognormal":
+            median, sigma = values
+            return lambda rng: rng.lognormvariate(math.log(median), sigma) if median > 0 else 0.0
+        if name == "exp":
+            (mean,) = values
+            return lambda rng: rng.expovariate(1 / mean) if mean > 0 else 0.0
+    except ValueError:
+        pass
+    raise argparse.ArgumentTypeError(f"지연 분포 형식이 올바르지 않습니다: {spec}")
+
+class FakeOpenAIState:
+    """서버 설정과 요청 통계 (모든 요청 스레드가 공유)"""
+    
+    def __init__(self, transcribe_latency="fixed:0", chat_latency="fixed:0", stream_interval=0.02,
+                 rate_429=0.0, rate_5xx=0.0, retry_after=1.0, assumed_kbps=32, seed=None):
+        """
+        FakeOpenAIState 초기화
+        
+        Args:
+            transcribe_latency (str): 전사 응답 지연 분포
+            chat_latency (str): 요약 응답 지연 분포 (스트리밍이면 첫 조각까지의 지연)
+            stream_interval (float): 스트리밍 조각 사이 간격 (초)
+            rate_429 (float): 429 응답 확률
+            rate_5xx (float): 500/502/503 응답 확률
+            retry_after (float): 429 응답의 Retry-After (초)
+            assumed_kbps (float): 업로드 크기로 오디오 길이를 추정할 때 가정하는 비트레이트
+            seed (int, optional): 무작위 시드
+        """
+        self.transcribe_latency = parse_latency(transcribe_latency)
+        self.chat_latency = parse_latency(chat_latency)
+        self.stream_interval = stream_interval
+        self.rate_429 = rate_429
+        self.rate_5xx = rate_5xx
+        self.retry_after = retry_after
+        self.assumed_kbps = assumed_kbps
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {"requests": {}, "errors": {}}
+    
+    def record(self, endpoint, status):
+        """요청 결과를 통계에 기록합니다."""
+        with self.lock:
+            self.stats["requests"][endpoint] = self.stats["requests"].get(endpoint, 0) + 1
+            if status >= 400:
+                key = f"{endpoint} {status}"
+                self.stats["errors"][key] = self.stats["errors"].get(key, 0) + 1
+    
+    def draw(self, latency):
+        """지연 시간과 주입할 오류 상태 코드를 뽑습니다. (오류가 없으면 None)"""
+        with self.lock:
+            delay = latency(self.rng)
+            roll = self.rng.random()
+            status = None
+            if roll < self.rate_429:
+                status = 429
+            elif roll < self.rate_429 + self.rate_5xx:
+                status = self.rng.choice((500, 502, 503))
+            return delay, status
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    """OpenAI 호환 엔드포인트 처리기"""
+    
+    protocol_version = "HTTP/1.1"  # keep-alive 연결 재사용 (클라이언트 연결 풀 동작 확인용)
+    state = None  # FakeOpenAIState (create_server에서 설정)
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _send_error(self, endpoint, status):
+        headers = {"Retry-After": f"{self.state.retry_after:g}"} if status == 429 else None
+        self.state.record(endpoint, status)
+        self._send_json(status, {"error": {"message": f"주입된 오류 ({status})", "type": "fake_error"}}, headers)
+    
+    def do_GET(self):
+        if self.path.rstrip("/") == "/stats":
+            with self.state.lock:
+                payload = json.loads(json.dumps(self.state.stats))
+            self._send_json(200, payload)
+            return
+        self._send_json(404, {"error": {"message": "not found"}})
+    
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        
+        if self.path.endswith("/audio/transcriptions"):
+            self._transcribe(len(body))
+        elif self.path.endswith("/chat/completions"):
+            try:
+                payload = json.loads(body or b"{}")
+            except ValueError:
+                self._send_json(400, {"error": {"message": "invalid JSON"}})
+                return
+            self._chat(payload)
+        else:
+            self._send_json(404, {"error": {"message": "not found"}})
+    
+    def _transcribe(self, upload_bytes):
+        """업로드 크기로 길이를 추정하여 verbose_json 전사 결과를 반환합니다."""
+        endpoint = "transcriptions"
+        delay, error_status = self.state.draw(self.state.transcribe_latency)
+        time.sleep(delay)
+        if error_status:
+            self._send_error(endpoint, error_status)
+            return
+        
+        duration = max(SEGMENT_SECONDS, upload_bytes * 8 / (self.state.assumed_kbps * 1000))
+        segments = []
+        start = 0.0
+        index = 0
+        while start < duration:
+            end = min(duration, start + SEGMENT_SECONDS)
+            segments.append({"id": index, "start": start, "end": end, "text": " " + SENTENCES[index % len(SENTENCES)]})
+            start = end
+            index += 1
+        
+        self.state.record(endpoint, 200)
+        self._send_json(200, {
+            "task": "transcribe",
+            "language": "korean",
+            "duration": duration,
+            "text": "".join(segment["text"] for segment in segments).strip(),
+            "segments": segments
+        })
+    
+    def _chat(self, payload):
+        """요약 응답을 반환합니다. stream이면 SSE 조각으로 나누어 보냅니다."""
+        endpoint = "chat"
+        delay, error_status = self.state.draw(self.state.chat_latency)
+        time.sleep(delay)
+        if error_status:
+            self._send_error(endpoint, error_status)
+            return
+        
+        prompt_chars = sum(len(message.get("content") or "") for message in payload.get("messages", []))
+        content = "\n".join(f"- {sentence}" for sentence in SENTENCES) + f"\n\n(입력 {prompt_chars}자 요약)"
+        model = payload.get("model", "fake")
+        self.state.record(endpoint, 200)
+        
+        if not payload.get("stream"):
+            self._send_json(200, {
+                "id": "chatcmpl-fake",
+                "object": "chat.completion",
+                "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}]
+            })
+            return
+        
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for piece in content.split(" "):
+                event = {"id": "chatcmpl-fake", "model": model, "choices": [{"index": 0, "delta": {"content": piece + " "}}]}
+                self._write_chunk(f"data: {json.dumps(event, ensure_ascii=False)}\n\n")
+                time.sleep(self.state.stream_interval)
+            self._write_chunk("data: [DONE]\n\n")
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 스트림 도중 연결을 끊은 경우 (작업 취소 등)
+            self.close_connection = True
+    
+    def _write_chunk(self, text):
+        data = text.encode('utf-8')
+        self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+        self.wfile.flush()
+
+class FakeOpenAIServer(ThreadingHTTPServer):
+    """동시 연결이 많은 부하 테스트용 서버 (기본 listen 대기열 5개로는 연결이 거부됨)"""
+    
+    daemon_threads = True
+    request_queue_size = 128
+    
+    def handle_error(self, request, client_address):
+        # 클라이언트가 keep-alive 연결을 닫아 생기는 오류는 출력하지 않음
+        if isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            return
+        super().handle_error(request, client_address)
+
+def create_server(host="127.0.0.1", port=DEFAULT_PORT, **options):
+    """
+    서버를 만듭니다. serve_forever()로 실행하고 shutdown()으로 종료합니다.
+    
+    Args:
+        host (str): 바인드 주소
+        port (int): 포트 (0이면 빈 포트 사용)
+        **options: FakeOpenAIState 옵션
+    
+    Returns:
+        FakeOpenAIServer: 서버 (server.state로 통계 확인)
+    """
+    state = FakeOpenAIState(**options)
+    handler = type("BoundFakeOpenAIHandler", (FakeOpenAIHandler,), {"state": state})
+    server = FakeOpenAIServer((host, port), handler)
+    server.state = state
+    return server
+
+def add_server_arguments(parser):
+    """서버 옵션을 명령줄 인자로 추가합니다. (부하 테스트 드라이버와 공유)"""
+    parser.add_argument("--transcribe-latency", default="lognormal:1.0:0.4", type=str,
+                        help="전사 응답 지연 분포 (기본값: lognormal:1.0:0.4)")
+    parser.add_argument("--chat-latency", default="uniform:0.3:1.0", type=str,
+                        help="요약 응답 지연 분포 (기본값: uniform:0.3:1.0)")
+    parser.add_argument("--stream-interval", type=float, default=0.02, help="스트리밍 조각 간격 (초)")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="429 응답 확률 (0~1)")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="5xx 응답 확률 (0~1)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="429 응답의 Retry-After (초)")
+    parser.add_argument("--assumed-kbps", type=float, default=32, help="업로드 크기로 길이를 추정할 때의 비트레이트")
+    parser.add_argument("--seed", type=int, help="무작위 시드")
+
+def server_options(args):
+    """명령줄 인자에서 FakeOpenAIState 옵션을 만듭니다."""
+    for spec in (args.transcribe_latency, args.chat_latency):
+        parse_latency(spec)
+    return {
+        "transcribe_latency": args.transcribe_latency,
+        "chat_latency": args.chat_latency,
+        "stream_interval": args.stream_interval,
+        "rate_429": args.rate_429,
+        "rate_5xx": args.rate_5xx,
+        "retry_after": args.retry_after,
+        "assumed_kbps": args.assumed_kbps,
+        "seed": args.seed
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="부하 테스트용 로컬 OpenAI 호환 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소 (기본값: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"포트 (기본값: {DEFAULT_PORT})")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    
+    try:
+        server = create_server(args.host, args.port, **server_options(args))
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    print(f"가짜 OpenAI 서버 실행 중: http://{args.host}:{server.server_address[1]}/v1 (Ctrl+C로 종료)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
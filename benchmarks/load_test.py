@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+로컬 OpenAI 호환 서버를 대상으로 한 파이프라인 부하 테스트
+
+WorkerThread와 같은 설정(진행 콜백, 스트리밍 요약)으로 MeetingPipeline을 N개 동시에 실행하여
+처리량과 작업 지연 시간 백분위수(p50/p90/p99), 첫 요약 조각까지의 시간을 JSON으로 보고합니다.
+Qt 이벤트 루프 없이 측정하도록 QThread 대신 일반 스레드에서 파이프라인을 실행합니다.
+
+작업마다 별도의 임시 Storage를 사용하므로 캐시나 체크포인트 없이 매번 변환, 전사, 요약을 모두 수행하고,
+API 클라이언트는 앱처럼 모든 작업이 하나를 공유합니다.
+
+--serve를 주면 benchmarks/fake_openai_server.py를 같은 프로세스에서 띄우고(빈 포트 사용),
+아니면 --base-url(기본값: 환경 변수 OPENAI_BASE_URL)의 서버를 사용합니다.
+
+사용 예:
+    python benchmarks/load_test.py --serve --jobs 40 --concurrency 8 --rate-429 0.05 --rate-5xx 0.02
+    python benchmarks/load_test.py --base-url http://127.0.0.1:8765/v1 --jobs 20 --concurrency 4 audio.mp3
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from fake_openai_server import create_server, add_server_arguments, server_options
+from suite import generate_speech_like
+from utils.api import OpenAIAPI, BASE_URL_ENV
+from utils.pipeline import MeetingPipeline
+from utils.storage import Storage
+
+PERCENTILES = (50, 90, 99)
+
+def percentile(values, percent):
+    """정렬된 값 목록의 백분위수 (nearest-rank 방식, 값이 없으면 None)"""
+    if not values:
+        return None
+    rank = max(1, -(-len(values) * percent // 100))
+    return values[int(rank) - 1]
+
+def describe(values):
+    """지연 시간 목록의 요약 통계"""
+    values = sorted(values)
+    result = {"count": len(values)}
+    if values:
+        result["mean"] = sum(values) / len(values)
+        result["min"] = values[0]
+        result["max"] = values[-1]
+    for percent in PERCENTILES:
+        result[f"p{percent}"] = percentile(values, percent)
+    return result
+
+def run_job(index, input_path, summary_types, api, work_dir):
+    """
+    파이프라인 작업 하나를 실행하고 소요 시간을 측정합니다.
+    
+    Returns:
+        dict: 작업 결과 (성공 여부, 전체 시간, 첫 요약 조각까지의 시간, 오류)
+    """
+    job_dir = os.path.join(work_dir, f"job_{index}")
+    storage = Storage(os.path.join(job_dir, "results"), os.path.join(job_dir, "cache"))
+    first_delta = []
+    start = time.perf_counter()
+    
+    def on_summary_delta(summary_type, delta):
+        if not first_delta:
+            first_delta.append(time.perf_counter() - start)
+    
+    pipeline = MeetingPipeline(
+        input_path,
+        summary_types,
+        api=api,
+        storage=storage,
+        on_progress=lambda progress, status: None,
+        on_log=lambda message: None,
+        should_stop=lambda: False,
+        on_summary_delta=on_summary_delta
+    )
+    try:
+        results = pipeline.run() or {}
+    except Exception as e:
+        results = {"success": False, "error": str(e)}
+    finally:
+        storage.close()
+    elapsed = time.perf_counter() - start
+    shutil.rmtree(job_dir, ignore_errors=True)
+    
+    return {
+        "success": bool(results.get("success")),
+        "seconds": elapsed,
+        "first_summary_delta_seconds": first_delta[0] if first_delta else None,
+        "error": results.get("error")
+    }
+
+def fetch_server_stats(base_url):
+    """서버의 /stats 응답 (가짜 서버가 아니면 None)"""
+    root = base_url.rstrip("/")
+    if root.endswith("/v1"):
+        root = root[:-3]
+    try:
+        with urllib.request.urlopen(f"{root}/stats", timeout=5) as response:
+            return json.load(response)
+    except (OSError, ValueError):
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 OpenAI 호환 서버를 대상으로 한 파이프라인 부하 테스트")
+    parser.add_argument("inputs", nargs="*", help="입력 오디오 파일 (없으면 합성 음성 생성)")
+    parser.add_argument("--jobs", type=int, default=20, help="실행할 작업 수 (기본값: 20)")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 실행할 작업 수 (기본값: 4)")
+    parser.add_argument("--minutes", type=float, default=5, help="합성 입력 길이 (분, 기본값: 5)")
+    parser.add_argument("--summary-types", nargs="+", choices=["paragraph", "timestamped"],
+                        default=["paragraph", "timestamped"], help="요약 유형")
+    parser.add_argument("--base-url", help=f"서버 주소 (기본값: 환경 변수 {BASE_URL_ENV})")
+    parser.add_argument("--serve", action="store_true", help="가짜 서버를 같은 프로세스에서 실행")
+    parser.add_argument("--max-retries", type=int, default=5, help="API 클라이언트 최대 재시도 횟수")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본값: 표준 출력)")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    
+    if args.jobs < 1 or args.concurrency < 1:
+        parser.error("--jobs와 --concurrency는 1 이상이어야 합니다.")
+    
+    server = None
+    if args.serve:
+        try:
+            server = create_server("127.0.0.1", 0, **server_options(args))
+        except argparse.ArgumentTypeError as e:
+            parser.error(str(e))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    else:
+        base_url = args.base_url or os.getenv(BASE_URL_ENV)
+        if not base_url:
+            parser.error(f"--serve, --base-url 또는 환경 변수 {BASE_URL_ENV} 중 하나가 필요합니다.")
+    
+    api = OpenAIAPI(api_key="load-test", base_url=base_url, max_retries=args.max_retries)
+    
+    # 표준 출력에는 JSON 결과만 남도록 파이프라인의 print 출력은 표준 에러로 보냄
+    with tempfile.TemporaryDirectory() as work_dir, redirect_stdout(sys.stderr):
+        inputs = args.inputs or [generate_speech_like(args.minutes, work_dir)]
+        print(f"부하 테스트: {args.jobs}개 작업, 동시 {args.concurrency}개, 서버 {base_url}", file=sys.stderr)
+        
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            futures = [
+                executor.submit(run_job, index, inputs[index % len(inputs)], args.summary_types, api, work_dir)
+                for index in range(args.jobs)
+            ]
+            jobs = [future.result() for future in futures]
+        wall_time = time.perf_counter() - start
+    
+    api.close()
+    succeeded = [job for job in jobs if job["success"]]
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "base_url": base_url,
+        "arguments": vars(args),
+        "jobs": len(jobs),
+        "succeeded": len(succeeded),
+        "failed": len(jobs) - len(succeeded),
+        "errors": sorted({job["error"] for job in jobs if job["error"]}),
+        "wall_seconds": wall_time,
+        "throughput_jobs_per_minute": len(succeeded) / wall_time * 60 if wall_time else None,
+        "latency_seconds": describe([job["seconds"] for job in succeeded]),
+        "first_summary_delta_seconds": describe(
+            [job["first_summary_delta_seconds"] for job in succeeded if job["first_summary_delta_seconds"] is not None]
+        ),
+        "client_retries": api.http.retry_count,
+        "server": fetch_server_stats(base_url)
+    }
+    
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+    
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+        print(f"결과 저장: {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
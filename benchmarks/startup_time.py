@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+시작 시간(import time) 벤치마크
+
+`python -X importtime`으로 모듈을 불러오는 데 걸린 시간을 측정하여, 누적 시간이 큰
+모듈 목록과 함께 출력합니다. 시작 시점에 불러오면 안 되는 무거운 모듈(pydub, requests 등)이
+포함되어 있으면 종료 코드 1을 반환하므로 회귀 확인용으로 사용할 수 있습니다.
+
+사용 예:
+    python benchmarks/startup_time.py
+    python benchmarks/startup_time.py --module ui.main_window --top 30 --output startup.json
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 작업을 시작하기 전에는 불러오지 않아야 하는 모듈
+DEFAULT_FORBIDDEN = ["pydub", "requests", "openai"]
+
+# 예: "import time:       512 |       1830 |   utils.api"
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+def measure_imports(module):
+    """
+    별도 프로세스에서 모듈을 불러오며 -X importtime 출력을 수집합니다.
+    
+    Args:
+        module (str): 불러올 모듈 이름
+        
+    Returns:
+        list: {module, self_us, cumulative_us, depth} 목록
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} 불러오기 실패:\n{result.stderr.strip()[-2000:]}")
+    
+    imports = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            imports.append({
+                "module": match.group(4),
+                "self_us": int(match.group(1)),
+                "cumulative_us": int(match.group(2)),
+                "depth": (len(match.group(3)) - 1) // 2
+            })
+    return imports
+
+def main():
+    parser = argparse.ArgumentParser(description="모듈 import 시간 측정")
+    parser.add_argument("--module", action="append",
+                        help="측정할 모듈 (여러 번 지정 가능, 기본값: ui.main_window, utils.pipeline)")
+    parser.add_argument("--top", type=int, default=15, help="출력할 상위 모듈 수")
+    parser.add_argument("--forbid", nargs="*", default=DEFAULT_FORBIDDEN,
+                        help="시작 시 불러오면 안 되는 모듈 목록")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+    
+    modules = args.module or ["ui.main_window", "utils.pipeline"]
+    report = {}
+    violations = []
+    
+    for module in modules:
+        imports = measure_imports(module)
+        total_us = sum(item["self_us"] for item in imports)
+        loaded = {item["module"] for item in imports}
+        forbidden = sorted(
+            name for name in args.forbid
+            if name in loaded or any(item.startswith(f"{name}.") for item in loaded)
+        )
+        violations.extend(f"{module} -> {name}" for name in forbidden)
+        
+        top = sorted(imports, key=lambda item: item["cumulative_us"], reverse=True)[:args.top]
+        report[module] = {
+            "total_ms": round(total_us / 1000, 2),
+            "module_count": len(imports),
+            "forbidden_loaded": forbidden,
+            "top": top
+        }
+        
+        print(f"== {module}: {total_us / 1000:.1f}ms ({len(imports)}개 모듈)")
+        for item in top:
+            print(f"  {item['cumulative_us'] / 1000:>8.1f}ms  {'  ' * item['depth']}{item['module']}")
+        if forbidden:
+            print(f"  경고: 시작 시 불러오면 안 되는 모듈: {', '.join(forbidden)}")
+        print()
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    
+    if violations:
+        print("시작 시간 회귀: " + ", ".join(violations))
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,318 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+변환, 전사 결과 처리, 저장 경로의 벤치마크 모음
+
+네트워크 없이 실행됩니다. 입력 오디오는 ffmpeg로 말소리와 비슷한 합성 음성(음성 대역 잡음에 음절 단위
+강약과 쉬는 구간)을 만들어 사용하고, 파이프라인 측정에서는 OpenAI API 호출을 가짜 응답으로 대신합니다.
+결과는 커밋 간 비교할 수 있도록 JSON으로 저장합니다.
+
+측정 항목:
+    convert    AudioProcessor.convert_to_mp3 (시간, peak RSS, 출력 크기) - 입력 길이별
+    transcript format_timestamp, 타임스탬프 텍스트/SRT 생성, 요약용 분할, 시간 구간 검색 - 세그먼트 수 기준
+    storage    Storage 저장/불러오기 처리량 (JSON, 이진 .trx, SQLite)
+    pipeline   MeetingPipeline 전체 실행 (API는 가짜 응답)
+
+사용 예:
+    python benchmarks/suite.py --durations 5 60 240 --output bench.json
+    python benchmarks/suite.py --sections transcript storage --segments 50000
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import subprocess
+import tempfile
+from contextlib import redirect_stdout
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from convert_memory import measure
+from utils.api import OpenAIAPI, SUMMARY_CHUNK_MAX_TOKENS
+from utils.audio import AudioProcessor
+from utils.pipeline import MeetingPipeline
+from utils.storage import Storage
+from utils.sqlite_storage import SQLiteStorage
+from utils.transcript import Transcript, format_timestamp
+from utils.transcript_file import TranscriptFile, save_transcript_binary, load_transcript_binary
+from utils import render
+
+SECTIONS = ("convert", "transcript", "storage", "pipeline")
+
+# 합성 전사 결과의 세그먼트 길이 (초)와 무작위 시드 (실행마다 같은 입력을 사용)
+SEGMENT_SECONDS = 4.0
+RANDOM_SEED = 1234
+
+# 합성 세그먼트 텍스트에 사용할 단어
+WORDS = (
+    "예산 회의 결정 분기 계획 마케팅 개발 일정 출시 고객 리뷰 품질 채용 보안 서버 비용 "
+    "다음 주까지 검토 부탁드립니다 그렇게 진행하겠습니다 질문 있습니다 확인했습니다"
+).split()
+
+def generate_speech_like(duration_minutes, directory):
+    """
+    말소리와 비슷한 합성 음성 파일을 생성합니다.
+    
+    음성 대역(300~3400Hz)으로 거른 잡음에 초당 4번 정도의 음절 강약을 주고,
+    7초마다 1초씩 쉬는 구간을 넣은 스테레오 44.1kHz 128kbps MP3입니다.
+    
+    Args:
+        duration_minutes (float): 길이 (분)
+        directory (str): 파일을 만들 디렉토리
+    
+    Returns:
+        str: 생성된 파일 경로
+    """
+    path = os.path.join(directory, f"speech_{duration_minutes:g}m.mp3")
+    source = (
+        f"anoisesrc=d={duration_minutes * 60}:c=pink:r=44100:a=0.5:seed={RANDOM_SEED},"
+        "highpass=f=300,lowpass=f=3400,tremolo=f=4:d=0.9,"
+        "volume='if(lt(mod(t,7),1),0,1)':eval=frame"
+    )
+    subprocess.run(
+        ["ffmpeg", "-nostdin", "-loglevel", "error", "-y",
+         "-f", "lavfi", "-i", source, "-ac", "2", "-b:a", "128k", path],
+        check=True
+    )
+    return path
+
+def make_transcript(segment_count, seed=RANDOM_SEED):
+    """
+    합성 전사 결과를 만듭니다. (SEGMENT_SECONDS 간격의 세그먼트)
+    
+    Args:
+        segment_count (int): 세그먼트 수
+        seed (int): 무작위 시드
+    
+    Returns:
+        Transcript: 전사 결과
+    """
+    rng = random.Random(seed)
+    texts = [" " + " ".join(rng.choices(WORDS, k=rng.randint(5, 15))) for _ in range(segment_count)]
+    starts = [index * SEGMENT_SECONDS for index in range(segment_count)]
+    ends = [start + SEGMENT_SECONDS - 0.2 for start in starts]
+    return Transcript("".join(texts).strip(), starts, ends, texts)
+
+def best_of(repeat, function):
+    """
+    함수를 repeat번 실행하여 가장 짧은 실행 시간과 마지막 반환값을 반환합니다.
+    
+    Returns:
+        tuple: (최소 실행 시간(초), 반환값)
+    """
+    best = None
+    result = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+class StubOpenAIAPI(OpenAIAPI):
+    """
+    네트워크 없이 가짜 응답을 돌려주는 API 클라이언트
+    
+    청크 병렬 전사, 결과 병합, 요약 분할/통합, 캐시 처리는 실제 코드를 그대로 실행하고
+    HTTP 요청을 보내는 부분만 대신합니다.
+    """
+    
+    def __init__(self, transcribe_latency=0.0, summary_latency=0.0):
+        """
+        StubOpenAIAPI 초기화
+        
+        Args:
+            transcribe_latency (float): 전사 요청 하나의 가짜 응답 지연 (초)
+            summary_latency (float): 요약 요청 하나의 가짜 응답 지연 (초)
+        """
+        super().__init__(api_key="stub", max_retries=0)
+        self.transcribe_latency = transcribe_latency
+        self.summary_latency = summary_latency
+    
+    def transcribe_audio(self, audio_file_path, metrics=None):
+        start = time.perf_counter()
+        duration = AudioProcessor.get_duration(audio_file_path) or 60.0
+        time.sleep(self.transcribe_latency)
+        transcript = make_transcript(max(1, int(duration // SEGMENT_SECONDS)))
+        if metrics is not None:
+            metrics.record("upload", start, bytes=os.path.getsize(audio_file_path), segments=len(transcript))
+        return transcript
+    
+    def _create_chat_completion(self, model, messages, cache=None, on_delta=None, **params):
+        time.sleep(self.summary_latency)
+        content = f"- 요약 (입력 {len(messages[-1]['content'])}자, 모델 {model})"
+        if on_delta is not None:
+            on_delta(content)
+        return content
+
+def bench_convert(durations, work_dir):
+    """입력 길이별 convert_to_mp3 측정 (별도 프로세스)"""
+    results = []
+    for duration in durations:
+        input_path = generate_speech_like(duration, work_dir)
+        measurement = measure("single", input_path)
+        measurement.update({"duration_minutes": duration, "input_bytes": os.path.getsize(input_path)})
+        results.append(measurement)
+        os.remove(input_path)
+        print(json.dumps({"convert": measurement}, ensure_ascii=False), file=sys.stderr)
+    return results
+
+def bench_transcript(segment_count, repeat):
+    """전사 결과 처리 측정"""
+    build_seconds, transcript = best_of(repeat, lambda: make_transcript(segment_count))
+    duration = segment_count * SEGMENT_SECONDS
+    rng = random.Random(RANDOM_SEED)
+    windows = [(start, start + 300) for start in (rng.uniform(0, duration) for _ in range(1000))]
+    
+    cases = {
+        "build": build_seconds,
+        "format_timestamp": best_of(repeat, lambda: [format_timestamp(start) for start, _, _ in transcript.rows()])[0],
+        "timestamped_text": best_of(repeat, lambda: "".join(render.iter_timestamped_text(transcript)))[0],
+        "srt": best_of(repeat, lambda: "".join(render.iter_srt(transcript)))[0],
+        "split_for_summary": best_of(
+            repeat, lambda: OpenAIAPI.split_transcript_for_summary(transcript, SUMMARY_CHUNK_MAX_TOKENS)
+        )[0],
+        "slice_1000x5min": best_of(repeat, lambda: [transcript.slice(start, end) for start, end in windows])[0]
+    }
+    return {
+        "segments": segment_count,
+        "seconds": cases,
+        "segments_per_second": {
+            name: round(segment_count / seconds) for name, seconds in cases.items()
+            if seconds and not name.startswith("slice")
+        }
+    }
+
+def bench_storage(segment_count, repeat, work_dir):
+    """Storage 저장/불러오기 처리량 측정"""
+    transcript = make_transcript(segment_count)
+    results = {}
+    
+    def measure_backend(name, storage, load):
+        save_seconds, location = best_of(repeat, lambda: storage.save_transcription(transcript, meeting_id=name))
+        load_seconds, loaded = best_of(repeat, lambda: load(location))
+        # 마지막 연결을 닫으면 SQLite가 WAL 내용을 데이터베이스 파일에 반영(checkpoint)하므로 닫은 뒤 크기를 잼
+        storage.close()
+        if os.path.exists(location):
+            size = os.path.getsize(location)
+        else:
+            # checkpoint되지 않고 남은 WAL 파일이 있으면 함께 계산
+            size = sum(
+                os.path.getsize(path) for path in (storage.db_path, f"{storage.db_path}-wal") if os.path.exists(path)
+            )
+        results[name] = {
+            "save_seconds": save_seconds,
+            "load_seconds": load_seconds,
+            "bytes": size,
+            "save_segments_per_second": round(segment_count / save_seconds),
+            "load_segments_per_second": round(segment_count / load_seconds),
+            "loaded_segments": len(loaded)
+        }
+    
+    def load_json(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return Transcript.from_dict(json.load(f))
+    
+    measure_backend(
+        "json", Storage(os.path.join(work_dir, "json"), os.path.join(work_dir, "cache")), load_json
+    )
+    measure_backend(
+        "bin", Storage(os.path.join(work_dir, "bin"), os.path.join(work_dir, "cache"), transcript_format="bin"),
+        load_transcript_binary
+    )
+    sqlite_storage = SQLiteStorage(os.path.join(work_dir, "sqlite"), os.path.join(work_dir, "cache"))
+    measure_backend("sqlite", sqlite_storage, lambda location: sqlite_storage.load_transcript("sqlite"))
+    
+    # 이진 파일에서 5분 구간만 읽기 (메모리 매핑)
+    binary_path = os.path.join(work_dir, "slice.trx")
+    save_transcript_binary(transcript, binary_path, compress=True)
+    middle = segment_count * SEGMENT_SECONDS / 2
+    with TranscriptFile(binary_path) as transcript_file:
+        results["bin_slice_5min_seconds"] = best_of(repeat, lambda: transcript_file.slice(middle, middle + 300))[0]
+    
+    return {"segments": segment_count, "backends": results}
+
+def bench_pipeline(duration_minutes, work_dir):
+    """가짜 API로 MeetingPipeline 전체 실행 측정"""
+    input_path = generate_speech_like(duration_minutes, work_dir)
+    storage = Storage(os.path.join(work_dir, "pipeline_results"), os.path.join(work_dir, "pipeline_cache"))
+    api = StubOpenAIAPI()
+    pipeline = MeetingPipeline(input_path, ["paragraph", "timestamped"], api=api, storage=storage)
+    
+    start = time.perf_counter()
+    results = pipeline.run()
+    elapsed = time.perf_counter() - start
+    
+    storage.close()
+    os.remove(input_path)
+    return {
+        "duration_minutes": duration_minutes,
+        "seconds": elapsed,
+        "success": bool(results and results.get("success")),
+        "error": (results or {}).get("error")
+    }
+
+def git_revision():
+    """현재 커밋 (git이 없으면 None)"""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_DIR, capture_output=True, text=True
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+def main():
+    parser = argparse.ArgumentParser(description="변환/전사 결과/저장 경로 벤치마크 (오프라인)")
+    parser.add_argument("--sections", nargs="+", choices=SECTIONS, default=list(SECTIONS),
+                        help="실행할 측정 항목")
+    parser.add_argument("--durations", type=float, nargs="+", default=[5, 60, 240],
+                        help="변환 측정에 사용할 입력 길이 목록 (분)")
+    parser.add_argument("--segments", type=int, default=20000, help="전사 결과/저장 측정의 세그먼트 수")
+    parser.add_argument("--pipeline-minutes", type=float, default=5, help="파이프라인 측정 입력 길이 (분)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (가장 짧은 시간을 기록)")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본값: 표준 출력)")
+    args = parser.parse_args()
+    
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "arguments": vars(args),
+        "results": {}
+    }
+    
+    # 표준 출력에는 JSON 결과만 남도록 라이브러리의 print 출력은 표준 에러로 보냄
+    with tempfile.TemporaryDirectory() as work_dir, redirect_stdout(sys.stderr):
+        for section in args.sections:
+            print(f"측정 중: {section}", file=sys.stderr)
+            try:
+                if section == "convert":
+                    result = bench_convert(args.durations, work_dir)
+                elif section == "transcript":
+                    result = bench_transcript(args.segments, args.repeat)
+                elif section == "storage":
+                    result = bench_storage(args.segments, args.repeat, work_dir)
+                else:
+                    result = bench_pipeline(args.pipeline_minutes, work_dir)
+            except (OSError, subprocess.CalledProcessError) as e:
+                # ffmpeg가 없는 환경 등에서는 해당 항목만 오류로 기록
+                result = {"error": str(e)}
+            report["results"][section] = result
+    
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+        print(f"결과 저장: {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,12 @@ import sys
 import os
 import atexit
 import tempfile
-from dotenv import load_dotenv
 from PyQt6.QtWidgets import QApplication, QMessageBox
 
-# API 키 설정을 가장 먼저 로드하여 import 순서 문제 방지
-load_dotenv()
-api_key = os.getenv("OPENAI_API_KEY")
+from utils.environment import load_environment, has_ffmpeg
+
+# API 키 설정을 가장 먼저 로드하여 import 순서 문제 방지 (결과는 캐시되어 다시 로드하지 않음)
+api_key = load_environment()
 if not api_key:
     print("경고: OPENAI_API_KEY가 설정되지 않았습니다. .env 파일에 API 키를 설정해주세요.")
     print(".env.example 파일을 .env로 복사하고 API 키를 입력하세요.")
@@ -30,9 +30,8 @@ def check_environment():
     results_dir = os.path.join(os.getcwd(), 'results')
     os.makedirs(results_dir, exist_ok=True)
     
-    # ffmpeg 확인
-    ffmpeg_path = os.path.join(os.getcwd(), "ffmpeg.exe")
-    if not os.path.exists(ffmpeg_path):
+    # ffmpeg 확인 (결과는 캐시되어 MainWindow와 오디오 처리에서 재사용)
+    if not has_ffmpeg():
         print("경고: ffmpeg.exe를 찾을 수 없습니다. 프로그램 실행에 필요합니다.")
         print("ffmpeg.exe를 프로그램 폴더에 복사하세요.")
         
@@ -0,0 +1,48 @@
+import asyncio
+import threading
+
+from utils.api import OpenAIAPI
+from utils.circuit_breaker import ModelCircuitBreaker
+
+class RecordingAPI(OpenAIAPI):
+    """동기 메서드 대신 받은 인자와 실행 스레드를 기록하는 API"""
+    
+    def __init__(self):
+        super().__init__(api_key="test", max_retries=0, circuit_breaker=ModelCircuitBreaker())
+        self.calls = []
+    
+    def transcribe_audio(self, *args, **kwargs):
+        self.calls.append(("transcribe_audio", args, kwargs, threading.get_ident()))
+        return "transcript"
+    
+    def transcribe_chunks(self, *args, **kwargs):
+        self.calls.append(("transcribe_chunks", args, kwargs, threading.get_ident()))
+        return "transcript"
+    
+    def summarize_text(self, *args, **kwargs):
+        self.calls.append(("summarize_text", args, kwargs, threading.get_ident()))
+        return "summary"
+
+def test_async_wrappers_pass_all_arguments():
+    api = RecordingAPI()
+    metrics = object()
+    stop_check = lambda: False
+    on_delta = lambda delta: None
+    
+    async def run():
+        return await asyncio.gather(
+            api.atranscribe_audio("chunk.mp3", metrics=metrics),
+            api.atranscribe_chunks([("chunk.mp3", 0.0)], 2, stop_check=stop_check, metrics=metrics),
+            api.asummarize_text("회의 내용", cache=None, max_chunk_tokens=100, max_workers=1, on_delta=on_delta)
+        )
+    
+    assert asyncio.run(run()) == ["transcript", "transcript", "summary"]
+    calls = {name: (args, kwargs) for name, args, kwargs, _ in api.calls}
+    assert calls["transcribe_audio"] == (("chunk.mp3",), {"metrics": metrics})
+    assert calls["transcribe_chunks"] == (([("chunk.mp3", 0.0)], 2), {"stop_check": stop_check, "metrics": metrics})
+    assert calls["summarize_text"] == (
+        ("회의 내용",), {"cache": None, "max_chunk_tokens": 100, "max_workers": 1, "on_delta": on_delta}
+    )
+    # 이벤트 루프를 막지 않도록 동기 메서드는 다른 스레드에서 실행
+    assert all(thread_id != threading.get_ident() for *_, thread_id in api.calls)
+    api.close()
@@ -0,0 +1,133 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from utils.checkpoint import JobCheckpoint, JobInProgressError
+
+def test_stage_results_round_trip(tmp_path):
+    checkpoint = JobCheckpoint(str(tmp_path / "jobs" / "abc123"))
+    assert checkpoint.job_id == "abc123"
+    assert checkpoint.load_json("transcription") is None
+    assert checkpoint.load_text("summary_paragraph") is None
+    
+    checkpoint.save_json("transcription", {"text": "안녕하세요", "segments": []})
+    checkpoint.save_text("summary_paragraph", "요약입니다.")
+    
+    # 다른 객체로 다시 열어도 완료된 단계를 읽음 (작업 재개)
+    resumed = JobCheckpoint(checkpoint.job_dir)
+    assert resumed.load_json("transcription") == {"text": "안녕하세요", "segments": []}
+    assert resumed.load_text("summary_paragraph") == "요약입니다."
+    assert not [name for name in os.listdir(checkpoint.job_dir) if name.endswith(".tmp")]
+
+def test_corrupt_json_counts_as_incomplete(tmp_path):
+    checkpoint = JobCheckpoint(str(tmp_path / "job"))
+    with open(os.path.join(checkpoint.job_dir, "transcription.json"), 'w', encoding='utf-8') as f:
+        f.write('{"text": ')
+    assert checkpoint.load_json("transcription") is None
+
+def test_chunks_manifest_round_trip(tmp_path):
+    checkpoint = JobCheckpoint(str(tmp_path / "job"))
+    audio_dir = checkpoint.prepare_audio_dir()
+    chunk_path = os.path.join(audio_dir, "chunk_000.mp3")
+    with open(chunk_path, 'wb') as f:
+        f.write(b"mp3")
+    original = tmp_path / "meeting.m4a"
+    original.write_bytes(b"m4a")
+    
+    checkpoint.save_chunks([(chunk_path, 0.0), (str(original), 600.0)], timeline=[[0, 0], [1000, 4000]])
+    
+    resumed = JobCheckpoint(checkpoint.job_dir)
+    chunks = resumed.load_chunks()
+    assert [(os.path.normpath(path), offset) for path, offset in chunks] == [
+        (os.path.normpath(chunk_path), 0.0),
+        (os.path.normpath(str(original)), 600.0)
+    ]
+    assert resumed.load_timeline() == [[0, 0], [1000, 4000]]
+    # 작업 디렉토리 안의 청크는 상대 경로로 기록하여 폴더를 옮겨도 이어서 실행할 수 있음
+    assert resumed.load_json("converted")["chunks"][0]["file"] == os.path.join("audio", "chunk_000.mp3")
+
+def test_missing_chunk_invalidates_conversion(tmp_path):
+    checkpoint = JobCheckpoint(str(tmp_path / "job"))
+    audio_dir = checkpoint.prepare_audio_dir()
+    chunk_path = os.path.join(audio_dir, "chunk_000.mp3")
+    checkpoint.save_chunks([(chunk_path, 0.0)])
+    assert checkpoint.load_chunks() is None
+
+def test_remove_audio_and_remove(tmp_path):
+    checkpoint = JobCheckpoint(str(tmp_path / "job"))
+    audio_dir = checkpoint.prepare_audio_dir()
+    chunk_path = os.path.join(audio_dir, "chunk_000.mp3")
+    with open(chunk_path, 'wb') as f:
+        f.write(b"mp3")
+    checkpoint.save_chunks([(chunk_path, 0.0)])
+    checkpoint.save_text("summary_paragraph", "요약")
+    
+    checkpoint.remove_audio()
+    assert not os.path.exists(audio_dir)
+    assert checkpoint.load_chunks() is None
+    assert checkpoint.load_text("summary_paragraph") == "요약"
+    
+    checkpoint.remove()
+    assert not os.path.exists(checkpoint.job_dir)
+
+def test_concurrent_run_is_rejected(tmp_path):
+    first = JobCheckpoint(str(tmp_path / "job"))
+    second = JobCheckpoint(first.job_dir)
+    first.acquire()
+    with pytest.raises(JobInProgressError):
+        second.acquire()
+    
+    # 잠그지 못한 쪽의 해제는 다른 실행의 잠금을 지우지 않음
+    second.release()
+    assert os.path.exists(first.lock_path)
+    
+    first.release()
+    assert not os.path.exists(first.lock_path)
+    second.acquire()
+    second.remove()
+    assert not os.path.exists(second.job_dir)
+    second.release()
+
+def test_stale_lock_is_taken_over(tmp_path):
+    checkpoint = JobCheckpoint(str(tmp_path / "job"))
+    # 이미 종료된 프로세스가 남긴 잠금
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    with open(checkpoint.lock_path, 'w', encoding='utf-8') as f:
+        f.write(f"{process.pid}:stale")
+    
+    checkpoint.acquire()
+    with open(checkpoint.lock_path, 'r', encoding='utf-8') as f:
+        assert f.read().startswith(f"{os.getpid()}:")
+    checkpoint.release()
+
+def test_job_id_depends_on_options():
+    from utils.pipeline import MeetingPipeline
+    
+    def job_id(summary_types, remove_silence=False):
+        pipeline = MeetingPipeline("meeting.m4a", summary_types, api=object(), storage=object(),
+                                   remove_silence=remove_silence)
+        return pipeline._job_id("a" * 64)
+    
+    assert job_id(["paragraph", "timestamped"]) == job_id(["timestamped", "paragraph"])
+    assert job_id(["paragraph"]) != job_id(["paragraph", "timestamped"])
+    assert job_id(["paragraph"]) != job_id(["paragraph"], remove_silence=True)
+
+def test_run_id_is_unique_per_run_and_kept_on_resume(tmp_path):
+    from utils.pipeline import MeetingPipeline
+    
+    pipeline = MeetingPipeline("meeting.m4a", ["paragraph"], api=object(), storage=object())
+    pipeline.checkpoint = JobCheckpoint(str(tmp_path / "jobs" / "abc123"))
+    run_id = pipeline._run_id()
+    assert run_id.startswith("abc123_")
+    
+    # 중단 후 이어서 실행하면 같은 ID로 저장
+    pipeline.checkpoint = JobCheckpoint(pipeline.checkpoint.job_dir)
+    assert pipeline._run_id() == run_id
+    
+    # 작업이 끝나 체크포인트가 삭제된 뒤 같은 파일을 다시 처리하면 새 ID
+    pipeline.checkpoint.remove()
+    pipeline.checkpoint = JobCheckpoint(pipeline.checkpoint.job_dir)
+    assert pipeline._run_id() != run_id
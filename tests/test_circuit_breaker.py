@@ -0,0 +1,150 @@
+import types
+
+import pytest
+
+from utils import circuit_breaker
+from utils.api import OpenAIAPI, APIError, SUMMARY_MODEL, SUMMARY_FALLBACK_MODEL
+from utils.circuit_breaker import ModelCircuitBreaker
+
+class FakeClock:
+    """monotonic()을 직접 진행시키는 시계"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def monotonic(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker, "time", types.SimpleNamespace(monotonic=fake.monotonic))
+    return fake
+
+class ScriptedAPI(OpenAIAPI):
+    """모델별로 정해 둔 결과를 돌려주는 요약 클라이언트 (네트워크 사용 안 함)"""
+    
+    def __init__(self, breaker, outcomes):
+        super().__init__(api_key="test", circuit_breaker=breaker)
+        self.outcomes = outcomes
+        self.calls = []
+    
+    def _create_chat_completion(self, model, messages, cache=None, on_delta=None, **params):
+        self.calls.append(model)
+        outcome = self.outcomes[model]
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = ModelCircuitBreaker(failure_threshold=2, cooldown=60)
+    assert breaker.record_failure("m") is False
+    assert breaker.allow("m")
+    assert breaker.record_failure("m") is True
+    assert breaker.is_open("m")
+    assert not breaker.allow("m")
+
+def test_success_resets_failure_count(clock):
+    breaker = ModelCircuitBreaker(failure_threshold=2, cooldown=60)
+    breaker.record_failure("m")
+    breaker.record_success("m")
+    assert breaker.record_failure("m") is False
+    assert not breaker.is_open("m")
+
+def test_trip_opens_immediately(clock):
+    breaker = ModelCircuitBreaker(failure_threshold=5, cooldown=60)
+    assert breaker.record_failure("m", trip=True) is True
+    assert breaker.is_open("m")
+    assert not breaker.is_open("other")
+
+def test_half_open_allows_single_probe(clock):
+    breaker = ModelCircuitBreaker(cooldown=60)
+    breaker.record_failure("m", trip=True)
+    clock.now += 61
+    assert not breaker.is_open("m")
+    assert breaker.allow("m")
+    # 시험 요청이 끝나기 전에는 다른 요청을 막음
+    assert not breaker.allow("m")
+    assert breaker.is_open("m")
+    
+    breaker.record_success("m")
+    assert breaker.allow("m")
+    assert breaker.allow("m")
+
+def test_failed_probe_reopens(clock):
+    breaker = ModelCircuitBreaker(failure_threshold=3, cooldown=60)
+    breaker.record_failure("m", trip=True)
+    clock.now += 61
+    assert breaker.allow("m")
+    assert breaker.record_failure("m") is True
+    assert not breaker.allow("m")
+    clock.now += 61
+    assert breaker.allow("m")
+
+def test_released_probe_can_be_retried(clock):
+    breaker = ModelCircuitBreaker(cooldown=60)
+    breaker.record_failure("m", trip=True)
+    clock.now += 61
+    assert breaker.allow("m")
+    breaker.release("m")
+    assert breaker.allow("m")
+
+def test_unresolved_probe_expires(clock):
+    breaker = ModelCircuitBreaker(cooldown=60)
+    breaker.record_failure("m", trip=True)
+    clock.now += 61
+    assert breaker.allow("m")
+    clock.now += 30
+    assert not breaker.allow("m")
+    clock.now += 31
+    assert breaker.allow("m")
+
+def test_unavailable_model_routes_to_fallback(clock):
+    breaker = ModelCircuitBreaker(cooldown=60)
+    api = ScriptedAPI(breaker, {
+        SUMMARY_MODEL: APIError("HTTP 404: model not found", status_code=404),
+        SUMMARY_FALLBACK_MODEL: "fallback summary"
+    })
+    assert api.summarize_text("회의 내용입니다.") == "fallback summary"
+    assert api.summarize_text("회의 내용입니다.") == "fallback summary"
+    # 두 번째 작업은 열린 모델에 요청하지 않고 바로 대체 모델로 보냄
+    assert api.calls == [SUMMARY_MODEL, SUMMARY_FALLBACK_MODEL, SUMMARY_FALLBACK_MODEL]
+
+def test_transient_error_does_not_switch_model(clock):
+    breaker = ModelCircuitBreaker(cooldown=60)
+    api = ScriptedAPI(breaker, {
+        SUMMARY_MODEL: APIError("HTTP 503: busy", status_code=503, retryable=True),
+        SUMMARY_FALLBACK_MODEL: "fallback summary"
+    })
+    with pytest.raises(APIError):
+        api.summarize_text("회의 내용입니다.")
+    assert api.calls == [SUMMARY_MODEL]
+    assert not breaker.is_open(SUMMARY_MODEL)
+
+@pytest.mark.parametrize("probe_error", [
+    APIError("HTTP 400: bad request", status_code=400),
+    KeyError("choices")
+])
+def test_probe_error_unrelated_to_model_is_retried_later(clock, probe_error):
+    breaker = ModelCircuitBreaker(cooldown=60)
+    api = ScriptedAPI(breaker, {
+        SUMMARY_MODEL: APIError("HTTP 404: model not found", status_code=404),
+        SUMMARY_FALLBACK_MODEL: "fallback summary"
+    })
+    api.summarize_text("회의 내용입니다.")
+    assert breaker.is_open(SUMMARY_MODEL)
+    
+    # cooldown 후 시험 요청이 모델과 관계없는 오류로 끝남
+    clock.now += 61
+    api.outcomes[SUMMARY_MODEL] = probe_error
+    try:
+        api.summarize_text("회의 내용입니다.")
+    except KeyError:
+        pass
+    
+    # 시험 요청 예약이 풀려 다음 작업에서 다시 기본 모델을 시도함
+    api.outcomes[SUMMARY_MODEL] = "primary summary"
+    api.calls.clear()
+    assert api.summarize_text("회의 내용입니다.") == "primary summary"
+    assert api.calls == [SUMMARY_MODEL]
+    assert not breaker.is_open(SUMMARY_MODEL)
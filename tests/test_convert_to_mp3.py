@@ -0,0 +1,23 @@
+import os
+import tempfile
+
+import pytest
+
+from utils.audio import AudioProcessor, MP3_BITRATES_KBPS
+
+def test_plan_encoding_reports_max_duration_only_when_too_long():
+    assert AudioProcessor.plan_encoding(600) == (MP3_BITRATES_KBPS[-1], None)
+    
+    bitrate_kbps, max_duration = AudioProcessor.plan_encoding(10 * 3600.0)
+    assert bitrate_kbps == MP3_BITRATES_KBPS[0]
+    assert 0 < max_duration < 10 * 3600.0
+
+def test_too_long_input_is_rejected_instead_of_truncated(monkeypatch, tmp_path):
+    # 최저 비트레이트로도 25MB를 넘는 길이 (10시간)
+    monkeypatch.setattr(AudioProcessor, "get_duration", staticmethod(lambda path: 10 * 3600.0))
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    
+    with pytest.raises(ValueError, match="convert_to_mp3_chunks"):
+        AudioProcessor.convert_to_mp3(str(tmp_path / "meeting.m4a"))
+    # 만들어 둔 임시 파일도 남기지 않음
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,125 @@
+import json
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+from utils import http_client
+from utils.http_client import HTTPClient, APIError
+
+def make_response(status_code, body=None, headers=None):
+    """네트워크 없이 만든 requests 응답"""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = json.dumps(body if body is not None else {}).encode("utf-8")
+    return response
+
+class ScriptedSession:
+    """정해 둔 응답(또는 예외)을 차례로 돌려주는 세션"""
+    
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+    
+    def request(self, method, url, timeout=None, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+    
+    def close(self):
+        pass
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(http_client.time, "sleep", delays.append)
+    return delays
+
+def make_client(outcomes, **options):
+    client = HTTPClient("http://api.test/v1", **options)
+    client.session = ScriptedSession(outcomes)
+    return client
+
+def test_retries_server_errors_with_backoff(sleeps):
+    client = make_client(
+        [make_response(503), make_response(502), make_response(200, {"ok": True})],
+        max_retries=3, backoff_base=1.0, backoff_max=30.0
+    )
+    response = client.request("GET", "/models")
+    assert response.json() == {"ok": True}
+    assert client.retry_count == 2
+    assert len(sleeps) == 2
+    # full jitter: 0 ~ backoff_base * 2^attempt
+    assert 0 <= sleeps[0] <= 1.0
+    assert 0 <= sleeps[1] <= 2.0
+
+def test_retries_connection_errors(sleeps):
+    client = make_client([requests.ConnectionError("reset"), make_response(200)], max_retries=1)
+    assert client.request("GET", "/models").status_code == 200
+    assert client.retry_count == 1
+
+def test_gives_up_after_max_retries(sleeps):
+    client = make_client([make_response(429)] * 3, max_retries=2)
+    with pytest.raises(APIError) as error:
+        client.request("POST", "/chat/completions")
+    assert error.value.status_code == 429
+    assert error.value.retryable
+    assert client.session.calls == 3
+
+def test_does_not_retry_client_errors(sleeps):
+    client = make_client([make_response(400, {"error": {"message": "bad request"}})])
+    with pytest.raises(APIError) as error:
+        client.request("POST", "/chat/completions")
+    assert error.value.status_code == 400
+    assert not error.value.retryable
+    assert "bad request" in str(error.value)
+    assert sleeps == []
+
+def test_honours_retry_after_beyond_backoff_max(sleeps):
+    client = make_client(
+        [make_response(429, headers={"Retry-After": "45"}), make_response(200)],
+        backoff_max=30.0, retry_after_max=120.0
+    )
+    client.request("GET", "/models")
+    assert sleeps == [45.0]
+
+def test_honours_retry_after_ms(sleeps):
+    client = make_client([make_response(429, headers={"retry-after-ms": "1500"}), make_response(200)])
+    client.request("GET", "/models")
+    assert sleeps == [1.5]
+
+def test_honours_retry_after_http_date(sleeps):
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+    client = make_client([make_response(503, headers={"Retry-After": format_datetime(retry_at, usegmt=True)}),
+                          make_response(200)])
+    client.request("GET", "/models")
+    assert len(sleeps) == 1
+    assert 55 <= sleeps[0] <= 60
+
+def test_fails_fast_when_retry_after_exceeds_ceiling(sleeps):
+    client = make_client([make_response(429, headers={"Retry-After": "600"}), make_response(200)],
+                         retry_after_max=120.0)
+    with pytest.raises(APIError) as error:
+        client.request("GET", "/models")
+    assert error.value.status_code == 429
+    assert sleeps == []
+    assert client.session.calls == 1
+
+def test_iter_events_reads_data_until_done():
+    class StreamResponse:
+        closed = False
+        
+        def iter_lines(self, chunk_size=None, decode_unicode=False):
+            return iter([": keep-alive", 'data: {"n": 1}', "", 'data: {"n": 2}', "data: [DONE]", 'data: {"n": 3}'])
+        
+        def close(self):
+            self.closed = True
+    
+    client = make_client([])
+    response = StreamResponse()
+    assert [event["n"] for event in client.iter_events(response)] == [1, 2]
+    assert response.closed
@@ -0,0 +1,48 @@
+import os
+
+from utils.metrics import JobMetrics
+from utils.storage import Storage
+
+def finished_metrics(job_id):
+    metrics = JobMetrics(job_id, "meeting.mp3")
+    with metrics.span("upload", bytes=1024) as counters:
+        counters["segments"] = 3
+    metrics.record("summary", 0.0, seconds=1.5, kind="paragraph")
+    metrics.finish("success")
+    return metrics
+
+def test_stages_sum_spans_and_counters():
+    metrics = JobMetrics("job")
+    metrics.record("upload", 0.0, seconds=1.0, bytes=10)
+    metrics.record("upload", 0.0, seconds=2.0, bytes=20)
+    (stage,) = metrics.stages()
+    assert stage["count"] == 2
+    assert stage["seconds"] == 3.0
+    assert stage["counters"] == {"bytes": 30}
+
+def test_prometheus_text_has_job_label():
+    text = finished_metrics("abc123").to_prometheus()
+    assert 'meeting_summary_stage_seconds{job_id="abc123",source="meeting.mp3",stage="summary",kind="paragraph"} 1.5' in text
+    assert 'meeting_summary_stage_segments{job_id="abc123",source="meeting.mp3",stage="upload",kind=""} 3' in text
+    assert text.endswith("\n")
+
+def test_round_trips_through_dict():
+    metrics = finished_metrics("abc123")
+    restored = JobMetrics.from_dict(metrics.to_dict())
+    assert restored.stages() == metrics.stages()
+    assert restored.to_prometheus() == metrics.to_prometheus()
+
+def test_prometheus_files_are_written_per_job(tmp_path):
+    storage = Storage(str(tmp_path / "results"), str(tmp_path / "cache"))
+    try:
+        storage.save_metrics(finished_metrics("job_a"), prometheus=True)
+        storage.save_metrics(finished_metrics("job_b"), prometheus=True)
+        anonymous_json = storage.save_metrics(finished_metrics(None), file_name="metrics_anonymous.json", prometheus=True)
+    finally:
+        storage.close()
+    
+    results_dir = tmp_path / "results"
+    assert os.path.basename(anonymous_json) == "metrics_anonymous.json"
+    prom_files = sorted(path.name for path in results_dir.glob("*.prom"))
+    assert prom_files == ["metrics_anonymous.prom", "metrics_job_a.prom", "metrics_job_b.prom"]
+    assert 'job_id="job_a"' in (results_dir / "metrics_job_a.prom").read_text(encoding="utf-8")
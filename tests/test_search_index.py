@@ -0,0 +1,72 @@
+import os
+import json
+
+import pytest
+
+from utils.search_index import SearchIndex, make_match_query
+from utils.transcript import Transcript
+
+@pytest.fixture
+def index(tmp_path):
+    search_index = SearchIndex(str(tmp_path / "search.db"))
+    yield search_index
+    search_index.close()
+
+def meeting_transcript():
+    return Transcript(
+        "예산 회의를 시작하겠습니다. 다음 분기 채용 계획을 논의합니다.",
+        starts=[0.0, 65.0],
+        ends=[4.0, 70.0],
+        texts=[" 예산 회의를 시작하겠습니다.", " 다음 분기 채용 계획을 논의합니다."]
+    )
+
+def test_match_query_quotes_terms():
+    assert make_match_query('회의 "예산') == '"회의"* """예산"*'
+    assert make_match_query("   ") == ""
+
+def test_finds_segments_by_prefix(index):
+    index.add_transcript("/results/a.json", meeting_transcript(), "meeting_a", "a.m4a", mtime=1.0)
+    (result,) = index.search("채용 계획")
+    assert result["meeting_id"] == "meeting_a"
+    assert result["title"] == "a.m4a"
+    assert result["kind"] == "transcription"
+    assert (result["start"], result["end"]) == (65.0, 70.0)
+    assert "[채용]" in result["snippet"]
+    # 단어 앞부분만 입력해도 찾음
+    assert [result["start"] for result in index.search("예산 회의")] == [0.0]
+
+def test_summary_paragraph_timestamps(index):
+    summary = "00:01:05 - 채용 계획 논의\n\n결정: 다음 분기에 두 명 채용"
+    index.add_summary("/results/s.txt", summary, "timestamped", "meeting_a", mtime=1.0)
+    assert [result["start"] for result in index.search("채용")] == [None, 65.0]
+
+def test_reindexing_replaces_document(index):
+    index.add_transcript("/results/a.json", meeting_transcript(), "meeting_a", mtime=1.0)
+    index.add_transcript("/results/a.json", Transcript("새 내용", [0.0], [1.0], ["새 내용"]), "meeting_a", mtime=2.0)
+    assert index.search("채용") == []
+    assert len(index.search("새")) == 1
+    assert index.stats() == {"meetings": 1, "documents": 1, "entries": 1}
+
+def test_sync_directory_indexes_new_changed_and_removed_files(tmp_path, index):
+    results_dir = tmp_path / "results"
+    results_dir.mkdir()
+    transcript_path = results_dir / "transcription_20250101_120000.json"
+    transcript_path.write_text(json.dumps(meeting_transcript().to_dict(), ensure_ascii=False), encoding="utf-8")
+    summary_path = results_dir / "summary_paragraph_20250101_120000.txt"
+    summary_path.write_text("예산은 동결하기로 했습니다.", encoding="utf-8")
+    (results_dir / "meeting_summary_20250101_120000.txt").write_text("중복 내용 예산", encoding="utf-8")
+    
+    assert index.sync_directory(str(results_dir)) == 2
+    assert {result["meeting_id"] for result in index.search("예산")} == {"20250101_120000"}
+    assert len(index.search("예산")) == 2
+    # 바뀌지 않은 파일은 다시 색인하지 않음
+    assert index.sync_directory(str(results_dir)) == 0
+    
+    summary_path.write_text("예산은 증액하기로 했습니다.", encoding="utf-8")
+    os.utime(summary_path, (1, 1))
+    assert index.sync_directory(str(results_dir)) == 1
+    assert len(index.search("증액")) == 1
+    
+    os.remove(transcript_path)
+    index.sync_directory(str(results_dir))
+    assert [result["kind"] for result in index.search("예산")] == ["summary_paragraph"]
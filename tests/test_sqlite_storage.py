@@ -0,0 +1,107 @@
+import os
+import json
+import threading
+
+import pytest
+
+from utils.sqlite_storage import SQLiteStorage
+from utils.transcript import Transcript
+
+@pytest.fixture
+def storage(tmp_path):
+    sqlite_storage = SQLiteStorage(str(tmp_path / "results"), str(tmp_path / "cache"))
+    yield sqlite_storage
+    sqlite_storage.close()
+
+def make_transcript(label, count=3):
+    texts = [f" {label} 발언 {index}" for index in range(count)]
+    return Transcript(
+        "".join(texts).strip(),
+        starts=[index * 5.0 for index in range(count)],
+        ends=[index * 5.0 + 4.0 for index in range(count)],
+        texts=texts
+    )
+
+def test_transcript_and_summaries_round_trip(storage):
+    transcript = make_transcript("예산")
+    location = storage.save_transcription(transcript, meeting_id="job1", title="meeting.m4a")
+    storage.save_summary("문단별 요약", "paragraph", meeting_id="job1")
+    storage.save_summary("00:00:00 시간대별 요약", "timestamped", meeting_id="job1")
+    
+    assert location == f"{storage.db_path}#job1/transcription"
+    loaded = storage.load_transcript("job1")
+    assert loaded.text == transcript.text
+    assert list(loaded.rows()) == list(transcript.rows())
+    assert storage.load_summary("job1", "paragraph") == "문단별 요약"
+    assert storage.load_transcript("missing") is None
+    assert storage.load_summary("job1", "missing") is None
+    
+    job = storage.get_job("job1")
+    assert job["source_name"] == "meeting.m4a"
+    assert job["segment_count"] == 3
+    assert job["summary_types"] == ["paragraph", "timestamped"]
+
+def test_saving_again_replaces_segments(storage):
+    storage.save_transcription(make_transcript("처음", count=5), meeting_id="job1")
+    storage.save_transcription(make_transcript("다시", count=2), meeting_id="job1")
+    loaded = storage.load_transcript("job1")
+    assert len(loaded) == 2
+    assert loaded.segment_text(0) == " 다시 발언 0"
+    assert storage.get_job("job1")["segment_count"] == 2
+
+def test_record_job_updates_only_given_fields(storage):
+    storage.record_job("job1", source_file="/audio/meeting.m4a", duration=120.5, transcription_model="whisper-1")
+    storage.record_job("job1", summary_model="o3-mini", timings={"upload": 3.2, "total": 10.0})
+    
+    job = storage.get_job("job1")
+    assert job["source_file"] == "/audio/meeting.m4a"
+    assert job["source_name"] == "meeting.m4a"
+    assert job["duration"] == 120.5
+    assert job["transcription_model"] == "whisper-1"
+    assert job["summary_model"] == "o3-mini"
+    assert job["timings"] == {"upload": 3.2, "total": 10.0}
+    assert [job["job_id"] for job in storage.list_jobs(source_name="meeting")] == ["job1"]
+    assert storage.list_jobs(source_name="other") == []
+
+def test_concurrent_jobs_from_threads(storage):
+    errors = []
+    
+    def run_job(index):
+        try:
+            job_id = f"job{index}"
+            storage.save_transcription(make_transcript(f"작업{index}", count=20), meeting_id=job_id)
+            storage.save_summary(f"요약 {index}", "paragraph", meeting_id=job_id)
+            storage.record_job(job_id, duration=float(index), timings={"total": float(index)})
+            # 다른 작업이 쓰는 중에도 읽기가 막히지 않음 (WAL)
+            assert storage.load_transcript(job_id) is not None
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=run_job, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert errors == []
+    jobs = {job["job_id"]: job for job in storage.list_jobs()}
+    assert len(jobs) == 8
+    assert all(job["segment_count"] == 20 and job["summary_types"] == ["paragraph"] for job in jobs.values())
+    assert len(storage.search_index.search("발언")) == 100
+    assert len(storage.search_index.search("작업3")) == 20
+
+def test_export_job_writes_result_files(storage):
+    storage.save_transcription(make_transcript("예산"), meeting_id="job1")
+    storage.save_summary("문단별 요약", "paragraph", meeting_id="job1")
+    
+    paths = storage.export_job("job1")
+    names = sorted(os.path.basename(path).split("_")[0] for path in paths)
+    assert names == ["meeting", "summary", "transcription"]
+    transcription_path = next(path for path in paths if os.path.basename(path).startswith("transcription_"))
+    with open(transcription_path, 'r', encoding='utf-8') as f:
+        assert Transcript.from_dict(json.load(f)).text == "예산 발언 0 예산 발언 1 예산 발언 2"
+    
+    # 내보낸 파일은 결과 폴더 바로 아래가 아니므로 데이터베이스 결과와 중복으로 색인되지 않음
+    assert all(os.path.dirname(path) == os.path.join(storage.base_dir, "exports", "job1") for path in paths)
+    assert storage.sync_search_index() == 0
+    assert len(storage.search("예산")) == 3
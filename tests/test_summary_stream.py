@@ -0,0 +1,89 @@
+import json
+
+import pytest
+import requests
+
+from utils.api import OpenAIAPI, SUMMARY_MODEL, SUMMARY_FALLBACK_MODEL
+from utils.circuit_breaker import ModelCircuitBreaker
+from utils.http_client import APIError, StreamInterrupted
+
+class StreamResponse:
+    """SSE 줄을 차례로 돌려주다가 지정한 예외로 끊기는 스트리밍 응답"""
+    
+    status_code = 200
+    
+    def __init__(self, pieces, error=None):
+        self.lines = [f"data: {json.dumps({'choices': [{'delta': {'content': piece}}]})}" for piece in pieces]
+        self.error = error
+    
+    def iter_lines(self, chunk_size=None, decode_unicode=False):
+        yield from self.lines
+        if self.error is not None:
+            raise self.error
+        yield "data: [DONE]"
+    
+    def close(self):
+        pass
+
+class ModelSession:
+    """요청한 모델마다 정해 둔 스트리밍 응답을 돌려주는 세션"""
+    
+    def __init__(self, responses):
+        self.responses = responses
+        self.models = []
+    
+    def request(self, method, url, timeout=None, json=None, **kwargs):
+        self.models.append(json["model"])
+        return self.responses[json["model"]]()
+    
+    def close(self):
+        pass
+
+def make_api(responses):
+    api = OpenAIAPI(api_key="test", max_retries=0, circuit_breaker=ModelCircuitBreaker())
+    api.http.session = ModelSession(responses)
+    return api
+
+@pytest.mark.parametrize("error", [
+    requests.ConnectionError("connection reset"),
+    None
+], ids=["connection", "bad-data"])
+def test_interrupted_stream_is_not_continued_by_fallback(error):
+    def primary():
+        response = StreamResponse(["첫 문단 ", "두 번째"], error)
+        if error is None:
+            response.lines.append("data: {broken")
+        return response
+    
+    api = make_api({
+        SUMMARY_MODEL: primary,
+        SUMMARY_FALLBACK_MODEL: lambda: StreamResponse(["대체 모델 요약"])
+    })
+    deltas = []
+    with pytest.raises(StreamInterrupted):
+        api.summarize_text("회의 내용입니다.", on_delta=deltas.append)
+    
+    assert "".join(deltas) == "첫 문단 두 번째"
+    assert api.http.session.models == [SUMMARY_MODEL]
+
+def test_stream_failing_before_any_delta_falls_back():
+    api = make_api({
+        SUMMARY_MODEL: lambda: StreamResponse([], requests.ConnectionError("connection reset")),
+        SUMMARY_FALLBACK_MODEL: lambda: StreamResponse(["대체 ", "모델 요약"])
+    })
+    deltas = []
+    assert api.summarize_text("회의 내용입니다.", on_delta=deltas.append) == "대체 모델 요약"
+    assert "".join(deltas) == "대체 모델 요약"
+    assert api.http.session.models == [SUMMARY_MODEL, SUMMARY_FALLBACK_MODEL]
+
+def test_stream_interrupted_is_api_error():
+    assert issubclass(StreamInterrupted, APIError)
+
+def test_deprecated_summary_type_argument_is_ignored():
+    api = make_api({SUMMARY_MODEL: lambda: StreamResponse(["문단별 ", "요약"])})
+    deltas = []
+    # 예전 호출 방식 (summary_type을 두 번째 위치 인자로 전달)도 그대로 동작
+    with pytest.warns(DeprecationWarning, match="summary_type"):
+        summary = api.summarize_text("회의 내용입니다.", "timestamped", None, on_delta=deltas.append)
+    assert summary == "문단별 요약"
+    assert "".join(deltas) == "문단별 요약"
@@ -0,0 +1,53 @@
+import pytest
+
+from utils.audio import TimelineMap
+from utils.transcript import Transcript
+
+@pytest.fixture
+def timeline():
+    # 원본 10~15초(5초)와 20~30초(10초)의 무음을 잘라냄
+    timeline = TimelineMap()
+    timeline.add_gap(10000, 15000)
+    timeline.add_gap(15000, 30000)
+    return timeline
+
+def test_empty_map_is_identity():
+    timeline = TimelineMap()
+    assert timeline.removed_ms == 0
+    assert timeline.to_original(12.5) == 12.5
+    assert timeline.to_original(12.5, is_end=True) == 12.5
+
+def test_times_between_gaps_are_shifted(timeline):
+    assert timeline.removed_ms == 15000
+    assert timeline.to_original(0) == 0
+    assert timeline.to_original(5) == 5
+    assert timeline.to_original(12) == 17
+    assert timeline.to_original(20) == 35
+
+def test_start_on_cut_boundary_maps_after_gap(timeline):
+    assert timeline.to_original(10) == 15
+    assert timeline.to_original(15) == 30
+
+def test_end_on_cut_boundary_maps_before_gap(timeline):
+    assert timeline.to_original(10, is_end=True) == 10
+    assert timeline.to_original(15, is_end=True) == 20
+    assert timeline.to_original(12, is_end=True) == 17
+
+def test_remap_keeps_segment_ends_out_of_removed_silence(timeline):
+    transcript = Transcript(
+        "가 나 다",
+        starts=[0.0, 10.0, 15.0],
+        ends=[10.0, 15.0, 18.0],
+        texts=["가", "나", "다"]
+    )
+    timeline.remap(transcript)
+    assert [transcript.times(index) for index in range(len(transcript))] == [
+        (0.0, 10.0),
+        (15.0, 20.0),
+        (30.0, 33.0)
+    ]
+
+def test_round_trips_through_list(timeline):
+    restored = TimelineMap(timeline.to_list())
+    assert restored.anchors == timeline.anchors
+    assert restored.to_original(12) == timeline.to_original(12)
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from utils.transcript import Transcript
+from utils.transcript_file import (
+    TranscriptFile, COMPRESSION_BLOCK_SEGMENTS,
+    save_transcript_binary, load_transcript_binary, json_to_binary, binary_to_json
+)
+
+def make_transcript(count):
+    """여러 압축 블록에 걸치는 세그먼트 (한글, 이모지, 빈 텍스트 포함)"""
+    texts = [f" {index}번째 발언입니다 🎤" if index % 7 else "" for index in range(count)]
+    return Transcript(
+        "".join(texts).strip(),
+        starts=[index * 2.5 for index in range(count)],
+        ends=[index * 2.5 + 2.0 for index in range(count)],
+        texts=texts
+    )
+
+def rows(transcript):
+    return list(transcript.rows())
+
+@pytest.fixture(params=[False, True], ids=["plain", "compressed"])
+def compress(request):
+    return request.param
+
+def test_round_trip(tmp_path, compress):
+    transcript = make_transcript(COMPRESSION_BLOCK_SEGMENTS * 2 + 17)
+    path = str(tmp_path / "meeting.trx")
+    save_transcript_binary(transcript, path, compress=compress)
+    
+    loaded = load_transcript_binary(path)
+    assert loaded.text == transcript.text
+    assert rows(loaded) == rows(transcript)
+
+def test_empty_transcript_round_trip(tmp_path, compress):
+    path = str(tmp_path / "empty.trx")
+    save_transcript_binary(Transcript("전사 결과 없음"), path, compress=compress)
+    loaded = load_transcript_binary(path)
+    assert loaded.text == "전사 결과 없음"
+    assert len(loaded) == 0
+
+def test_slice_matches_in_memory_transcript(tmp_path, compress):
+    transcript = make_transcript(COMPRESSION_BLOCK_SEGMENTS * 3)
+    path = str(tmp_path / "meeting.trx")
+    save_transcript_binary(transcript, path, compress=compress)
+    
+    with TranscriptFile(path) as transcript_file:
+        assert transcript_file.compressed == compress
+        assert len(transcript_file) == len(transcript)
+        for start, end in [(0, 10), (600, 700), (1000.5, 1003), (5000, 6000)]:
+            assert transcript_file.index_range(start, end) == transcript.index_range(start, end)
+            assert rows(transcript_file.slice(start, end)) == rows(transcript.slice(start, end))
+        assert transcript_file.segment_text(300) == transcript.segment_text(300)
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not_a_transcript.trx"
+    path.write_bytes(b"not a transcript file at all" * 4)
+    with pytest.raises(ValueError):
+        TranscriptFile(str(path))
+
+def test_json_conversion_round_trip(tmp_path):
+    transcript = make_transcript(50)
+    json_path = str(tmp_path / "meeting.json")
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(transcript.to_dict(), f, ensure_ascii=False)
+    
+    binary_path = str(tmp_path / "meeting.trx")
+    json_to_binary(json_path, binary_path, compress=True)
+    restored_path = str(tmp_path / "restored.json")
+    binary_to_json(binary_path, restored_path)
+    
+    with open(restored_path, 'r', encoding='utf-8') as f:
+        restored = Transcript.from_dict(json.load(f))
+    assert restored.text == transcript.text
+    assert rows(restored) == rows(transcript)
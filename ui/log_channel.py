@@ -0,0 +1,115 @@
+import os
+import time
+import logging
+import threading
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from PyQt6.QtCore import QObject, QTimer
+
+# 로그 위젯 갱신 주기 (밀리초)
+LOG_FLUSH_INTERVAL_MS = 100
+# 로그 위젯에 유지할 최대 줄 수 (오래된 줄부터 삭제)
+LOG_MAX_LINES = 5000
+# 로그 파일 회전 기준 크기와 보관 개수
+LOG_FILE_MAX_BYTES = 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 5
+
+class LogChannel(QObject):
+    """
+    작업 스레드와 GUI 사이의 로그 채널
+    
+    메시지를 바로 위젯에 추가하지 않고 버퍼에 모았다가 타이머마다 한 번에 추가합니다.
+    위젯은 최근 LOG_MAX_LINES 줄만 유지하고, 전체 로그는 results/logs 아래의 회전 로그 파일에 기록합니다.
+    """
+    
+    def __init__(self, widget, log_dir=None, interval_ms=LOG_FLUSH_INTERVAL_MS, max_lines=LOG_MAX_LINES):
+        """
+        LogChannel 초기화
+        
+        Args:
+            widget (QPlainTextEdit): 로그를 표시할 위젯
+            log_dir (str, optional): 로그 파일 디렉토리. 기본값은 현재 디렉토리의 'results/logs' 폴더.
+            interval_ms (int): 위젯 갱신 주기 (밀리초)
+            max_lines (int): 위젯에 유지할 최대 줄 수
+        """
+        super().__init__(widget)
+        self.widget = widget
+        self.widget.setMaximumBlockCount(max_lines)
+        
+        self._pending = deque()
+        self._lock = threading.Lock()
+        
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+        self._timer.start()
+        
+        if log_dir is None:
+            log_dir = os.path.join(os.getcwd(), 'results', 'logs')
+        self.log_file = os.path.join(log_dir, 'app.log')
+        self._logger = self._create_file_logger(self.log_file)
+    
+    @staticmethod
+    def _create_file_logger(log_file):
+        """
+        회전 로그 파일에 기록하는 로거를 만듭니다. 파일을 열 수 없으면 None을 반환합니다.
+        
+        Args:
+            log_file (str): 로그 파일 경로
+        
+        Returns:
+            logging.Logger: 파일 로거 또는 None
+        """
+        try:
+            os.makedirs(os.path.dirname(log_file), exist_ok=True)
+            handler = RotatingFileHandler(
+                log_file, maxBytes=LOG_FILE_MAX_BYTES,
+                backupCount=LOG_FILE_BACKUP_COUNT, encoding='utf-8'
+            )
+        except OSError as e:
+            print(f"로그 파일을 열 수 없습니다: {str(e)}")
+            return None
+        
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger = logging.getLogger(f"meeting_summary.gui.{id(handler)}")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(handler)
+        return logger
+    
+    def append(self, message):
+        """
+        로그 메시지를 버퍼에 추가합니다. 어느 스레드에서 호출해도 됩니다.
+        
+        Args:
+            message (str): 로그 메시지
+        """
+        with self._lock:
+            self._pending.append(message)
+    
+    def flush(self):
+        """버퍼에 모인 메시지를 위젯과 로그 파일에 한 번에 기록합니다."""
+        with self._lock:
+            if not self._pending:
+                return
+            messages = list(self._pending)
+            self._pending.clear()
+        
+        # 위젯이 유지하는 줄 수보다 많이 쌓였으면 어차피 잘려 나갈 앞부분은 위젯에 넣지 않음
+        visible = messages[-self.widget.maximumBlockCount():]
+        self.widget.appendPlainText("\n".join(visible))
+        
+        if self._logger is not None:
+            # 줄마다 로그 레코드를 만들지 않고 한 번의 쓰기로 기록 (같은 배치는 같은 시각으로 표시)
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S")
+            self._logger.info("\n".join(f"{stamp} {message}" for message in messages))
+    
+    def close(self):
+        """남은 메시지를 기록하고 타이머와 로그 파일을 닫습니다."""
+        self._timer.stop()
+        self.flush()
+        if self._logger is not None:
+            for handler in list(self._logger.handlers):
+                handler.close()
+                self._logger.removeHandler(handler)
+            self._logger = None
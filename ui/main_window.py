@@ -4,16 +4,27 @@ from PyQt6.QtWidgets import (
     QMainWindow, QApplication, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QFileDialog, QTextEdit, QTabWidget,
     QProgressBar, QMessageBox, QRadioButton, QButtonGroup, QGroupBox,
-    QSplitter, QFrame
+    QSplitter, QFrame, QCheckBox, QPlainTextEdit, QStackedWidget
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize
-from PyQt6.QtGui import QFont, QIcon, QColor
+from PyQt6.QtGui import QFont, QIcon, QColor, QTextCursor
 
 from ui.worker_thread import WorkerThread
+from ui.log_channel import LogChannel
+from ui.transcript_view import TranscriptView
+from ui.search_panel import SearchPanel
+from ui.timings_panel import TimingsPanel
+from utils import environment, render
 
 # Whisper API 파일 크기 제한 (25MB)
 MAX_FILE_SIZE_MB = 25
 
+# 요약 결과 탭의 요약 유형별 제목
+SUMMARY_HEADERS = {
+    "paragraph": "## 문단별 요약",
+    "timestamped": "## 시간대별 요약"
+}
+
 class MainWindow(QMainWindow):
     """애플리케이션의 메인 창"""
     
@@ -45,8 +56,11 @@ class MainWindow(QMainWindow):
         # 초기 상태 설정
         self.selected_file_path = None
         self.transcription_result = None
+        self.transcript = None  # 세그먼트가 포함된 전사 결과 (Transcript)
         self.paragraph_summary = None
         self.timestamped_summary = None
+        self.summary_cursors = {}  # 요약 유형 -> 스트리밍 요약을 이어 붙일 위치
+        self.summary_stream_started = False
         self.worker = None
         
         # ffmpeg 확인
@@ -57,8 +71,8 @@ class MainWindow(QMainWindow):
     
     def check_ffmpeg(self):
         """ffmpeg 존재 확인"""
-        ffmpeg_path = os.path.join(os.getcwd(), "ffmpeg.exe")
-        has_ffmpeg = os.path.exists(ffmpeg_path)
+        # main.py의 환경 확인과 같은 캐시된 결과 사용
+        has_ffmpeg = environment.has_ffmpeg()
         
         if not has_ffmpeg:
             # ffmpeg가 없으면 경고 라벨 추가
@@ -68,8 +82,8 @@ class MainWindow(QMainWindow):
             self.main_layout.insertWidget(0, self.ffmpeg_warning)  # 최상단에 삽입
             
             # 로그에 경고 추가
-            self.log_text.append("경고: ffmpeg.exe를 찾을 수 없습니다. 오디오/비디오 파일 처리를 위해 필요합니다.")
-            self.log_text.append("ffmpeg.exe를 프로그램 폴더에 복사한 후 프로그램을 다시 시작하세요.")
+            self.log_channel.append("경고: ffmpeg.exe를 찾을 수 없습니다. 오디오/비디오 파일 처리를 위해 필요합니다.")
+            self.log_channel.append("ffmpeg.exe를 프로그램 폴더에 복사한 후 프로그램을 다시 시작하세요.")
         
         return has_ffmpeg
     
@@ -86,7 +100,7 @@ class MainWindow(QMainWindow):
         self.main_layout.addWidget(subtitle_label)
         
         # API 제한 정보 표시
-        limits_label = QLabel(f"참고: OpenAI Whisper API 파일 크기 제한은 {MAX_FILE_SIZE_MB}MB입니다. 더 큰 파일은 자동으로 압축됩니다.")
+        limits_label = QLabel(f"참고: OpenAI Whisper API 파일 크기 제한은 {MAX_FILE_SIZE_MB}MB입니다. 더 큰 파일은 여러 조각으로 나누어 전사합니다.")
         limits_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         limits_label.setStyleSheet("color: #666666; font-size: 10px;")
         self.main_layout.addWidget(limits_label)
@@ -119,8 +133,13 @@ class MainWindow(QMainWindow):
         self.file_size_label = QLabel("")
         self.file_size_label.setStyleSheet("color: #666666; font-size: 10px;")
         
+        # 무음 제거 옵션 (업로드 크기와 전사 시간 감소)
+        self.remove_silence_option = QCheckBox("긴 무음 구간 제거 후 전사")
+        self.remove_silence_option.setToolTip("말소리가 없는 구간을 잘라내고 업로드합니다. 타임스탬프는 원본 기준으로 표시됩니다.")
+        
         file_layout.addLayout(file_selector_layout)
         file_layout.addWidget(self.file_size_label)
+        file_layout.addWidget(self.remove_silence_option)
         
         # 요약 옵션 영역
         summary_group = QGroupBox("2. 요약 옵션")
@@ -163,8 +182,10 @@ class MainWindow(QMainWindow):
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
         
-        self.log_text = QTextEdit()
+        # 로그는 타이머마다 모아서 추가하고 최근 줄만 유지 (전체 로그는 results/logs에 기록)
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_channel = LogChannel(self.log_text)
         
         progress_layout.addWidget(self.status_label)
         progress_layout.addWidget(self.progress_bar)
@@ -175,11 +196,17 @@ class MainWindow(QMainWindow):
         self.transcription_tab = QWidget()
         transcription_layout = QVBoxLayout(self.transcription_tab)
         
-        self.transcription_text = QTextEdit()
+        # 세그먼트가 있으면 보이는 행만 그리는 목록 뷰로, 없으면 전체 텍스트로 표시
+        self.transcript_view = TranscriptView()
+        self.transcription_text = QPlainTextEdit()
         self.transcription_text.setReadOnly(True)
         
+        self.transcription_stack = QStackedWidget()
+        self.transcription_stack.addWidget(self.transcript_view)
+        self.transcription_stack.addWidget(self.transcription_text)
+        
         transcription_layout.addWidget(QLabel("전사 결과:"))
-        transcription_layout.addWidget(self.transcription_text)
+        transcription_layout.addWidget(self.transcription_stack)
         
         # 탭 3: 요약 결과
         self.summary_tab = QWidget()
@@ -191,10 +218,18 @@ class MainWindow(QMainWindow):
         summary_layout.addWidget(QLabel("요약 결과:"))
         summary_layout.addWidget(self.summary_text)
         
+        # 탭 4: 저장된 결과 검색
+        self.search_panel = SearchPanel()
+        
+        # 탭 5: 마지막 작업의 단계별 처리 시간
+        self.timings_panel = TimingsPanel()
+        
         # 탭 추가
         self.tabs.addTab(self.progress_tab, "진행 상태")
         self.tabs.addTab(self.transcription_tab, "전사 결과")
         self.tabs.addTab(self.summary_tab, "요약 결과")
+        self.tabs.addTab(self.search_panel, "검색")
+        self.tabs.addTab(self.timings_panel, "처리 시간")
         
         self.main_layout.addWidget(self.tabs, 1)
     
@@ -246,7 +281,7 @@ class MainWindow(QMainWindow):
             
             size_text = f"파일 크기: {file_size_mb:.2f}MB"
             if file_size_mb > MAX_FILE_SIZE_MB:
-                size_text += f" (API 제한 {MAX_FILE_SIZE_MB}MB 초과, 자동 압축됨)"
+                size_text += f" (API 제한 {MAX_FILE_SIZE_MB}MB 초과, 나누어 전사됨)"
                 self.file_size_label.setStyleSheet("color: #FF6600; font-size: 10px;")
             else:
                 self.file_size_label.setStyleSheet("color: #007700; font-size: 10px;")
@@ -254,16 +289,16 @@ class MainWindow(QMainWindow):
             self.file_size_label.setText(size_text)
             
             self.update_ui_state()
-            self.log_text.append(f"파일이 선택되었습니다: {file_name}")
-            self.log_text.append(f"파일 크기: {file_size_mb:.2f}MB")
+            self.log_channel.append(f"파일이 선택되었습니다: {file_name}")
+            self.log_channel.append(f"파일 크기: {file_size_mb:.2f}MB")
             
             if file_size_mb > MAX_FILE_SIZE_MB:
-                self.log_text.append(f"주의: 파일 크기가 Whisper API 제한({MAX_FILE_SIZE_MB}MB)을 초과합니다.")
-                self.log_text.append("처리 시 자동으로 파일이 압축되거나 일부만 처리될 수 있습니다.")
+                self.log_channel.append(f"주의: 파일 크기가 Whisper API 제한({MAX_FILE_SIZE_MB}MB)을 초과합니다.")
+                self.log_channel.append("처리 시 자동으로 여러 구간으로 나누어 병렬 전사됩니다.")
             
             # ffmpeg 확인
             if not self.has_ffmpeg:
-                self.log_text.append("경고: ffmpeg.exe를 찾을 수 없습니다. 오디오 변환이 불가능합니다.")
+                self.log_channel.append("경고: ffmpeg.exe를 찾을 수 없습니다. 오디오 변환이 불가능합니다.")
                 QMessageBox.warning(
                     self,
                     "ffmpeg 필요",
@@ -293,7 +328,7 @@ class MainWindow(QMainWindow):
                 self,
                 "큰 파일 경고",
                 f"파일 크기가 {file_size_mb:.1f}MB로 매우 큽니다.\n"
-                f"OpenAI API 제한({MAX_FILE_SIZE_MB}MB)을 크게 초과하므로 파일이 크게 압축되거나 앞부분만 처리될 수 있습니다.\n"
+                f"OpenAI API 제한({MAX_FILE_SIZE_MB}MB)을 크게 초과하므로 여러 구간으로 나누어 전사되며 시간이 오래 걸릴 수 있습니다.\n"
                 "계속 진행하시겠습니까?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                 QMessageBox.StandardButton.No
@@ -313,24 +348,69 @@ class MainWindow(QMainWindow):
         self.start_button.setEnabled(False)
         self.status_label.setText("처리 중...")
         self.progress_bar.setValue(10)
-        self.log_text.append("전사 및 요약 작업을 시작합니다...")
+        self.log_channel.append("전사 및 요약 작업을 시작합니다...")
+        self.prepare_summary_stream(summary_types)
         
         # 작업 스레드 생성 및 시작
-        self.worker = WorkerThread(self.selected_file_path, summary_types)
+        self.worker = WorkerThread(
+            self.selected_file_path, summary_types,
+            remove_silence=self.remove_silence_option.isChecked()
+        )
         self.worker.finished.connect(self.on_processing_finished)
         self.worker.progress_update.connect(self.update_progress)
-        self.worker.log_update.connect(self.log_text.append)
+        self.worker.log_update.connect(self.log_channel.append)
+        self.worker.summary_delta.connect(self.append_summary_delta)
         self.worker.start()
     
+    def prepare_summary_stream(self, summary_types):
+        """
+        요약 결과 탭에 요약 유형별 영역을 만들고, 스트리밍 요약을 이어 붙일 위치를 기억합니다.
+        
+        Args:
+            summary_types (list): 요약 유형 목록
+        """
+        self.summary_text.clear()
+        self.summary_cursors = {}
+        self.summary_stream_started = False
+        
+        cursor = QTextCursor(self.summary_text.document())
+        for index, summary_type in enumerate(summary_types):
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.insertText(f"{SUMMARY_HEADERS[summary_type]}\n\n")
+            position = cursor.position()
+            if index < len(summary_types) - 1:
+                cursor.insertText("\n\n")
+            
+            # 앞 영역에 글자가 추가되면 뒤 영역의 위치는 자동으로 함께 이동
+            section_cursor = QTextCursor(self.summary_text.document())
+            section_cursor.setPosition(position)
+            self.summary_cursors[summary_type] = section_cursor
+    
+    def append_summary_delta(self, summary_type, delta):
+        """스트리밍으로 받은 요약 조각을 해당 요약 영역 끝에 추가"""
+        cursor = self.summary_cursors.get(summary_type)
+        if cursor is None:
+            return
+        
+        # 첫 조각이 도착하면 요약 결과 탭으로 전환
+        if not self.summary_stream_started:
+            self.summary_stream_started = True
+            self.tabs.setCurrentIndex(2)
+        cursor.insertText(delta)
+    
     def on_processing_finished(self, results):
         """처리 완료 후 호출되는 메서드"""
+        # 실패한 작업도 어느 단계에서 시간이 걸렸는지 표시
+        self.timings_panel.set_metrics(results.get("metrics"))
+        
         if results.get("success", False):
             self.transcription_result = results.get("transcription", "")
+            self.transcript = results.get("transcript")
             self.paragraph_summary = results.get("paragraph_summary", "")
             self.timestamped_summary = results.get("timestamped_summary", "")
             
             # UI 업데이트
-            self.transcription_text.setText(self.transcription_result)
+            self.show_transcript()
             
             # 요약 텍스트 설정
             summary_text = ""
@@ -339,6 +419,7 @@ class MainWindow(QMainWindow):
             if self.timestamped_summary:
                 summary_text += "## 시간대별 요약\n\n" + self.timestamped_summary
             
+            self.summary_cursors = {}
             self.summary_text.setText(summary_text)
             
             # 탭 전환
@@ -347,7 +428,7 @@ class MainWindow(QMainWindow):
             # 상태 업데이트
             self.status_label.setText("처리 완료!")
             self.progress_bar.setValue(100)
-            self.log_text.append("전사 및 요약이 성공적으로 완료되었습니다.")
+            self.log_channel.append("전사 및 요약이 성공적으로 완료되었습니다.")
             
             # 저장 버튼 활성화
             self.save_button.setEnabled(True)
@@ -356,7 +437,7 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "오류", f"처리 중 오류가 발생했습니다: {error_msg}")
             self.status_label.setText("오류 발생")
             self.progress_bar.setValue(0)
-            self.log_text.append(f"오류: {error_msg}")
+            self.log_channel.append(f"오류: {error_msg}")
         
         # 시작 버튼 재활성화
         self.start_button.setEnabled(True)
@@ -364,6 +445,17 @@ class MainWindow(QMainWindow):
         # 작업자 스레드 정리
         self.worker = None
     
+    def show_transcript(self):
+        """전사 결과 탭에 전사 결과 표시"""
+        if self.transcript is not None and len(self.transcript):
+            self.transcription_text.clear()
+            self.transcript_view.set_transcript(self.transcript)
+            self.transcription_stack.setCurrentWidget(self.transcript_view)
+        else:
+            self.transcript_view.clear()
+            self.transcription_text.setPlainText(self.transcription_result or "")
+            self.transcription_stack.setCurrentWidget(self.transcription_text)
+    
     def update_progress(self, progress, status):
         """진행 상황 업데이트"""
         self.progress_bar.setValue(progress)
@@ -375,52 +467,60 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "경고", "저장할 결과가 없습니다.")
             return
         
+        # 파일 형식 필터 -> 내보내기 형식 (텍스트 파일은 요약과 전사 내용을 함께 저장)
+        filters = {"텍스트 파일 (*.txt)": None}
+        if self.transcript is not None:
+            filters.update({
+                "마크다운 (*.md)": "md",
+                "SRT 자막 (*.srt)": "srt",
+                "WebVTT 자막 (*.vtt)": "vtt",
+                "JSON (*.json)": "json"
+            })
+        
         file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getSaveFileName(
+        file_path, selected_filter = file_dialog.getSaveFileName(
             self,
             "결과 저장",
             "",
-            "텍스트 파일 (*.txt);;모든 파일 (*.*)"
+            ";;".join(filters)
         )
         
         if file_path:
             try:
+                export_format = filters.get(selected_filter)
+                if export_format == "md":
+                    pieces = render.iter_markdown(self.transcript, self.paragraph_summary, self.timestamped_summary)
+                elif export_format is not None:
+                    pieces = render.iter_transcript(self.transcript, export_format)
+                else:
+                    pieces = render.iter_full_result(
+                        self.transcription_result, self.paragraph_summary, self.timestamped_summary
+                    )
+                
+                # 문서 전체를 메모리에 만들지 않고 조각 단위로 기록
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write("# 회의 요약 결과\n\n")
-                    
-                    if self.paragraph_summary:
-                        f.write("## 1. 요약 (문단별)\n")
-                        f.write(self.paragraph_summary)
-                        f.write("\n\n")
-                    
-                    if self.timestamped_summary:
-                        f.write("## 2. 요약 (시간대별)\n")
-                        f.write(self.timestamped_summary)
-                        f.write("\n\n")
-                    
-                    if self.transcription_result:
-                        f.write("## 3. 전체 전사 내용\n")
-                        f.write(self.transcription_result)
+                    render.write_to(f, pieces)
                 
-                self.log_text.append(f"결과가 저장되었습니다: {file_path}")
+                self.log_channel.append(f"결과가 저장되었습니다: {file_path}")
                 QMessageBox.information(self, "저장 완료", f"결과가 성공적으로 저장되었습니다:\n{file_path}")
             
             except Exception as e:
                 QMessageBox.critical(self, "저장 오류", f"결과 저장 중 오류가 발생했습니다: {str(e)}")
-                self.log_text.append(f"저장 오류: {str(e)}")
+                self.log_channel.append(f"저장 오류: {str(e)}")
     
     def reset_ui(self):
         """UI 초기화"""
         # 작업 스레드가 실행 중이면 중지
         if self.worker and self.worker.isRunning():
-            self.log_text.append("작업 중지 중...")
+            self.log_channel.append("작업 중지 중...")
             self.worker.stop()
             # 이제 worker.stop()이 작업이 완료될 때까지 기다리므로 별도로 wait() 호출 불필요
             self.worker = None
-            self.log_text.append("작업이 중지되었습니다.")
+            self.log_channel.append("작업이 중지되었습니다.")
         
         self.selected_file_path = None
         self.transcription_result = None
+        self.transcript = None
         self.paragraph_summary = None
         self.timestamped_summary = None
         
@@ -430,8 +530,10 @@ class MainWindow(QMainWindow):
         self.paragraph_option.setChecked(True)
         self.progress_bar.setValue(0)
         self.status_label.setText("파일을 선택하고 '전사 및 요약 시작' 버튼을 클릭하세요.")
+        self.transcript_view.clear()
         self.transcription_text.clear()
         self.summary_text.clear()
+        self.log_channel.flush()
         self.log_text.clear()
         
         # 버튼 상태 업데이트
@@ -462,9 +564,10 @@ class MainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                self.log_text.append("프로그램 종료 중... 작업을 정리하는 중입니다.")
+                self.log_channel.append("프로그램 종료 중... 작업을 정리하는 중입니다.")
                 # 진행 상태 탭으로 전환하여 사용자에게 종료 중임을 표시
                 self.tabs.setCurrentIndex(0)
+                self.log_channel.flush()
                 
                 # 애플리케이션이 종료되기 전에 모든 이벤트가 처리되도록 함
                 QApplication.processEvents()
@@ -472,8 +575,12 @@ class MainWindow(QMainWindow):
                 # 스레드 종료 (stop 메서드가 정상적으로 스레드를 종료할 때까지 기다림)
                 self.worker.stop()
                 self.worker = None
+                self.log_channel.close()
+                self.search_panel.close_index()
                 event.accept()
             else:
                 event.ignore()
         else:
+            self.log_channel.close()
+            self.search_panel.close_index()
             event.accept()
\ No newline at end of file
@@ -0,0 +1,122 @@
+import os
+import time
+import sqlite3
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, QLabel,
+    QTreeWidget, QTreeWidgetItem, QHeaderView
+)
+from PyQt6.QtCore import Qt, QUrl
+from PyQt6.QtGui import QDesktopServices
+
+from utils.search_index import SearchIndex, SEARCH_INDEX_FILE
+from utils.transcript import format_timestamp
+
+# 검색 결과에 표시할 문서 종류 이름
+KIND_LABELS = {
+    "transcription": "전사",
+    "summary_paragraph": "문단별 요약",
+    "summary_timestamped": "시간대별 요약"
+}
+
+class SearchPanel(QWidget):
+    """저장된 전사 결과와 요약을 검색하는 탭"""
+    
+    def __init__(self, results_dir=None, parent=None):
+        """
+        SearchPanel 초기화
+        
+        Args:
+            results_dir (str, optional): 결과 폴더. 기본값은 현재 디렉토리의 'results' 폴더.
+            parent (QWidget, optional): 부모 위젯
+        """
+        super().__init__(parent)
+        if results_dir is None:
+            results_dir = os.path.join(os.getcwd(), 'results')
+        self.results_dir = results_dir
+        self.search_index = None  # 처음 검색할 때 열고 결과 폴더와 맞춤
+        
+        layout = QVBoxLayout(self)
+        
+        query_layout = QHBoxLayout()
+        self.query_edit = QLineEdit()
+        self.query_edit.setPlaceholderText("검색어 입력 (여러 단어는 모두 포함된 항목을 찾음)")
+        self.query_edit.returnPressed.connect(self.run_search)
+        
+        search_button = QPushButton("검색")
+        search_button.clicked.connect(self.run_search)
+        
+        query_layout.addWidget(self.query_edit)
+        query_layout.addWidget(search_button)
+        
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("color: #666666; font-size: 10px;")
+        
+        # 결과를 더블 클릭하면 해당 결과 파일을 엶
+        self.results_tree = QTreeWidget()
+        self.results_tree.setHeaderLabels(["회의", "종류", "시간", "내용"])
+        self.results_tree.setRootIsDecorated(False)
+        self.results_tree.setUniformRowHeights(True)
+        self.results_tree.setAlternatingRowColors(True)
+        self.results_tree.header().setStretchLastSection(True)
+        self.results_tree.header().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.results_tree.itemDoubleClicked.connect(self.open_result)
+        
+        layout.addLayout(query_layout)
+        layout.addWidget(self.status_label)
+        layout.addWidget(self.results_tree)
+    
+    def _ensure_index(self):
+        """검색 색인을 열고, 처음 한 번은 결과 폴더에서 아직 색인되지 않은 파일을 색인합니다."""
+        if self.search_index is None:
+            os.makedirs(self.results_dir, exist_ok=True)
+            self.search_index = SearchIndex(os.path.join(self.results_dir, SEARCH_INDEX_FILE))
+            indexed = self.search_index.sync_directory(self.results_dir)
+            if indexed:
+                print(f"검색 색인에 결과 파일 {indexed}개를 추가했습니다.")
+        return self.search_index
+    
+    def run_search(self):
+        """입력한 검색어로 검색하여 결과를 표시합니다."""
+        query = self.query_edit.text().strip()
+        self.results_tree.clear()
+        if not query:
+            self.status_label.setText("")
+            return
+        
+        start_time = time.time()
+        try:
+            hits = self._ensure_index().search(query)
+        except (sqlite3.Error, OSError) as e:
+            self.status_label.setText(f"검색 오류: {str(e)}")
+            return
+        elapsed_ms = (time.time() - start_time) * 1000
+        
+        items = []
+        for hit in hits:
+            timestamp = format_timestamp(hit["start"]) if hit["start"] is not None else ""
+            item = QTreeWidgetItem([
+                hit["title"] or hit["meeting_id"],
+                KIND_LABELS.get(hit["kind"], hit["kind"]),
+                timestamp,
+                hit["snippet"].replace("\n", " ")
+            ])
+            item.setToolTip(0, hit["path"])
+            item.setData(0, Qt.ItemDataRole.UserRole, hit["path"])
+            items.append(item)
+        self.results_tree.addTopLevelItems(items)
+        self.results_tree.resizeColumnToContents(0)
+        self.results_tree.resizeColumnToContents(1)
+        self.results_tree.resizeColumnToContents(2)
+        
+        self.status_label.setText(f"검색 결과 {len(hits)}건 ({elapsed_ms:.0f}ms)")
+    
+    def open_result(self, item, column):
+        """검색 결과의 원본 결과 파일을 엽니다."""
+        path = item.data(0, Qt.ItemDataRole.UserRole)
+        if path and os.path.exists(path):
+            QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+    
+    def close_index(self):
+        """검색 색인 연결을 닫습니다."""
+        if self.search_index is not None:
+            self.search_index.close()
@@ -0,0 +1,127 @@
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
+    QTreeWidget, QTreeWidgetItem, QHeaderView, QApplication
+)
+from PyQt6.QtCore import Qt
+
+from utils.metrics import JobMetrics, stage_label
+
+# 세부 구분 표시 이름 (요약 유형, 저장한 결과 종류)
+KIND_LABELS = {
+    "paragraph": "문단별",
+    "timestamped": "시간대별",
+    "transcription": "전사 결과",
+    "summary_paragraph": "문단별 요약",
+    "summary_timestamped": "시간대별 요약",
+    "full_result": "통합 결과"
+}
+
+def format_counters(counters):
+    """카운터를 표시용 문자열로 변환 (바이트는 KB/MB 단위)"""
+    parts = []
+    for name, value in counters.items():
+        if name.endswith("bytes") and value >= 1024 * 1024:
+            parts.append(f"{name} {value / (1024 * 1024):.1f}MB")
+        elif name.endswith("bytes"):
+            parts.append(f"{name} {value / 1024:.1f}KB")
+        else:
+            parts.append(f"{name} {value}")
+    return ", ".join(parts)
+
+class TimingsPanel(QWidget):
+    """마지막 작업의 단계별 처리 시간을 보여주는 탭"""
+    
+    def __init__(self, parent=None):
+        """
+        TimingsPanel 초기화
+        
+        Args:
+            parent (QWidget, optional): 부모 위젯
+        """
+        super().__init__(parent)
+        self.metrics = None
+        
+        layout = QVBoxLayout(self)
+        
+        header_layout = QHBoxLayout()
+        self.summary_label = QLabel("작업이 끝나면 단계별 처리 시간이 표시됩니다.")
+        
+        self.copy_button = QPushButton("Prometheus 형식 복사")
+        self.copy_button.setEnabled(False)
+        self.copy_button.clicked.connect(self.copy_prometheus)
+        
+        header_layout.addWidget(self.summary_label, 1)
+        header_layout.addWidget(self.copy_button)
+        
+        # 단계별 합계 아래에 개별 span(청크 업로드 등)을 펼쳐 볼 수 있음
+        self.timings_tree = QTreeWidget()
+        self.timings_tree.setHeaderLabels(["단계", "시작 (초)", "시간 (초)", "비율", "횟수", "카운터"])
+        self.timings_tree.setUniformRowHeights(True)
+        self.timings_tree.setAlternatingRowColors(True)
+        self.timings_tree.header().setStretchLastSection(True)
+        self.timings_tree.header().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        
+        layout.addLayout(header_layout)
+        layout.addWidget(self.timings_tree)
+    
+    def set_metrics(self, data):
+        """
+        작업 지표를 표시합니다.
+        
+        Args:
+            data (dict): JobMetrics.to_dict() 결과 (없으면 표시를 지움)
+        """
+        self.timings_tree.clear()
+        if not data:
+            self.metrics = None
+            self.copy_button.setEnabled(False)
+            self.summary_label.setText("작업이 끝나면 단계별 처리 시간이 표시됩니다.")
+            return
+        
+        self.metrics = JobMetrics.from_dict(data)
+        total = self.metrics.total_seconds or 0
+        status = "완료" if self.metrics.status == "success" else "실패"
+        self.summary_label.setText(f"작업 {self.metrics.job_id or '-'}: 전체 {total:.1f}초 ({status})")
+        self.copy_button.setEnabled(True)
+        
+        spans = {}
+        for span in data.get("spans", []):
+            spans.setdefault((span["stage"], span["kind"]), []).append(span)
+        
+        items = []
+        for stage in self.metrics.stages():
+            key = (stage["stage"], stage["kind"])
+            stage_spans = spans.get(key, [])
+            # 동시에 실행된 span은 합계 대신 첫 시작부터 마지막 종료까지의 시간을 비율 계산에 사용
+            seconds = stage["wall_seconds"] if stage["count"] > 1 else stage["seconds"]
+            item = QTreeWidgetItem([
+                stage_label(stage["stage"], KIND_LABELS.get(stage["kind"], stage["kind"])),
+                f"{stage_spans[0]['start']:.2f}" if stage_spans else "",
+                f"{seconds:.2f}",
+                f"{seconds / total * 100:.1f}%" if total else "",
+                str(stage["count"]),
+                format_counters(stage["counters"])
+            ])
+            if stage["count"] > 1:
+                item.setToolTip(2, f"첫 시작부터 마지막 종료까지 (각 span 시간의 합: {stage['seconds']:.2f}초)")
+                for index, span in enumerate(stage_spans, 1):
+                    item.addChild(QTreeWidgetItem([
+                        f"#{index}",
+                        f"{span['start']:.2f}",
+                        f"{span['seconds']:.2f}",
+                        "",
+                        "",
+                        format_counters(span["counters"])
+                    ]))
+            for column in range(1, 5):
+                item.setTextAlignment(column, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            items.append(item)
+        
+        self.timings_tree.addTopLevelItems(items)
+        for column in range(5):
+            self.timings_tree.resizeColumnToContents(column)
+    
+    def copy_prometheus(self):
+        """표시 중인 지표를 Prometheus 텍스트 형식으로 클립보드에 복사합니다."""
+        if self.metrics is not None:
+            QApplication.clipboard().setText(self.metrics.to_prometheus())
@@ -0,0 +1,118 @@
+from PyQt6.QtWidgets import QTreeView, QAbstractItemView, QApplication, QHeaderView
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QKeySequence
+
+from utils.transcript import Transcript, format_timestamp
+
+class TranscriptModel(QAbstractTableModel):
+    """
+    전사 세그먼트를 (시간, 내용) 두 열로 보여주는 모델
+    
+    세그먼트를 미리 문자열로 만들어 두지 않고, 뷰가 요청하는 (화면에 보이는) 행만
+    Transcript의 열 배열에서 바로 읽어 표시합니다.
+    """
+    
+    TIME_COLUMN = 0
+    TEXT_COLUMN = 1
+    HEADERS = ("시간", "내용")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.transcript = Transcript()
+    
+    def set_transcript(self, transcript):
+        """
+        표시할 전사 결과를 바꿉니다.
+        
+        Args:
+            transcript (Transcript): 전사 결과 (None이면 비움)
+        """
+        self.beginResetModel()
+        self.transcript = transcript if transcript is not None else Transcript()
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.transcript)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if index.column() == self.TIME_COLUMN:
+                start, end = self.transcript.times(index.row())
+                return f"{format_timestamp(start)} - {format_timestamp(end)}"
+            return self.transcript.segment_text(index.row()).strip()
+        
+        if role == Qt.ItemDataRole.ToolTipRole and index.column() == self.TEXT_COLUMN:
+            # 한 줄에 다 보이지 않는 긴 세그먼트는 툴팁으로 전체 표시
+            return self.transcript.segment_text(index.row()).strip()
+        
+        return None
+
+class TranscriptView(QTreeView):
+    """
+    전사 세그먼트 목록 뷰
+    
+    모든 행의 높이가 같다고 알려 주어 스크롤할 때 화면에 보이는 행만 계산하고 그립니다.
+    선택한 행은 Ctrl+C로 "[HH:MM:SS - HH:MM:SS] 텍스트" 형식으로 복사할 수 있습니다.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.transcript_model = TranscriptModel(self)
+        self.setModel(self.transcript_model)
+        
+        self.setUniformRowHeights(True)
+        self.setRootIsDecorated(False)
+        self.setItemsExpandable(False)
+        self.setAlternatingRowColors(True)
+        self.setWordWrap(False)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        
+        # 시간 열은 항상 같은 길이이므로 모든 행을 훑는 ResizeToContents 대신 고정 폭 사용
+        header = self.header()
+        header.setStretchLastSection(True)
+        header.setSectionResizeMode(TranscriptModel.TIME_COLUMN, QHeaderView.ResizeMode.Fixed)
+        header.resizeSection(
+            TranscriptModel.TIME_COLUMN,
+            self.fontMetrics().horizontalAdvance("00:00:00 - 00:00:00") + 24
+        )
+    
+    def set_transcript(self, transcript):
+        """
+        표시할 전사 결과를 바꿉니다.
+        
+        Args:
+            transcript (Transcript): 전사 결과 (None이면 비움)
+        """
+        self.transcript_model.set_transcript(transcript)
+    
+    def clear(self):
+        """표시 중인 전사 결과를 비웁니다."""
+        self.transcript_model.set_transcript(None)
+    
+    def copy_selection(self):
+        """선택한 세그먼트를 타임스탬프 텍스트로 클립보드에 복사합니다."""
+        rows = sorted(index.row() for index in self.selectionModel().selectedRows())
+        if not rows:
+            return
+        
+        transcript = self.transcript_model.transcript
+        lines = [next(transcript.timestamped_lines(row, row + 1)) for row in rows]
+        QApplication.clipboard().setText("\n".join(lines))
+    
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.StandardKey.Copy):
+            self.copy_selection()
+            return
+        super().keyPressEvent(event)
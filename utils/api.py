@@ -1,42 +1,175 @@
 import os
-import openai
-from dotenv import load_dotenv
+import re
+import time
+import warnings
+import mimetypes
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# .env 파일에서 API 키 로드
-load_dotenv()
-api_key = os.getenv("OPENAI_API_KEY")
+from utils.cache import make_cache_key
+from utils.circuit_breaker import ModelCircuitBreaker
+from utils.environment import load_environment
+from utils.tokens import count_tokens, count_message_tokens
+from utils.transcript import Transcript
+from utils.http_client import (
+    HTTPClient, APIError,
+    DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT, DEFAULT_MAX_RETRIES
+)
 
-# OpenAI API 키 설정
-openai.api_key = api_key
-print("OpenAI API 키 설정 완료")
+# OpenAI API 기본 URL (환경 변수 OPENAI_BASE_URL로 호환 서버를 지정할 수 있음)
+OPENAI_BASE_URL = "https://api.openai.com/v1"
+BASE_URL_ENV = "OPENAI_BASE_URL"
+
+# 요약 모델 (기본 모델을 사용할 수 없는 경우에만 대체 모델 사용)
+SUMMARY_MODEL = "o3-mini"
+SUMMARY_FALLBACK_MODEL = "gpt-3.5-turbo"
+
+# 요약 모델별 컨텍스트 크기(입력 + 출력 토큰)와 생성 옵션
+# 요청 전에 토큰 수를 세어 들어가는 모델과 구간 크기를 정함 (목록에 없는 대체 모델은 DEFAULT_SUMMARY_MODEL_SPEC)
+SUMMARY_MODEL_SPECS = {
+    SUMMARY_MODEL: {"context_tokens": 200000, "params": {"max_completion_tokens": 8000}},
+    SUMMARY_FALLBACK_MODEL: {"context_tokens": 16385, "params": {"temperature": 0.3, "max_tokens": 2000}}
+}
+DEFAULT_SUMMARY_MODEL_SPEC = {"context_tokens": 16385, "params": {"temperature": 0.3, "max_tokens": 2000}}
+
+# 모델을 사용할 수 없다는 응답 (바로 circuit breaker를 열어 이후 요청은 대체 모델로 보냄)
+MODEL_UNAVAILABLE_STATUS_CODES = {403, 404}
+
+# 작업마다 클라이언트를 새로 만들어도 실패한 모델을 기억하도록 프로세스에 하나만 둠
+SUMMARY_CIRCUIT_BREAKER = ModelCircuitBreaker()
+
+# Whisper 전사 설정
+WHISPER_MODEL = "whisper-1"
+TRANSCRIBE_LANGUAGE = "ko"
+TRANSCRIBE_RESPONSE_FORMAT = "verbose_json"
+
+# 청크 병렬 전사 시 동시에 실행할 최대 요청 수
+TRANSCRIBE_MAX_WORKERS = 4
+
+# 요약 요청 한 번에 넣을 전사 내용의 최대 토큰 수 (더 길면 구간별로 나누어 요약)
+SUMMARY_CHUNK_MAX_TOKENS = 12000
+# 구간별 요약을 동시에 실행할 최대 요청 수
+SUMMARY_MAX_WORKERS = 4
+
+SUMMARY_SYSTEM_PROMPT = "당신은 회의록이나 강의 내용을 이해하고 요약하는 데 특화된 전문 AI 비서입니다."
+
+# 요약 작성 지침 (전체 요약과 구간별 요약 통합에 공통으로 사용)
+SUMMARY_GUIDELINES = """다음 지침을 따르십시오:
+
+- 요약은 원본보다 간결하게 하되 **가능한 한 상세하고 길게** 작성하세요. 핵심과 관련 없는 잡담이나 의미 없는 부분은 제외하고, **주요 논의 내용은 모두 포함**하십시오.
+- **시간 흐름에 따라** 요약을 정리하세요. 발언이 있었던 **시각 또는 순서**를 밝혀가며, 해당 구간에서 논의된 핵심 내용을 서술하세요. (예: "`00:15 -` 팀장 인사 및 회의 목표 소개...")
+- 특히 **중요 결정사항**, **핵심 주장/논거**, 그리고 **주요 질문과 그 답변**은 놓치지 말고 요약에 포함하세요. 어떤 결정이 나왔을 경우 **`결정:`** 이라고 표시하고 내용을 밝히세요. 중요한 질문이 오갔다면 **질문과 답변을 함께** 정리하세요.
+- 최종 요약은 **한국어**로 작성하세요. 읽기 쉽도록 항목별로 나열하고, 필요한 경우 문장부호나 강조(**굵게** 등)를 활용해 핵심을 돋보이게 하십시오.
+- 정보는 **주어진 자료에 근거해서만** 요약하세요. 원문에 없었던 내용은 추측하거나 만들어내지 말고, 언급되지 않은 사항은 요약에서도 언급하지 않습니다.
+"""
+
+# 새로운 요약 프롬프트
+SUMMARY_PROMPT = f"""당신은 회의록이나 강의 내용을 이해하고 요약하는 데 특화된 **전문 AI 비서**입니다. 사용자로부터 음성 인식으로 추출된 긴 텍스트를 전달받으면, **내용의 진행 순서(타임라인)**에 따라 **상세하고 체계적인 요약**을 만듭니다.
+
+{SUMMARY_GUIDELINES}
+전사 내용:
+"""
+
+# 긴 전사 내용의 한 구간을 요약하는 프롬프트 (map 단계)
+PARTIAL_SUMMARY_PROMPT = """다음은 긴 회의/강의 전사 내용 중 {index}/{total}번째 구간입니다. 이 구간에서 논의된 내용을 시간 흐름에 따라 빠짐없이 상세하게 요약하세요.
+
+- 발언 시각이 있으면 그대로 밝혀 주세요.
+- 결정사항은 **`결정:`** 으로 표시하고, 중요한 질문은 답변과 함께 정리하세요.
+- 원문에 없는 내용은 추측하거나 만들어내지 마세요.
+
+전사 내용 ({index}/{total}):
+"""
+
+# 구간별 요약을 하나의 최종 요약으로 합치는 프롬프트 (reduce 단계)
+REDUCE_SUMMARY_PROMPT = f"""당신은 회의록이나 강의 내용을 이해하고 요약하는 데 특화된 **전문 AI 비서**입니다. 아래는 긴 전사 내용을 순서대로 나누어 구간별로 요약한 것입니다. 이를 종합하여 전체 내용의 **진행 순서(타임라인)**에 따른 **상세하고 체계적인 최종 요약**을 만듭니다. 구간 구분은 최종 요약에 드러내지 말고 하나의 흐름으로 정리하세요.
+
+{SUMMARY_GUIDELINES}
+구간별 요약:
+"""
 
 class OpenAIAPI:
     """OpenAI API와의 통신을 관리하는 클래스"""
     
-    @staticmethod
-    def transcribe_audio(audio_file_path):
+    def __init__(self, api_key=None, base_url=None,
+                 connect_timeout=DEFAULT_CONNECT_TIMEOUT, read_timeout=DEFAULT_READ_TIMEOUT,
+                 max_retries=DEFAULT_MAX_RETRIES, fallback_model=SUMMARY_FALLBACK_MODEL,
+                 circuit_breaker=None):
+        """
+        OpenAIAPI 클래스 초기화
+        
+        Args:
+            api_key (str, optional): OpenAI API 키. 기본값은 환경 변수 OPENAI_API_KEY.
+            base_url (str, optional): API 기본 URL. 기본값은 환경 변수 OPENAI_BASE_URL, 없으면 OpenAI API.
+            connect_timeout (float): 연결 타임아웃 (초)
+            read_timeout (float): 응답 대기 타임아웃 (초)
+            max_retries (int): 429/5xx 및 연결 오류 시 최대 재시도 횟수
+            fallback_model (str, optional): 요약 모델을 사용할 수 없을 때 대체할 모델. None이면 대체하지 않음.
+            circuit_breaker (ModelCircuitBreaker, optional): 실패한 모델을 기억할 객체. 기본값은 SUMMARY_CIRCUIT_BREAKER.
+        """
+        if api_key is None:
+            # .env 파일에서 API 키 로드 (프로세스당 한 번만)
+            api_key = load_environment()
+        if base_url is None:
+            load_environment()
+            base_url = os.getenv(BASE_URL_ENV) or OPENAI_BASE_URL
+        
+        self.fallback_model = fallback_model
+        self.circuit_breaker = circuit_breaker if circuit_breaker is not None else SUMMARY_CIRCUIT_BREAKER
+        # 여러 요청이 keep-alive 연결을 재사용하도록 하나의 클라이언트를 공유
+        self.http = HTTPClient(
+            base_url,
+            headers={"Authorization": f"Bearer {api_key}"},
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_retries=max_retries
+        )
+    
+    def close(self):
+        """HTTP 연결 풀 정리"""
+        self.http.close()
+    
+    async def atranscribe_audio(self, *args, **kwargs):
+        """transcribe_audio()의 asyncio 버전 (인자는 그대로 전달)"""
+        import asyncio
+        return await asyncio.to_thread(self.transcribe_audio, *args, **kwargs)
+    
+    async def atranscribe_chunks(self, *args, **kwargs):
+        """transcribe_chunks()의 asyncio 버전 (인자는 그대로 전달)"""
+        import asyncio
+        return await asyncio.to_thread(self.transcribe_chunks, *args, **kwargs)
+    
+    async def asummarize_text(self, *args, **kwargs):
+        """summarize_text()의 asyncio 버전 (인자는 그대로 전달)"""
+        import asyncio
+        return await asyncio.to_thread(self.summarize_text, *args, **kwargs)
+    
+    def transcribe_audio(self, audio_file_path, metrics=None):
         """
         Whisper API를 사용하여 오디오 파일을 텍스트로 변환합니다.
         
         Args:
             audio_file_path (str): 오디오 파일의 경로
+            metrics (JobMetrics, optional): 요청 시간(upload: 전송부터 응답 수신까지)과 바이트/세그먼트 수를 기록할 객체
             
         Returns:
-            dict: 전사 결과 (텍스트 및 타임스탬프 포함)
+            Transcript: 전사 결과 (텍스트 및 타임스탬프 포함)
         """
         try:
             print(f"오디오 파일 전사 시작: {audio_file_path}")
             print(f"파일 크기: {os.path.getsize(audio_file_path)} bytes")
             print(f"파일 존재 여부: {os.path.exists(audio_file_path)}")
             
+            mime_type = mimetypes.guess_type(audio_file_path)[0] or "application/octet-stream"
+            upload_start = time.perf_counter()
             with open(audio_file_path, "rb") as audio_file:
                 try:
-                    # 구 버전 API 호출 (0.28.1)
-                    response = openai.Audio.transcribe(
-                        model="whisper-1",
-                        file=audio_file,
-                        language="ko",
-                        response_format="verbose_json"
+                    response = self.http.request(
+                        "POST", "audio/transcriptions",
+                        data={
+                            "model": WHISPER_MODEL,
+                            "language": TRANSCRIBE_LANGUAGE,
+                            "response_format": TRANSCRIBE_RESPONSE_FORMAT
+                        },
+                        files={"file": (os.path.basename(audio_file_path), audio_file, mime_type)}
                     )
                 except Exception as e:
                     print(f"API 호출 중 오류: {e}")
@@ -44,83 +177,477 @@ class OpenAIAPI:
                     
             print("전사 완료")
             
-            # 응답 형식 변환 (0.28.1 버전에서는 응답이 딕셔너리 형태)
-            class TranscriptionResponse:
-                def __init__(self, data):
-                    self.text = data.get('text', '')
-                    self.segments = []
-                    for seg in data.get('segments', []):
-                        segment = type('Segment', (), {})
-                        segment.start = seg.get('start', 0)
-                        segment.end = seg.get('end', 0)
-                        segment.text = seg.get('text', '')
-                        self.segments.append(segment)
-            
-            return TranscriptionResponse(response)
+            transcript = Transcript.from_dict(response.json())
+            if metrics is not None:
+                metrics.record(
+                    "upload", upload_start,
+                    bytes=os.path.getsize(audio_file_path), segments=len(transcript)
+                )
+            return transcript
         except Exception as e:
             print(f"전사 중 오류 발생: {e}")
             raise
     
+    def transcribe_chunks(self, chunks, max_workers=TRANSCRIBE_MAX_WORKERS, stop_check=None, metrics=None):
+        """
+        여러 오디오 청크를 동시에 전사한 뒤 하나의 타임라인으로 합칩니다.
+        
+        Args:
+            chunks (list): (청크 파일 경로, 원본 기준 시작 오프셋(초)) 튜플 목록
+            max_workers (int): 동시에 실행할 최대 전사 요청 수
+            stop_check (callable, optional): True를 반환하면 남은 청크 전사를 취소하는 함수
+            metrics (JobMetrics, optional): 청크별 요청 시간을 기록할 객체
+            
+        Returns:
+            Transcript: 오프셋이 보정된 전체 전사 결과 (취소된 경우 None)
+        """
+        if len(chunks) == 1 and chunks[0][1] == 0:
+            return self.transcribe_audio(chunks[0][0], metrics)
+        
+        print(f"청크 {len(chunks)}개 병렬 전사 시작 (최대 동시 요청: {max_workers})")
+        results = [None] * len(chunks)
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+            futures = {
+                executor.submit(self.transcribe_audio, chunk_path, metrics): index
+                for index, (chunk_path, _) in enumerate(chunks)
+            }
+            try:
+                completed = 0
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    completed += 1
+                    print(f"청크 전사 완료 ({completed}/{len(chunks)})")
+                    
+                    if stop_check and stop_check():
+                        print("전사 취소 요청됨")
+                        for pending in futures:
+                            pending.cancel()
+                        return None
+            except Exception:
+                # 하나라도 실패하면 아직 시작하지 않은 요청은 취소
+                for pending in futures:
+                    pending.cancel()
+                raise
+        
+        return OpenAIAPI._merge_transcriptions(results, [offset for _, offset in chunks])
+    
     @staticmethod
-    def summarize_text(text, summary_type="paragraph"):
+    def _merge_transcriptions(responses, offsets):
+        """
+        청크별 전사 결과를 원본 기준 타임스탬프로 보정하여 합칩니다.
+        
+        Args:
+            responses (list): 청크 순서대로 정렬된 Transcript 목록
+            offsets (list): 각 청크의 원본 기준 시작 오프셋 (초)
+            
+        Returns:
+            Transcript: 합쳐진 전사 결과
+        """
+        return Transcript.concat(responses, offsets)
+    
+    def summarize_text(self, text, summary_type=None, cache=None,
+                       max_chunk_tokens=SUMMARY_CHUNK_MAX_TOKENS, max_workers=SUMMARY_MAX_WORKERS,
+                       on_delta=None):
         """
         ChatGPT API를 사용하여 텍스트 요약을 생성합니다.
         
+        전사 내용이 max_chunk_tokens보다 길면 세그먼트(문장) 경계에서 여러 구간으로 나누어
+        동시에 요약(map)한 뒤, 구간별 요약을 합쳐 최종 요약(reduce)을 만듭니다.
+        Transcript를 전달하면 타임스탬프가 포함된 세그먼트 단위로 바로 나눕니다.
+        요약 유형(문단별/시간대별)은 프롬프트가 아니라 전달하는 입력(텍스트 또는 Transcript)으로 정해집니다.
+        
+        요청을 보내기 전에 사용할 모델(circuit breaker가 열리지 않은 첫 모델)을 정하고, 그 모델의
+        토크나이저로 토큰 수를 세어 프롬프트와 출력 토큰을 합쳐 컨텍스트에 들어가는 크기로 구간을 나눕니다.
+        
         Args:
-            text (str): 요약할 텍스트
-            summary_type (str): 요약 유형 ('paragraph' 또는 'timestamped')
+            text (str 또는 Transcript): 요약할 텍스트 또는 전사 결과
+            summary_type (str, optional): 더 이상 사용하지 않음 (기존 호출과의 호환을 위해 받기만 하고 무시함).
+                                          요약 유형은 text의 종류로 정해집니다.
+            cache (FileCache, optional): 요약 캐시. 프롬프트, 모델, 생성 옵션이 모두 같으면 API를 호출하지 않음.
+            max_chunk_tokens (int): 요청 한 번에 넣을 전사 내용의 최대 토큰 수 (모델 컨텍스트가 더 작으면 그에 맞춤)
+            max_workers (int): 구간 요약을 동시에 실행할 최대 요청 수
+            on_delta (callable, optional): 최종 요약을 토큰 스트림으로 받으며 조각마다 호출할 함수.
+                                           구간 요약(map)은 스트리밍하지 않음.
             
         Returns:
-            str: 요약된 텍스트
+            str: 요약된 텍스트 (스트리밍한 경우에도 전체 텍스트)
         """
+        if summary_type is not None:
+            warnings.warn(
+                "summarize_text()의 summary_type 인자는 더 이상 사용되지 않으며 무시됩니다. "
+                "시간대별 요약은 Transcript를 전달하세요.",
+                DeprecationWarning, stacklevel=2
+            )
+        
         try:
-            # 새로운 요약 프롬프트
-            new_prompt = """
-            당신은 회의록이나 강의 내용을 이해하고 요약하는 데 특화된 **전문 AI 비서**입니다. 사용자로부터 음성 인식으로 추출된 긴 텍스트를 전달받으면, **내용의 진행 순서(타임라인)**에 따라 **상세하고 체계적인 요약**을 만듭니다.
-
-            다음 지침을 따르십시오:
-
-            - 요약은 원본보다 간결하게 하되 **가능한 한 상세하고 길게** 작성하세요. 핵심과 관련 없는 잡담이나 의미 없는 부분은 제외하고, **주요 논의 내용은 모두 포함**하십시오.
-            - **시간 흐름에 따라** 요약을 정리하세요. 발언이 있었던 **시각 또는 순서**를 밝혀가며, 해당 구간에서 논의된 핵심 내용을 서술하세요. (예: "`00:15 -` 팀장 인사 및 회의 목표 소개...")
-            - 특히 **중요 결정사항**, **핵심 주장/논거**, 그리고 **주요 질문과 그 답변**은 놓치지 말고 요약에 포함하세요. 어떤 결정이 나왔을 경우 **`결정:`** 이라고 표시하고 내용을 밝히세요. 중요한 질문이 오갔다면 **질문과 답변을 함께** 정리하세요.
-            - 최종 요약은 **한국어**로 작성하세요. 읽기 쉽도록 항목별로 나열하고, 필요한 경우 문장부호나 강조(**굵게** 등)를 활용해 핵심을 돋보이게 하십시오.
-            - 정보는 **주어진 자료에 근거해서만** 요약하세요. 원문에 없었던 내용은 추측하거나 만들어내지 말고, 언급되지 않은 사항은 요약에서도 언급하지 않습니다.
+            model = self.select_summary_model()
+            max_chunk_tokens = self.summary_input_budget(model, max_chunk_tokens)
+            if isinstance(text, Transcript):
+                chunks = OpenAIAPI.split_transcript_for_summary(text, max_chunk_tokens, model)
+            else:
+                chunks = OpenAIAPI.split_text_for_summary(text, max_chunk_tokens, model)
+            if len(chunks) <= 1:
+                return self._request_summary(f"{SUMMARY_PROMPT}\n{chunks[0] if chunks else ''}", cache, on_delta, model)
             
-            전사 내용:
-            """
+            # 1단계 (map): 구간별 요약을 동시에 생성
+            print(f"전사 내용이 길어 {len(chunks)}개 구간으로 나누어 요약합니다. (모델: {model}, 구간당 최대 {max_chunk_tokens} 토큰)")
+            partial_summaries = self._summarize_chunks(chunks, cache, max_workers, model)
             
-            prompt = ""
-            if summary_type == "paragraph":
-                prompt = f"{new_prompt}\n{text}"
-            elif summary_type == "timestamped":
-                prompt = f"{new_prompt}\n{text}"
-            
-            try:
-                # 구 버전 API 호출 (0.28.1)
-                response = openai.ChatCompletion.create(
-                    model="o3-mini", # o3-mini 모델로 변경
-                    messages=[
-                        {"role": "system", "content": "당신은 회의록이나 강의 내용을 이해하고 요약하는 데 특화된 전문 AI 비서입니다."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_completion_tokens=8000 # max_tokens를 max_completion_tokens로 변경
+            # 2단계 (reduce): 구간별 요약이 한 번에 들어가지 않으면 묶어서 다시 요약
+            while True:
+                combined = "\n\n".join(
+                    f"### 구간 {index + 1}/{len(partial_summaries)}\n{summary}"
+                    for index, summary in enumerate(partial_summaries)
                 )
-                return response.choices[0].message.content
-            except Exception as e:
-                print(f"API 호출 중 오류: {e}")
-                # o3-mini 모델 호출 실패 시 gpt-3.5-turbo로 대체
-                print("o3-mini 모델 호출 실패, gpt-3.5-turbo로 대체합니다.")
-                response = openai.ChatCompletion.create(
-                    model="gpt-3.5-turbo",
-                    messages=[
-                        {"role": "system", "content": "당신은 회의록이나 강의 내용을 이해하고 요약하는 데 특화된 전문 AI 비서입니다."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.3,
-                    max_tokens=2000
-                )
-                return response.choices[0].message.content
+                groups = OpenAIAPI.split_text_for_summary(combined, max_chunk_tokens, model)
+                # 한 번에 들어가거나, 더 이상 줄어들지 않으면 그대로 최종 요약
+                if len(groups) <= 1 or len(groups) >= len(partial_summaries):
+                    break
+                print(f"구간별 요약이 길어 {len(groups)}개 묶음으로 다시 요약합니다.")
+                partial_summaries = self._summarize_chunks(groups, cache, max_workers, model)
+            
+            return self._request_summary(f"{REDUCE_SUMMARY_PROMPT}\n{combined}", cache, on_delta, model)
                 
         except Exception as e:
             print(f"요약 중 오류 발생: {e}")
-            raise 
\ No newline at end of file
+            raise
+    
+    def summary_models(self):
+        """요약에 사용할 수 있는 모델 목록 (선호 순서)"""
+        models = [SUMMARY_MODEL]
+        if self.fallback_model and self.fallback_model != SUMMARY_MODEL:
+            models.append(self.fallback_model)
+        return models
+    
+    def select_summary_model(self):
+        """
+        요약 요청을 계획할 모델을 고릅니다.
+        
+        Returns:
+            str: circuit breaker가 열리지 않은 첫 모델 (모두 열려 있으면 기본 모델)
+        """
+        models = self.summary_models()
+        for model in models:
+            if not self.circuit_breaker.is_open(model):
+                return model
+        return models[0]
+    
+    @staticmethod
+    def summary_model_spec(model):
+        """모델의 컨텍스트 크기와 생성 옵션 (SUMMARY_MODEL_SPECS)"""
+        return SUMMARY_MODEL_SPECS.get(model, DEFAULT_SUMMARY_MODEL_SPEC)
+    
+    @staticmethod
+    def summary_input_budget(model, max_chunk_tokens=SUMMARY_CHUNK_MAX_TOKENS):
+        """
+        모델 요청 하나에 넣을 수 있는 전사 내용의 최대 토큰 수를 계산합니다.
+        
+        컨텍스트 크기에서 출력 토큰과 가장 긴 프롬프트 템플릿(시스템 메시지 포함)의 토큰 수를 뺀 값입니다.
+        
+        Args:
+            model (str): 모델 이름
+            max_chunk_tokens (int): 상한 (요약 품질을 위해 컨텍스트가 커도 구간을 이보다 크게 만들지 않음)
+            
+        Returns:
+            int: 구간 하나의 최대 토큰 수
+        """
+        spec = OpenAIAPI.summary_model_spec(model)
+        templates = (SUMMARY_PROMPT, PARTIAL_SUMMARY_PROMPT.format(index=999, total=999), REDUCE_SUMMARY_PROMPT)
+        overhead = max(
+            count_message_tokens([
+                {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                {"role": "user", "content": template}
+            ], model)
+            for template in templates
+        )
+        available = spec["context_tokens"] - OpenAIAPI._output_tokens(spec) - overhead
+        return max(1, min(max_chunk_tokens, available))
+    
+    @staticmethod
+    def _output_tokens(spec):
+        """생성 옵션에서 출력(추론 포함)에 예약할 토큰 수"""
+        params = spec["params"]
+        return params.get("max_completion_tokens") or params.get("max_tokens") or 0
+    
+    @staticmethod
+    def split_text_for_summary(text, max_tokens, model=None):
+        """
+        텍스트를 토큰 예산에 맞는 구간들로 나눕니다.
+        
+        타임스탬프 텍스트처럼 빈 줄로 구분된 세그먼트가 있으면 세그먼트 경계에서,
+        그렇지 않으면 문장 경계에서 나눕니다.
+        
+        Args:
+            text (str): 나눌 텍스트
+            max_tokens (int): 구간 하나의 최대 토큰 수
+            model (str, optional): 토큰 수를 셀 모델 (tiktoken이 없으면 추정)
+            
+        Returns:
+            list: 구간 텍스트 목록
+        """
+        if count_tokens(text, model) <= max_tokens:
+            return [text]
+        
+        if "\n\n" in text:
+            units, separator = text.split("\n\n"), "\n\n"
+        else:
+            units, separator = re.split(r"(?<=[.!?。])\s+", text), " "
+        
+        return OpenAIAPI._group_units(units, separator, max_tokens, model)
+    
+    @staticmethod
+    def split_transcript_for_summary(transcript, max_tokens, model=None):
+        """
+        전사 결과를 타임스탬프가 포함된 세그먼트 경계에서 토큰 예산에 맞는 구간들로 나눕니다.
+        
+        Args:
+            transcript (Transcript): 전사 결과
+            max_tokens (int): 구간 하나의 최대 토큰 수
+            model (str, optional): 토큰 수를 셀 모델 (tiktoken이 없으면 추정)
+            
+        Returns:
+            list: 구간 텍스트 목록 ("[HH:MM:SS - HH:MM:SS] 텍스트" 줄을 빈 줄로 구분)
+        """
+        lines = list(transcript.timestamped_lines())
+        if sum(count_tokens(line, model) for line in lines) <= max_tokens:
+            return ["".join(f"{line}\n\n" for line in lines)]
+        
+        return OpenAIAPI._group_units(lines, "\n\n", max_tokens, model)
+    
+    @staticmethod
+    def _group_units(units, separator, max_tokens, model=None):
+        """
+        세그먼트/문장 목록을 순서대로 묶어 토큰 예산에 맞는 구간들을 만듭니다.
+        
+        Args:
+            units (list): 세그먼트 또는 문장 목록
+            separator (str): 구간 안에서 단위 사이에 넣을 구분자
+            max_tokens (int): 구간 하나의 최대 토큰 수
+            model (str, optional): 토큰 수를 셀 모델
+            
+        Returns:
+            list: 구간 텍스트 목록
+        """
+        chunks = []
+        current = []
+        current_tokens = 0
+        for unit in units:
+            if not unit.strip():
+                continue
+            unit_tokens = count_tokens(unit, model)
+            
+            # 세그먼트 하나가 예산보다 크면 글자 단위로 자르기
+            if unit_tokens > max_tokens:
+                if current:
+                    chunks.append(separator.join(current))
+                    current, current_tokens = [], 0
+                step = max(1, len(unit) * max_tokens // unit_tokens)
+                chunks.extend(unit[i:i + step] for i in range(0, len(unit), step))
+                continue
+            
+            if current and current_tokens + unit_tokens > max_tokens:
+                chunks.append(separator.join(current))
+                current, current_tokens = [], 0
+            current.append(unit)
+            current_tokens += unit_tokens
+        
+        if current:
+            chunks.append(separator.join(current))
+        
+        return chunks
+    
+    def _summarize_chunks(self, chunks, cache, max_workers, model=None):
+        """
+        구간들을 동시에 요약합니다.
+        
+        Args:
+            chunks (list): 구간 텍스트 목록
+            cache (FileCache, optional): 요약 캐시
+            max_workers (int): 동시에 실행할 최대 요청 수
+            model (str, optional): 먼저 시도할 모델
+            
+        Returns:
+            list: 구간 순서대로 정렬된 요약 목록
+        """
+        summaries = [None] * len(chunks)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+            futures = {
+                executor.submit(
+                    self._request_summary,
+                    f"{PARTIAL_SUMMARY_PROMPT.format(index=index + 1, total=len(chunks))}\n{chunk}",
+                    cache,
+                    None,
+                    model
+                ): index
+                for index, chunk in enumerate(chunks)
+            }
+            try:
+                completed = 0
+                for future in as_completed(futures):
+                    summaries[futures[future]] = future.result()
+                    completed += 1
+                    print(f"구간 요약 완료 ({completed}/{len(chunks)})")
+            except Exception:
+                for pending in futures:
+                    pending.cancel()
+                raise
+        
+        return summaries
+    
+    def _request_summary(self, prompt, cache=None, on_delta=None, model=None):
+        """
+        요약 프롬프트로 ChatCompletion을 요청합니다.
+        
+        model부터 시작해 요약 모델을 차례로 시도하되, 보내기 전에 토큰 수를 세어 컨텍스트에 들어가지 않거나
+        circuit breaker가 열린 모델은 요청하지 않고 건너뜁니다. 모델을 사용할 수 없다는 응답(403/404)을 받으면
+        그 모델의 circuit breaker를 바로 열어, 이후 작업은 대기 시간 동안 대체 모델로 바로 보냅니다.
+        스트리밍 중 응답 조각을 이미 on_delta로 보낸 뒤 실패하면 대체 모델로 바꾸지 않고 오류를 그대로 전달합니다.
+        
+        Args:
+            prompt (str): 사용자 메시지로 보낼 프롬프트
+            cache (FileCache, optional): 요약 캐시
+            on_delta (callable, optional): 응답을 스트리밍으로 받을 때 조각마다 호출할 함수
+            model (str, optional): 먼저 시도할 모델. 기본값은 select_summary_model().
+            
+        Returns:
+            str: 응답 텍스트
+            
+        Raises:
+            APIError: 모든 모델이 실패했거나 보낼 수 있는 모델이 없는 경우
+        """
+        messages = [
+            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+        
+        preferred = model or self.select_summary_model()
+        candidates = [preferred] + [other for other in self.summary_models() if other != preferred]
+        last_error = None
+        skipped = []
+        
+        # 화면에 보낸 조각이 있는지 기록 (있으면 대체 모델의 출력이 이어 붙지 않도록 모델을 바꾸지 않음)
+        delivered = []
+        forward_delta = None
+        if on_delta is not None:
+            def forward_delta(delta):
+                delivered.append(len(delta))
+                on_delta(delta)
+        
+        for candidate in candidates:
+            spec = OpenAIAPI.summary_model_spec(candidate)
+            prompt_tokens = count_message_tokens(messages, candidate)
+            if prompt_tokens + OpenAIAPI._output_tokens(spec) > spec["context_tokens"]:
+                skipped.append(f"{candidate}: 입력 {prompt_tokens} 토큰이 컨텍스트에 들어가지 않음")
+                continue
+            if not self.circuit_breaker.allow(candidate):
+                skipped.append(f"{candidate}: 최근 실패로 사용 중지")
+                continue
+            
+            if candidate != SUMMARY_MODEL:
+                print(f"경고: {SUMMARY_MODEL} 모델을 사용할 수 없어 {candidate}로 대체합니다.")
+            try:
+                content = self._create_chat_completion(
+                    candidate,
+                    messages,
+                    cache=cache,
+                    on_delta=forward_delta,
+                    **spec["params"]
+                )
+            except APIError as e:
+                print(f"API 호출 중 오류: {e}")
+                # 모델을 사용할 수 없다는 응답이나 재시도 후에도 계속되는 일시적 오류만 모델 실패로 기록
+                unavailable = e.status_code in MODEL_UNAVAILABLE_STATUS_CODES
+                if unavailable or e.retryable:
+                    if self.circuit_breaker.record_failure(candidate, trip=unavailable):
+                        print(f"{candidate} 모델을 {self.circuit_breaker.cooldown:g}초 동안 사용하지 않습니다.")
+                else:
+                    self.circuit_breaker.release(candidate)
+                # 일시적 오류(429/5xx)는 이미 같은 모델로 재시도했으므로 모델을 바꾸지 않음
+                if e.retryable or delivered:
+                    raise
+                last_error = e
+                continue
+            except BaseException:
+                # 응답 형식 오류 등 모델 상태와 관계없는 예외도 시험 요청 예약은 풀어야 다시 시도할 수 있음
+                self.circuit_breaker.release(candidate)
+                raise
+            
+            self.circuit_breaker.record_success(candidate)
+            return content
+        
+        for reason in skipped:
+            print(f"요약 모델 건너뜀 - {reason}")
+        if last_error is not None:
+            raise last_error
+        raise APIError(f"요약 요청을 보낼 수 있는 모델이 없습니다. ({'; '.join(skipped)})")
+    
+    def _create_chat_completion(self, model, messages, cache=None, on_delta=None, **params):
+        """
+        ChatCompletion API를 호출하고, 캐시가 주어지면 결과를 재사용합니다.
+        
+        캐시 키는 모델, 전체 메시지(프롬프트 템플릿 포함), 생성 옵션의 해시이므로
+        프롬프트 템플릿이 바뀌면 기존 항목은 자동으로 사용되지 않습니다.
+        
+        Args:
+            model (str): 사용할 모델
+            messages (list): 대화 메시지 목록
+            cache (FileCache, optional): 요약 캐시
+            on_delta (callable, optional): 주어지면 응답을 토큰 스트림(SSE)으로 받아 조각마다 호출.
+                                           캐시 키에는 포함되지 않으며, 캐시 적중 시 전체 텍스트로 한 번 호출.
+            **params: 생성 옵션 (max_tokens, temperature 등)
+            
+        Returns:
+            str: 응답 텍스트
+        """
+        cache_key = None
+        if cache is not None:
+            cache_key = make_cache_key(model, messages, params)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                print(f"캐시된 요약 사용 (모델: {model})")
+                if on_delta is not None:
+                    on_delta(cached["content"])
+                return cached["content"]
+        
+        if on_delta is None:
+            response = self.http.request(
+                "POST", "chat/completions",
+                json={"model": model, "messages": messages, **params}
+            )
+            content = response.json()["choices"][0]["message"]["content"]
+        else:
+            content = self._stream_chat_completion(model, messages, on_delta, params)
+        
+        if cache is not None:
+            cache.put(cache_key, {"model": model, "content": content})
+        
+        return content 
+    
+    def _stream_chat_completion(self, model, messages, on_delta, params):
+        """
+        ChatCompletion 응답을 토큰 스트림으로 받습니다.
+        
+        Args:
+            model (str): 사용할 모델
+            messages (list): 대화 메시지 목록
+            on_delta (callable): 받은 텍스트 조각마다 호출할 함수
+            params (dict): 생성 옵션
+            
+        Returns:
+            str: 전체 응답 텍스트
+        """
+        response = self.http.request(
+            "POST", "chat/completions",
+            json={"model": model, "messages": messages, "stream": True, **params},
+            stream=True
+        )
+        
+        pieces = []
+        for event in self.http.iter_events(response):
+            for choice in event.get("choices", []):
+                delta = (choice.get("delta") or {}).get("content")
+                if delta:
+                    pieces.append(delta)
+                    on_delta(delta)
+        return "".join(pieces)
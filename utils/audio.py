@@ -1,30 +1,215 @@
 import os
-from pydub import AudioSegment
+import re
+import math
+import array
+import operator
+import time
+import bisect
+import collections
 import tempfile
 import sys
+import json
 import subprocess
 
-# 프로젝트 경로 내의 ffmpeg.exe 파일 경로 설정
-current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-ffmpeg_path = os.path.join(current_dir, "ffmpeg.exe")
-ffprobe_path = os.path.join(current_dir, "ffprobe.exe")
+try:
+    import audioop
+except ImportError:
+    # Python 3.13부터 audioop이 제거됨 (audioop-lts를 설치하면 같은 이름으로 사용 가능, 없으면 _pcm_rms에서 직접 계산)
+    audioop = None
+
+from utils.environment import find_ffmpeg, find_ffprobe
+from utils.transcript import format_timestamp
 
 # Whisper API 파일 크기 제한 (25MB = 26,214,400 바이트)
 MAX_FILE_SIZE = 25 * 1024 * 1024  # 25MB in bytes
 
-# ffmpeg.exe가 존재하는지 확인하고 경로 설정
-if os.path.exists(ffmpeg_path):
-    AudioSegment.converter = ffmpeg_path
-    print(f"ffmpeg.exe 경로 설정: {ffmpeg_path}")
-    
-# ffprobe.exe가 존재하는지 확인하고 경로 설정
-if os.path.exists(ffprobe_path):
-    AudioSegment.ffprobe = ffprobe_path
-    print(f"ffprobe.exe 경로 설정: {ffprobe_path}")
-elif os.path.exists(ffmpeg_path):
-    # ffprobe.exe가 없지만 ffmpeg.exe가 있는 경우, ffmpeg.exe를 ffprobe.exe로도 사용
-    AudioSegment.ffprobe = ffmpeg_path
-    print(f"ffprobe.exe가 없어 ffmpeg.exe를 사용: {ffmpeg_path}")
+# 청크 분할 모드 설정 (길이를 알 수 없을 때 사용할 비트레이트)
+CHUNK_BITRATE_BPS = 64000
+# 청크 하나의 최대 길이 (병렬 전사를 위해 API 제한보다 짧게 유지)
+CHUNK_MAX_DURATION_MS = 10 * 60 * 1000  # 10분
+# 청크 경계 직전에서 분할 지점(무음)을 찾는 구간 길이
+SILENCE_SEARCH_WINDOW_MS = 30 * 1000
+# 분할 지점으로 인정할 최소 무음 길이
+SILENCE_MIN_LEN_MS = 500
+# 평균 음량보다 이 값(dB)만큼 작으면 무음으로 판단
+SILENCE_THRESH_OFFSET_DB = 16
+
+# 무음 제거(VAD) 설정: 긴 무음 구간은 앞뒤로 이 길이만 남기고 잘라냄
+VAD_PAD_MS = 500
+
+# 스트리밍 변환 설정 (16kHz 모노 16bit PCM)
+PCM_SAMPLE_RATE = 16000
+PCM_SAMPLE_WIDTH = 2
+PCM_BYTES_PER_MS = PCM_SAMPLE_RATE * PCM_SAMPLE_WIDTH // 1000
+# ffmpeg 디코더 출력에서 한 번에 읽는 고정 블록 크기 (100ms)
+PCM_BLOCK_SIZE = PCM_BYTES_PER_MS * 100
+
+# 비트레이트 계획 설정 (단일 파일 변환과 청크 변환에서 길이로 한 번만 계산)
+# 16kHz(MPEG-2 Layer III) 모노에서 사용할 수 있는 MP3 비트레이트 (낮은 순)
+MP3_BITRATES_KBPS = (8, 16, 24, 32, 40, 48, 56, 64)
+# 컨테이너/헤더 오버헤드를 고려해 제한의 95%만 사용
+FILE_SIZE_MARGIN = 0.95
+
+# Whisper API가 그대로 받는 파일 확장자 (변환 없이 업로드 가능)
+UPLOAD_EXTENSIONS = {'.flac', '.m4a', '.mp3', '.mp4', '.mpeg', '.mpga', '.oga', '.ogg', '.wav', '.webm'}
+# 그대로 업로드할 수 있는 오디오 코덱
+UPLOAD_CODECS = {'mp3', 'aac', 'flac', 'opus', 'vorbis', 'pcm_s16le'}
+# 비디오에서 재인코딩 없이 복사(stream copy)할 수 있는 오디오 코덱과 저장할 확장자
+STREAM_COPY_EXTENSIONS = {
+    'mp3': '.mp3',
+    'aac': '.m4a',
+    'flac': '.flac',
+    'opus': '.ogg',
+    'vorbis': '.ogg'
+}
+# 그대로 업로드할 최대 채널 수 (다채널 오디오는 모노로 변환)
+UPLOAD_MAX_CHANNELS = 2
+
+def _ffmpeg_binary():
+    """ffmpeg 실행 파일 경로 (프로젝트 폴더의 ffmpeg.exe 또는 PATH의 ffmpeg)"""
+    return find_ffmpeg()[0] or "ffmpeg"
+
+def _pcm_rms(block):
+    """
+    16bit little-endian PCM 블록의 RMS 음량을 계산합니다. (audioop.rms와 같은 값)
+    
+    Args:
+        block (bytes): PCM 블록
+        
+    Returns:
+        int: RMS 음량
+    """
+    # 마지막 블록이 샘플 경계에서 끝나지 않으면 남는 바이트는 제외
+    block = block[:len(block) - len(block) % PCM_SAMPLE_WIDTH]
+    if audioop is not None:
+        return audioop.rms(block, PCM_SAMPLE_WIDTH)
+    
+    samples = array.array('h', block)
+    if not samples:
+        return 0
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return int(math.sqrt(sum(map(operator.mul, samples, samples)) / len(samples)))
+
+class TimelineMap:
+    """무음을 제거한 오디오의 시간을 원본 오디오의 시간으로 되돌리는 변환표"""
+    
+    def __init__(self, anchors=None):
+        """
+        TimelineMap 초기화
+        
+        Args:
+            anchors (list, optional): (무음 제거 후 시간(ms), 원본 시간(ms)) 기준점 목록.
+                                      각 기준점부터 다음 기준점까지는 두 시간이 같은 속도로 흐름.
+        """
+        self.anchors = [tuple(anchor) for anchor in anchors] if anchors else [(0, 0)]
+        self._compressed = [compressed for compressed, _ in self.anchors]
+    
+    def add_gap(self, compressed_ms, original_ms):
+        """
+        무음을 잘라낸 지점을 기록합니다.
+        
+        Args:
+            compressed_ms (int): 무음 제거 후 오디오에서 다시 소리가 시작되는 시간
+            original_ms (int): 원본 오디오에서 다시 소리가 시작되는 시간
+        """
+        self.anchors.append((compressed_ms, original_ms))
+        self._compressed.append(compressed_ms)
+    
+    @property
+    def removed_ms(self):
+        """잘라낸 무음의 총 길이 (밀리초)"""
+        compressed, original = self.anchors[-1]
+        return original - compressed
+    
+    def to_original(self, seconds, is_end=False):
+        """
+        무음 제거 후 시간(초)을 원본 시간(초)으로 변환합니다.
+        
+        잘라낸 지점과 정확히 같은 시간은 시작 시간이면 무음 뒤(다시 소리가 시작되는 시간)로,
+        종료 시간이면 무음 앞으로 변환하여 세그먼트가 잘라낸 무음을 덮지 않도록 합니다.
+        
+        Args:
+            seconds (float): 무음 제거 후 오디오 기준 시간 (초)
+            is_end (bool): 세그먼트 종료 시간인지 여부
+            
+        Returns:
+            float: 원본 오디오 기준 시간 (초)
+        """
+        search = bisect.bisect_left if is_end else bisect.bisect_right
+        index = search(self._compressed, seconds * 1000) - 1
+        compressed, original = self.anchors[max(index, 0)]
+        return seconds + (original - compressed) / 1000
+    
+    def remap(self, transcript):
+        """
+        전사 결과의 세그먼트 시간을 원본 시간으로 변경합니다.
+        
+        Args:
+            transcript (Transcript): 무음 제거 후 오디오 기준 전사 결과
+        """
+        transcript.remap_times(self.to_original, lambda seconds: self.to_original(seconds, is_end=True))
+    
+    def to_list(self):
+        """JSON으로 저장할 수 있는 기준점 목록"""
+        return [list(anchor) for anchor in self.anchors]
+
+class _Mp3StreamEncoder:
+    """PCM 블록을 ffmpeg 프로세스로 흘려보내 MP3 파일(기본값: 임시 파일)로 인코딩하는 스트림"""
+    
+    def __init__(self, bitrate, output_path=None):
+        if output_path is None:
+            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
+            output_path = temp_file.name
+            temp_file.close()
+        self.output_path = output_path
+        
+        self.bytes_written = 0
+        self.busy_seconds = 0.0  # 인코더에 데이터를 넘기거나 인코딩이 끝나기를 기다린 시간
+        self._stderr_file = tempfile.TemporaryFile()
+        self.process = subprocess.Popen(
+            [_ffmpeg_binary(), "-nostdin", "-loglevel", "error", "-y",
+             "-f", "s16le", "-ar", str(PCM_SAMPLE_RATE), "-ac", "1", "-i", "-",
+             "-b:a", bitrate, self.output_path],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=self._stderr_file
+        )
+    
+    @property
+    def duration_ms(self):
+        """지금까지 인코더에 전달된 오디오 길이 (밀리초)"""
+        return self.bytes_written // PCM_BYTES_PER_MS
+    
+    def write(self, block):
+        """PCM 블록을 인코더에 전달"""
+        start = time.perf_counter()
+        self.process.stdin.write(block)
+        self.busy_seconds += time.perf_counter() - start
+        self.bytes_written += len(block)
+    
+    def close(self):
+        """입력을 마치고 인코딩이 끝날 때까지 기다림"""
+        start = time.perf_counter()
+        self.process.stdin.close()
+        return_code = self.process.wait()
+        self.busy_seconds += time.perf_counter() - start
+        self._stderr_file.seek(0)
+        error = self._stderr_file.read().decode("utf-8", errors="replace").strip()
+        self._stderr_file.close()
+        if return_code != 0:
+            raise RuntimeError(f"MP3 인코딩 실패: {error}")
+    
+    def abort(self):
+        """인코딩을 중단하고 출력 파일 삭제"""
+        if self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+        self._stderr_file.close()
+        try:
+            os.remove(self.output_path)
+        except OSError:
+            pass
 
 class AudioProcessor:
     """오디오 파일 처리를 위한 클래스"""
@@ -32,83 +217,438 @@ class AudioProcessor:
     @staticmethod
     def convert_to_mp3(input_file_path):
         """
-        다양한 오디오/비디오 파일 형식을 MP3로 변환합니다.
+        다양한 오디오/비디오 파일 형식을 API 제한에 맞는 MP3 파일 하나로 변환합니다.
+        
+        입력 길이로부터 25MB 이내에 들어가는 비트레이트를 미리 계산하여,
+        음성에 맞춘 설정(16kHz 모노)으로 한 번만 인코딩합니다.
+        최저 비트레이트로도 제한을 넘는 긴 파일은 convert_to_mp3_chunks()로 나누어 변환해야 합니다.
         
         Args:
             input_file_path (str): 입력 파일 경로
             
         Returns:
             str: 변환된 MP3 파일의 경로 (API 제한에 맞게 처리됨)
+        
+        Raises:
+            ValueError: 파일이 너무 길어 MP3 파일 하나로는 API 제한에 맞출 수 없는 경우
         """
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
+        temp_file_path = temp_file.name
+        temp_file.close()
+        
         try:
-            file_name = os.path.basename(input_file_path)
-            file_ext = os.path.splitext(file_name)[1].lower()
+            duration = AudioProcessor.get_duration(input_file_path)
+            bitrate_kbps, max_duration = AudioProcessor.plan_encoding(duration)
+            print(f"오디오 길이: {duration}초, 인코딩 비트레이트: {bitrate_kbps}kbps")
             
-            # 임시 파일 생성
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
-            temp_file_path = temp_file.name
-            temp_file.close()
+            if max_duration is not None:
+                # 앞부분만 잘라 변환하면 전사 결과가 말없이 누락되므로 변환하지 않음
+                raise ValueError(
+                    f"파일이 너무 길어({duration:.0f}초) MP3 파일 하나로는 API 제한({MAX_FILE_SIZE // (1024 * 1024)}MB)에 "
+                    f"맞출 수 없습니다. 최대 {max_duration:.0f}초까지 가능하며, 더 긴 파일은 convert_to_mp3_chunks()로 나누어 변환하세요."
+                )
             
-            # 파일 확장자에 따라 다르게 처리
-            if file_ext in ['.mp3']:
-                # 이미 MP3 파일인 경우 복사만 수행
-                audio = AudioSegment.from_mp3(input_file_path)
-            elif file_ext in ['.wav']:
-                audio = AudioSegment.from_wav(input_file_path)
-            elif file_ext in ['.mp4', '.avi', '.mov']:
-                # 비디오 파일에서 오디오 추출
-                audio = AudioSegment.from_file(input_file_path)
-            else:
-                # 기타 형식
-                try:
-                    audio = AudioSegment.from_file(input_file_path)
-                except Exception as e:
-                    raise ValueError(f"지원하지 않는 파일 형식입니다: {file_ext}, 오류: {e}")
+            command = [_ffmpeg_binary(), "-nostdin", "-loglevel", "error", "-y",
+                       "-i", input_file_path, "-map", "0:a:0", "-vn",
+                       "-ac", "1", "-ar", str(PCM_SAMPLE_RATE), "-b:a", f"{bitrate_kbps}k",
+                       temp_file_path]
             
-            # 스테레오를 모노로 변환하여 파일 크기 줄이기
-            audio = audio.set_channels(1)
+            result = subprocess.run(command, capture_output=True)
+            if result.returncode != 0:
+                error = result.stderr.decode("utf-8", errors="replace").strip()
+                raise RuntimeError(f"MP3 인코딩 실패: {error}")
             
-            # 필요한 경우 비트레이트 조정
-            file_size = len(audio.raw_data)
-            print(f"변환 전 오디오 크기: {file_size} bytes")
+            print(f"변환 후 파일 크기: {os.path.getsize(temp_file_path)} bytes")
+            return temp_file_path
+        
+        except Exception as e:
+            print(f"오디오 변환 중 오류 발생: {e}")
+            try:
+                os.remove(temp_file_path)
+            except OSError:
+                pass
+            raise
+    
+    @staticmethod
+    def plan_encoding(duration):
+        """
+        입력 길이로 25MB 이내에 들어가는 가장 높은 MP3 비트레이트를 계산합니다.
+        
+        Args:
+            duration (float): 입력 길이 (초). 알 수 없으면 None.
+            
+        Returns:
+            tuple: (비트레이트(kbps), 최대 길이(초)).
+                   최저 비트레이트로도 제한을 넘으면 파일 하나에 담을 수 있는 최대 길이, 아니면 None.
+        """
+        if not duration:
+            print("오디오 길이를 확인할 수 없어 기본 비트레이트를 사용합니다.")
+            return CHUNK_BITRATE_BPS // 1000, None
+        
+        budget_bits = MAX_FILE_SIZE * 8 * FILE_SIZE_MARGIN
+        budget_kbps = budget_bits / duration / 1000
+        fitting = [kbps for kbps in MP3_BITRATES_KBPS if kbps <= budget_kbps]
+        if fitting:
+            return fitting[-1], None
+        
+        bitrate_kbps = MP3_BITRATES_KBPS[0]
+        return bitrate_kbps, budget_bits / (bitrate_kbps * 1000)
+    
+    @staticmethod
+    def get_duration(input_file_path):
+        """
+        입력 파일 길이를 확인합니다. (ffprobe가 없으면 ffmpeg 출력에서 확인)
+        
+        Args:
+            input_file_path (str): 입력 파일 경로
             
-            # 파일 크기가 API 제한을 초과하는 경우
-            if file_size > MAX_FILE_SIZE:
-                print(f"파일 크기가 API 제한(25MB)을 초과합니다. 오디오 품질을 조정합니다.")
+        Returns:
+            float: 길이 (초). 확인할 수 없으면 None.
+        """
+        info = AudioProcessor.probe_audio(input_file_path)
+        if info is not None and info["duration"]:
+            return info["duration"]
+        
+        result = subprocess.run(
+            [_ffmpeg_binary(), "-nostdin", "-hide_banner", "-i", input_file_path],
+            capture_output=True
+        )
+        match = re.search(rb"Duration: (\d+):(\d+):(\d+(?:\.\d+)?)", result.stderr)
+        if match is None:
+            return None
+        hours, minutes, seconds = match.groups()
+        return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+    
+    @staticmethod
+    def probe_audio(input_file_path):
+        """
+        ffprobe로 파일의 컨테이너와 첫 번째 오디오 스트림 정보를 확인합니다.
+        
+        Args:
+            input_file_path (str): 입력 파일 경로
+            
+        Returns:
+            dict: codec, channels, bit_rate, duration, size, has_video.
+                  ffprobe가 없거나 오디오 스트림을 찾지 못하면 None.
+        """
+        ffprobe_path = find_ffprobe()
+        if not ffprobe_path:
+            return None
+        
+        try:
+            result = subprocess.run(
+                [ffprobe_path, "-v", "error", "-print_format", "json",
+                 "-show_format", "-show_streams", input_file_path],
+                capture_output=True, check=True, timeout=30
+            )
+            info = json.loads(result.stdout)
+        except (OSError, subprocess.SubprocessError, ValueError) as e:
+            print(f"ffprobe 실행 중 오류 발생: {e}")
+            return None
+        
+        streams = info.get("streams", [])
+        audio_streams = [stream for stream in streams if stream.get("codec_type") == "audio"]
+        if not audio_streams:
+            return None
+        
+        audio = audio_streams[0]
+        file_format = info.get("format", {})
+        # 표지 이미지(attached_pic)는 비디오로 보지 않음
+        has_video = any(
+            stream.get("codec_type") == "video"
+            and not stream.get("disposition", {}).get("attached_pic")
+            for stream in streams
+        )
+        
+        def to_number(value, cast):
+            try:
+                return cast(value)
+            except (TypeError, ValueError):
+                return None
+        
+        return {
+            "codec": audio.get("codec_name"),
+            "channels": to_number(audio.get("channels"), int),
+            "bit_rate": to_number(audio.get("bit_rate"), int),
+            "duration": to_number(file_format.get("duration"), float),
+            "size": os.path.getsize(input_file_path),
+            "audio_streams": len(audio_streams),
+            "has_video": has_video
+        }
+    
+    @staticmethod
+    def prepare_for_upload(input_file_path, output_dir=None, metrics=None):
+        """
+        재인코딩 없이 API에 보낼 수 있는 경우 변환을 건너뜁니다.
+        
+        - 이미 API 제한에 맞는 오디오 파일은 그대로 사용합니다.
+        - 비디오의 오디오 트랙이 지원 코덱이면 stream copy로 오디오만 추출합니다.
+        
+        Args:
+            input_file_path (str): 입력 파일 경로
+            output_dir (str, optional): 추출한 오디오를 저장할 디렉토리. 기본값은 임시 파일.
+            metrics (JobMetrics, optional): 정보 확인(probe)과 추출(extract) 시간을 기록할 객체
+            
+        Returns:
+            list: (업로드할 파일 경로, 0.0) 튜플 하나로 된 목록. 변환이 필요하면 None.
+        """
+        probe_start = time.perf_counter()
+        info = AudioProcessor.probe_audio(input_file_path)
+        if metrics is not None:
+            metrics.record("probe", probe_start)
+        if info is None:
+            return None
+        
+        print(f"오디오 정보: 코덱 {info['codec']}, 채널 {info['channels']}, "
+              f"길이 {info['duration']}초, 크기 {info['size']} bytes")
+        
+        if info["channels"] is None or info["channels"] > UPLOAD_MAX_CHANNELS:
+            return None
+        
+        # 1. 그대로 업로드 가능한 오디오 파일
+        file_ext = os.path.splitext(input_file_path)[1].lower()
+        if (not info["has_video"] and info["audio_streams"] == 1
+                and file_ext in UPLOAD_EXTENSIONS and info["codec"] in UPLOAD_CODECS
+                and info["size"] <= MAX_FILE_SIZE):
+            print("변환 없이 원본 파일을 업로드합니다.")
+            return [(input_file_path, 0.0)]
+        
+        # 2. 오디오 트랙만 재인코딩 없이 추출
+        extension = STREAM_COPY_EXTENSIONS.get(info["codec"])
+        if extension is None:
+            return None
+        
+        # 추출 전에 예상 크기가 제한을 넘으면 바로 변환으로 넘어감
+        if info["bit_rate"] and info["duration"]:
+            if info["bit_rate"] * info["duration"] / 8 > MAX_FILE_SIZE:
+                return None
+        
+        if output_dir is not None:
+            output_path = os.path.join(output_dir, f"audio{extension}")
+        else:
+            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=extension)
+            output_path = temp_file.name
+            temp_file.close()
+        
+        extract_start = time.perf_counter()
+        try:
+            subprocess.run(
+                [_ffmpeg_binary(), "-nostdin", "-loglevel", "error", "-y",
+                 "-i", input_file_path, "-map", "0:a:0", "-vn", "-c:a", "copy", output_path],
+                capture_output=True, check=True
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"오디오 트랙 추출 중 오류 발생: {e}")
+            output_size = None
+        else:
+            output_size = os.path.getsize(output_path)
+        if metrics is not None:
+            metrics.record("extract", extract_start, output_bytes=output_size or 0)
+        
+        if output_size is None or output_size > MAX_FILE_SIZE:
+            try:
+                os.remove(output_path)
+            except OSError:
+                pass
+            return None
+        
+        print(f"오디오 트랙을 재인코딩 없이 추출했습니다. ({output_size} bytes)")
+        return [(output_path, 0.0)]
+    
+    @staticmethod
+    def convert_to_mp3_chunks(input_file_path, max_chunk_duration_ms=CHUNK_MAX_DURATION_MS, output_dir=None,
+                              timeline_map=None, metrics=None, bitrate_kbps=None):
+        """
+        오디오를 무음 구간 기준으로 나누어 API 제한보다 작은 여러 MP3 청크로 변환합니다.
+        
+        ffmpeg 디코더 출력(16kHz 모노 PCM)을 고정 크기 블록 단위로 읽어 바로 청크 인코더에
+        전달하므로, 입력 길이와 관계없이 메모리 사용량이 일정하게 유지됩니다.
+        긴 녹음을 잘라내지 않고 전체를 전사할 수 있도록, 각 청크는 시작 오프셋과 함께 반환됩니다.
+        비트레이트는 청크 최대 길이로부터 plan_encoding()으로 한 번만 계산하며, 모든 청크를 한 번씩만 인코딩합니다.
+        
+        timeline_map을 전달하면 무음 제거(VAD)를 함께 수행합니다. 블록 음량으로 말소리 여부를
+        판단하여, 긴 무음 구간은 앞뒤로 VAD_PAD_MS만 남기고 인코더에 전달하지 않으며,
+        잘라낸 위치를 timeline_map에 기록합니다. 이때 청크 오프셋은 무음 제거 후 시간 기준입니다.
+        
+        Args:
+            input_file_path (str): 입력 파일 경로
+            max_chunk_duration_ms (int): 청크 하나의 최대 길이 (밀리초)
+            output_dir (str, optional): 청크를 저장할 디렉토리. 기본값은 임시 파일.
+            timeline_map (TimelineMap, optional): 무음 제거 시 시간 변환표를 기록할 객체
+            metrics (JobMetrics, optional): 디코딩(decode)과 인코딩(encode) 시간을 기록할 객체.
+                                            두 과정이 번갈아 진행되므로 각각 디코더 출력을 기다린 시간과
+                                            인코더에 데이터를 넘기고 인코딩 완료를 기다린 시간의 합으로 기록
+            bitrate_kbps (int, optional): 인코딩 비트레이트 (kbps). 기본값은 청크 최대 길이로 계획한 값.
+            
+        Returns:
+            list: (청크 MP3 파일 경로, 시작 오프셋(초)) 튜플 목록
+        """
+        if bitrate_kbps is None:
+            bitrate_kbps, _ = AudioProcessor.plan_encoding(max_chunk_duration_ms / 1000)
+        print(f"청크 인코딩 비트레이트: {bitrate_kbps}kbps")
+        # 비트레이트 기준으로 25MB 이내에 들어가는 최대 길이로 제한
+        size_limited_ms = int(MAX_FILE_SIZE * 8 / (bitrate_kbps * 1000) * 1000 * FILE_SIZE_MARGIN)
+        max_chunk_duration_ms = min(max_chunk_duration_ms, size_limited_ms)
+        # 너무 짧은 청크가 생기지 않도록 청크 후반부에서만 분할 지점을 탐색
+        search_start_ms = max(max_chunk_duration_ms - SILENCE_SEARCH_WINDOW_MS, max_chunk_duration_ms // 2)
+        silence_ratio = 10 ** (-SILENCE_THRESH_OFFSET_DB / 20)
+        
+        remove_silence = timeline_map is not None
+        pad_blocks = max(1, VAD_PAD_MS * PCM_BYTES_PER_MS // PCM_BLOCK_SIZE)
+        # 무음이 길어질 때 다음 말소리 앞에 붙일 마지막 무음 블록
+        held_blocks = collections.deque(maxlen=pad_blocks)
+        dropped_ms = 0  # 현재 무음 구간에서 잘라낸 길이
+        
+        chunks = []
+        encoder = None
+        position_ms = 0  # 원본 기준 현재 위치
+        output_ms = 0  # 인코더에 전달한 전체 길이 (무음 제거 후 기준)
+        silent_ms = 0  # 현재까지 이어진 무음 길이
+        energy_sum = 0.0  # 평균 음량 계산용 누적 에너지
+        sample_count = 0
+        
+        convert_start = time.perf_counter()
+        decode_stats = {"seconds": 0.0, "bytes": 0}
+        encode_seconds = 0.0
+        blocks = AudioProcessor._iter_pcm_blocks(input_file_path, stats=decode_stats)
+        try:
+            for block in blocks:
+                block_ms = len(block) // PCM_BYTES_PER_MS
+                position_ms += block_ms
+                
+                # 지금까지의 평균 음량 대비 작은 블록을 무음으로 판단
+                samples = len(block) // PCM_SAMPLE_WIDTH
+                rms = _pcm_rms(block)
+                energy_sum += rms * rms * samples
+                sample_count += samples
+                silent = rms <= math.sqrt(energy_sum / sample_count) * silence_ratio
+                
+                if not remove_silence:
+                    pending = [block]
+                elif silent and silent_ms >= VAD_PAD_MS:
+                    # 말소리 뒤 VAD_PAD_MS를 넘는 무음은 보류하고, 보류 범위를 넘으면 버림
+                    if len(held_blocks) == held_blocks.maxlen:
+                        dropped_ms += len(held_blocks[0]) // PCM_BYTES_PER_MS
+                    held_blocks.append(block)
+                    pending = []
+                elif silent:
+                    pending = [block]
+                else:
+                    # 말소리가 다시 시작되면 보류한 무음을 앞에 붙이고, 잘라낸 위치를 기록
+                    if dropped_ms:
+                        held_ms = sum(len(held) for held in held_blocks) // PCM_BYTES_PER_MS
+                        timeline_map.add_gap(output_ms, position_ms - block_ms - held_ms)
+                        dropped_ms = 0
+                    pending = list(held_blocks) + [block]
+                    held_blocks.clear()
+                
+                silent_ms = silent_ms + block_ms if silent else 0
+                if not pending:
+                    continue
                 
-                # 64Kbps 비트레이트로 압축하여 파일 크기 줄이기
-                bitrate = "64k"
-                audio.export(temp_file_path, format="mp3", bitrate=bitrate)
+                if encoder is None:
+                    output_path = None
+                    if output_dir is not None:
+                        output_path = os.path.join(output_dir, f"chunk_{len(chunks):03d}.mp3")
+                    encoder = _Mp3StreamEncoder(f"{bitrate_kbps}k", output_path)
+                    chunks.append((encoder.output_path, output_ms / 1000.0))
                 
-                # 압축 후에도 파일 크기가 크면 샘플링 레이트도 줄이기
-                if os.path.getsize(temp_file_path) > MAX_FILE_SIZE:
-                    print("추가 압축이 필요합니다. 샘플링 레이트를 낮춥니다.")
-                    audio = audio.set_frame_rate(16000)  # 16kHz로 설정
-                    audio.export(temp_file_path, format="mp3", bitrate=bitrate)
+                for pending_block in pending:
+                    encoder.write(pending_block)
+                    output_ms += len(pending_block) // PCM_BYTES_PER_MS
                 
-                # 그래도 크면 오디오 길이 앞부분만 사용 (25MB 이내로)
-                if os.path.getsize(temp_file_path) > MAX_FILE_SIZE:
-                    print("파일이 여전히 큽니다. 앞부분 25MB만 처리합니다.")
-                    # 25MB 이내로 들어갈 때까지 오디오 길이 계산
-                    original_duration = len(audio)
-                    new_duration = int(original_duration * (MAX_FILE_SIZE / os.path.getsize(temp_file_path)) * 0.95)  # 95% 정도만 사용
-                    
-                    # 앞부분만 잘라내기
-                    audio = audio[:new_duration]
-                    audio.export(temp_file_path, format="mp3", bitrate=bitrate)
-                    
-                    print(f"전체 오디오 길이: {original_duration}ms, 처리할 길이: {new_duration}ms")
-                    print("주의: 파일이 너무 커서 일부만 처리됩니다. 더 정확한 전사를 원하시면 파일을 여러 개로 나누어 처리하세요.")
-            else:
-                # 파일 크기가 적당하면 그대로 내보내기
-                audio.export(temp_file_path, format="mp3")
+                chunk_ms = encoder.duration_ms
+                if chunk_ms >= max_chunk_duration_ms or (
+                        chunk_ms >= search_start_ms and silent_ms >= SILENCE_MIN_LEN_MS):
+                    encoder.close()
+                    encode_seconds += encoder.busy_seconds
+                    print(f"청크 생성: {chunks[-1][1] * 1000:.0f}ms - {output_ms}ms "
+                          f"({os.path.getsize(encoder.output_path)} bytes)")
+                    encoder = None
+                    silent_ms = 0
             
-            print(f"변환 후 파일 크기: {os.path.getsize(temp_file_path)} bytes")
-            return temp_file_path
+            if encoder is not None:
+                encoder.close()
+                encode_seconds += encoder.busy_seconds
+                print(f"청크 생성: {chunks[-1][1] * 1000:.0f}ms - {output_ms}ms "
+                      f"({os.path.getsize(encoder.output_path)} bytes)")
+                encoder = None
+            
+            if not chunks:
+                raise ValueError(f"오디오 데이터가 없습니다: {input_file_path}")
+            
+            print(f"전체 오디오 길이: {position_ms}ms, 청크 수: {len(chunks)}")
+            if metrics is not None:
+                metrics.record(
+                    "decode", convert_start, seconds=decode_stats["seconds"],
+                    input_bytes=os.path.getsize(input_file_path), pcm_bytes=decode_stats["bytes"]
+                )
+                metrics.record(
+                    "encode", convert_start, seconds=encode_seconds, chunks=len(chunks),
+                    output_bytes=sum(os.path.getsize(chunk_path) for chunk_path, _ in chunks)
+                )
+            if remove_silence:
+                print(f"무음 제거: {timeline_map.removed_ms}ms 제거, 업로드 길이 {output_ms}ms")
+            return chunks
         
         except Exception as e:
-            print(f"오디오 변환 중 오류 발생: {e}")
+            print(f"오디오 청크 변환 중 오류 발생: {e}")
+            if encoder is not None:
+                encoder.abort()
+            # 이미 생성된 청크 파일 정리
+            for chunk_path, _ in chunks:
+                try:
+                    os.remove(chunk_path)
+                except OSError:
+                    pass
             raise
+        
+        finally:
+            # 중간에 실패해도 디코더 프로세스가 남지 않도록 종료
+            blocks.close()
+    
+    @staticmethod
+    def _iter_pcm_blocks(input_file_path, block_size=PCM_BLOCK_SIZE, stats=None):
+        """
+        ffmpeg로 입력 파일을 16kHz 모노 PCM으로 디코딩하여 고정 크기 블록 단위로 반환합니다.
+        
+        Args:
+            input_file_path (str): 입력 파일 경로
+            block_size (int): 블록 크기 (바이트)
+            stats (dict, optional): 디코더 출력을 기다린 시간('seconds')과 읽은 바이트 수('bytes')를 누적할 딕셔너리
+            
+        Yields:
+            bytes: 16bit little-endian PCM 블록
+        """
+        stderr_file = tempfile.TemporaryFile()
+        process = subprocess.Popen(
+            [_ffmpeg_binary(), "-nostdin", "-loglevel", "error",
+             "-i", input_file_path, "-vn",
+             "-ac", "1", "-ar", str(PCM_SAMPLE_RATE), "-f", "s16le", "-"],
+            stdout=subprocess.PIPE,
+            stderr=stderr_file
+        )
+        try:
+            while True:
+                read_start = time.perf_counter()
+                block = process.stdout.read(block_size)
+                if stats is not None:
+                    stats["seconds"] += time.perf_counter() - read_start
+                    stats["bytes"] += len(block)
+                if not block:
+                    break
+                yield block
+            
+            if process.wait() != 0:
+                stderr_file.seek(0)
+                error = stderr_file.read().decode("utf-8", errors="replace").strip()
+                raise ValueError(f"오디오 디코딩 실패: {error}")
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+            stderr_file.close()
     
     @staticmethod
     def format_timestamp(milliseconds):
@@ -121,10 +661,4 @@ class AudioProcessor:
         Returns:
             str: HH:MM:SS 형식의 시간 문자열
         """
-        seconds = int(milliseconds / 1000)
-        hours = seconds // 3600
-        seconds %= 3600
-        minutes = seconds // 60
-        seconds %= 60
-        
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}" 
\ No newline at end of file
+        return format_timestamp(milliseconds / 1000) 
\ No newline at end of file
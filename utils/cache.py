@@ -0,0 +1,151 @@
+import os
+import json
+import hashlib
+import tempfile
+import threading
+
+# 파일 해시 계산 시 한 번에 읽는 블록 크기
+HASH_BLOCK_SIZE = 1024 * 1024
+
+def hash_file(file_path):
+    """
+    파일 내용의 SHA-256 해시를 계산합니다. (대용량 파일도 블록 단위로 읽음)
+    
+    Args:
+        file_path (str): 파일 경로
+        
+    Returns:
+        str: 16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def make_cache_key(*parts):
+    """
+    여러 값을 묶어 하나의 캐시 키를 만듭니다.
+    
+    Args:
+        *parts: JSON으로 직렬화 가능한 값들
+        
+    Returns:
+        str: 16진수 해시 문자열
+    """
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class FileCache:
+    """디렉토리에 항목별 JSON 파일로 저장하는 크기 제한 LRU 캐시"""
+    
+    def __init__(self, cache_dir, max_bytes=None, max_entries=None):
+        """
+        FileCache 클래스 초기화
+        
+        Args:
+            cache_dir (str): 캐시 파일을 저장할 디렉토리
+            max_bytes (int, optional): 캐시 전체 최대 크기 (바이트). None이면 제한 없음.
+            max_entries (int, optional): 최대 항목 수. None이면 제한 없음.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+    
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, key):
+        """
+        캐시된 값을 반환합니다. 조회된 항목은 최근 사용으로 표시됩니다.
+        
+        Args:
+            key (str): 캐시 키
+            
+        Returns:
+            캐시된 값 (없으면 None)
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+            # 파일 수정 시각을 마지막 사용 시각으로 사용 (LRU)
+            os.utime(path)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        
+        with self._lock:
+            self.hits += 1
+        return value
+    
+    def put(self, key, value):
+        """
+        값을 캐시에 저장하고 제한을 넘으면 오래된 항목부터 제거합니다.
+        
+        Args:
+            key (str): 캐시 키
+            value: JSON으로 직렬화 가능한 값
+        """
+        # 임시 파일에 쓴 뒤 교체하여 중간에 실패해도 깨진 항목이 남지 않도록 함
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(value, f, ensure_ascii=False)
+            os.replace(temp_path, self._path(key))
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        
+        self._evict()
+    
+    def _entries(self):
+        """(마지막 사용 시각, 크기, 경로) 목록"""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith('.json'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+    
+    def _evict(self):
+        """크기/개수 제한을 넘는 경우 가장 오래전에 사용된 항목부터 제거"""
+        if self.max_bytes is None and self.max_entries is None:
+            return
+        
+        with self._lock:
+            entries = sorted(self._entries())
+            total_bytes = sum(size for _, size, _ in entries)
+            
+            while entries and (
+                    (self.max_bytes is not None and total_bytes > self.max_bytes) or
+                    (self.max_entries is not None and len(entries) > self.max_entries)):
+                _, size, path = entries.pop(0)
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                total_bytes -= size
+    
+    def stats(self):
+        """
+        캐시 사용 통계를 반환합니다.
+        
+        Returns:
+            dict: hits, misses, entries, bytes
+        """
+        entries = self._entries()
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(entries),
+                "bytes": sum(size for _, size, _ in entries)
+            }
@@ -0,0 +1,256 @@
+import os
+import json
+import shutil
+import tempfile
+import uuid
+
+# 작업 디렉토리를 사용 중인 실행을 표시하는 잠금 파일 이름
+LOCK_FILE_NAME = "job.lock"
+
+class JobInProgressError(RuntimeError):
+    """같은 작업 디렉토리를 다른 실행이 사용 중임"""
+
+def _process_alive(pid):
+    """주어진 PID의 프로세스가 실행 중인지 확인 (확인할 수 없으면 실행 중으로 간주)"""
+    if pid == os.getpid():
+        return True
+    if os.name == 'nt':
+        import ctypes
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        STILL_ACTIVE = 259
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        try:
+            exit_code = ctypes.c_ulong()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return True
+            return exit_code.value == STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # 권한이 없는 경우 등: 프로세스는 존재함
+        return True
+    return True
+
+class JobCheckpoint:
+    """작업 단계별 결과(변환된 오디오, 전사 결과, 요약)를 저장하여 중단된 작업을 이어서 실행하기 위한 클래스"""
+    
+    def __init__(self, job_dir):
+        """
+        JobCheckpoint 클래스 초기화
+        
+        Args:
+            job_dir (str): 작업 체크포인트를 저장할 디렉토리 (results/jobs/<작업 ID>)
+        """
+        self.job_dir = job_dir
+        self.job_id = os.path.basename(os.path.normpath(job_dir))
+        self.audio_dir = os.path.join(job_dir, 'audio')
+        self.lock_path = os.path.join(job_dir, LOCK_FILE_NAME)
+        self._lock_token = None  # 이 객체가 잡은 잠금의 식별자 (잠그지 않았으면 None)
+        
+        os.makedirs(self.job_dir, exist_ok=True)
+    
+    def acquire(self):
+        """
+        작업 디렉토리를 잠급니다. 같은 작업을 동시에 실행하면 서로의 변환 결과와 체크포인트를 지우므로,
+        다른 실행이 사용 중이면 거부합니다. (종료된 프로세스가 남긴 잠금은 가져옴)
+        
+        Raises:
+            JobInProgressError: 다른 실행이 같은 작업을 처리 중인 경우
+        """
+        token = f"{os.getpid()}:{uuid.uuid4().hex}"
+        while True:
+            try:
+                fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                owner = self._read_lock()
+                if owner is None or _process_alive(owner[0]):
+                    raise JobInProgressError(f"같은 작업이 이미 처리 중입니다: {self.job_id}")
+                # 비정상 종료된 실행이 남긴 잠금 제거 후 다시 시도
+                self._remove_lock_if(owner[1])
+                continue
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(token)
+            self._lock_token = token
+            return
+    
+    def release(self):
+        """acquire()로 잡은 잠금을 해제합니다. (체크포인트가 이미 삭제되었거나 다른 실행의 잠금이면 그대로 둠)"""
+        if self._lock_token is not None:
+            self._remove_lock_if(self._lock_token)
+            self._lock_token = None
+    
+    def _read_lock(self):
+        """
+        잠금 파일을 읽습니다.
+        
+        Returns:
+            tuple: (PID, 잠금 식별자). 파일이 없거나 아직 기록 중이면 None.
+        """
+        try:
+            with open(self.lock_path, 'r', encoding='utf-8') as f:
+                token = f.read()
+            return int(token.split(":", 1)[0]), token
+        except (OSError, ValueError):
+            return None
+    
+    def _remove_lock_if(self, token):
+        """잠금 파일의 식별자가 token과 같을 때만 삭제"""
+        owner = self._read_lock()
+        if owner is not None and owner[1] == token:
+            try:
+                os.remove(self.lock_path)
+            except OSError:
+                pass
+    
+    def _path(self, stage, extension):
+        return os.path.join(self.job_dir, f"{stage}{extension}")
+    
+    def _write_atomic(self, path, content):
+        """임시 파일에 쓴 뒤 교체하여, 중간에 종료되어도 완료되지 않은 단계가 완료로 보이지 않도록 함"""
+        fd, temp_path = tempfile.mkstemp(dir=self.job_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    
+    def save_json(self, stage, data):
+        """
+        단계 결과를 JSON으로 저장합니다.
+        
+        Args:
+            stage (str): 단계 이름 (예: 'transcription')
+            data: JSON으로 직렬화 가능한 값
+        """
+        self._write_atomic(self._path(stage, ".json"), json.dumps(data, ensure_ascii=False))
+    
+    def load_json(self, stage):
+        """
+        저장된 단계 결과를 불러옵니다.
+        
+        Args:
+            stage (str): 단계 이름
+            
+        Returns:
+            저장된 값 (단계가 완료되지 않았으면 None)
+        """
+        try:
+            with open(self._path(stage, ".json"), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def save_text(self, stage, text):
+        """
+        단계 결과를 텍스트로 저장합니다.
+        
+        Args:
+            stage (str): 단계 이름 (예: 'summary_paragraph')
+            text (str): 저장할 텍스트
+        """
+        self._write_atomic(self._path(stage, ".txt"), text)
+    
+    def load_text(self, stage):
+        """
+        저장된 텍스트 단계 결과를 불러옵니다.
+        
+        Args:
+            stage (str): 단계 이름
+            
+        Returns:
+            str: 저장된 텍스트 (단계가 완료되지 않았으면 None)
+        """
+        try:
+            with open(self._path(stage, ".txt"), 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def save_chunks(self, chunks, timeline=None):
+        """
+        audio_dir에 변환된 청크 목록을 기록하여 변환 단계를 완료로 표시합니다.
+        
+        Args:
+            chunks (list): (청크 파일 경로, 시작 오프셋(초)) 튜플 목록.
+                           변환 없이 업로드하는 원본 파일이 포함될 수 있음.
+            timeline (list, optional): 무음 제거 시 시간 변환표 기준점 목록
+        """
+        self.save_json("converted", {
+            "chunks": [
+                {"file": self._manifest_path(chunk_path), "offset": offset}
+                for chunk_path, offset in chunks
+            ],
+            "timeline": timeline
+        })
+    
+    def _manifest_path(self, path):
+        """작업 디렉토리 안의 파일은 상대 경로로, 원본 파일처럼 바깥에 있는 파일은 절대 경로로 기록"""
+        path = os.path.abspath(path)
+        job_dir = os.path.abspath(self.job_dir)
+        try:
+            if os.path.commonpath([path, job_dir]) == job_dir:
+                return os.path.relpath(path, job_dir)
+        except ValueError:
+            # Windows에서 드라이브가 다른 경우
+            pass
+        return path
+    
+    def load_chunks(self):
+        """
+        변환 단계에서 저장한 청크 목록을 불러옵니다.
+        
+        Returns:
+            list: (청크 파일 경로, 시작 오프셋(초)) 튜플 목록. 변환이 완료되지 않았거나 파일이 없으면 None.
+        """
+        manifest = self.load_json("converted")
+        if not manifest:
+            return None
+        
+        chunks = [(os.path.join(self.job_dir, item["file"]), item["offset"]) for item in manifest["chunks"]]
+        if not all(os.path.exists(chunk_path) for chunk_path, _ in chunks):
+            return None
+        return chunks
+    
+    def load_timeline(self):
+        """
+        변환 단계에서 저장한 시간 변환표 기준점 목록을 불러옵니다.
+        
+        Returns:
+            list: 기준점 목록 (무음을 제거하지 않았으면 None)
+        """
+        manifest = self.load_json("converted")
+        return manifest.get("timeline") if manifest else None
+    
+    def prepare_audio_dir(self):
+        """
+        변환된 오디오를 저장할 빈 디렉토리를 준비합니다. (이전에 중단된 변환의 잔여 파일 제거)
+        
+        Returns:
+            str: 오디오 디렉토리 경로
+        """
+        shutil.rmtree(self.audio_dir, ignore_errors=True)
+        os.makedirs(self.audio_dir, exist_ok=True)
+        return self.audio_dir
+    
+    def remove_audio(self):
+        """전사가 완료되어 더 이상 필요 없는 변환된 오디오 삭제"""
+        shutil.rmtree(self.audio_dir, ignore_errors=True)
+        try:
+            os.remove(self._path("converted", ".json"))
+        except OSError:
+            pass
+    
+    def remove(self):
+        """작업이 완료되어 더 이상 필요 없는 체크포인트 전체 삭제 (잠금도 함께 해제됨)"""
+        shutil.rmtree(self.job_dir, ignore_errors=True)
+        self._lock_token = None
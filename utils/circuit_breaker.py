@@ -0,0 +1,107 @@
+import time
+import threading
+
+# 연속으로 이 횟수만큼 실패하면 모델을 일정 시간 사용하지 않음
+DEFAULT_FAILURE_THRESHOLD = 3
+# 모델을 사용하지 않는 시간 (초). 지나면 요청 하나로 다시 확인함
+DEFAULT_COOLDOWN_SECONDS = 300
+
+class ModelCircuitBreaker:
+    """
+    실패한 모델을 일정 시간 기억하여, 이후 작업이 그 모델에 요청하지 않고 바로 다른 모델을 사용하도록 하는 클래스
+    
+    모델별로 closed(정상) -> open(사용 안 함) -> half-open(시험 요청 하나만 허용) 상태를 가집니다.
+    연속 실패가 failure_threshold번에 이르거나 모델을 사용할 수 없다는 응답(trip)을 받으면 open이 되고,
+    cooldown 시간이 지나면 요청 하나만 보내 보아 성공하면 closed, 실패하면 다시 open이 됩니다.
+    시험 요청의 결과를 알리지 못한 채 cooldown이 다시 지나면 새 시험 요청을 허용합니다.
+    작업마다 API 클라이언트를 새로 만들어도 공유되도록 보통 SUMMARY_CIRCUIT_BREAKER 하나를 사용합니다.
+    """
+    
+    def __init__(self, failure_threshold=DEFAULT_FAILURE_THRESHOLD, cooldown=DEFAULT_COOLDOWN_SECONDS):
+        """
+        ModelCircuitBreaker 초기화
+        
+        Args:
+            failure_threshold (int): open 상태로 바꿀 연속 실패 횟수
+            cooldown (float): open 상태를 유지할 시간 (초)
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._states = {}  # 모델 -> {"failures", "opened_at", "probe_started"}
+    
+    def allow(self, model):
+        """
+        모델에 요청을 보내도 되는지 확인합니다.
+        cooldown이 지난 open 상태면 시험 요청 하나만 허용합니다.
+        (허용된 요청은 결과를 record_success/record_failure로 알리거나, 모델과 관계없는 오류면 release로 풀어야 함)
+        
+        Args:
+            model (str): 모델 이름
+        
+        Returns:
+            bool: 요청 가능 여부
+        """
+        with self._lock:
+            state = self._states.get(model)
+            if state is None or state["opened_at"] is None:
+                return True
+            now = time.monotonic()
+            if self._blocked(state, now):
+                return False
+            state["probe_started"] = now
+            return True
+    
+    def is_open(self, model):
+        """모델이 사용하지 않는 상태인지 여부 (allow()와 달리 시험 요청을 예약하지 않음)"""
+        with self._lock:
+            state = self._states.get(model)
+            if state is None or state["opened_at"] is None:
+                return False
+            return self._blocked(state, time.monotonic())
+    
+    def _blocked(self, state, now):
+        """open 상태에서 요청을 막아야 하는지 여부 (cooldown 중이거나 진행 중인 시험 요청이 있음)"""
+        if now - state["opened_at"] < self.cooldown:
+            return True
+        # 결과를 알리지 못한 시험 요청 때문에 계속 막히지 않도록 cooldown이 지나면 만료
+        return state["probe_started"] is not None and now - state["probe_started"] < self.cooldown
+    
+    def record_success(self, model):
+        """요청 성공을 기록합니다. (closed 상태로 되돌림)"""
+        with self._lock:
+            self._states.pop(model, None)
+    
+    def record_failure(self, model, trip=False):
+        """
+        요청 실패를 기록합니다.
+        
+        Args:
+            model (str): 모델 이름
+            trip (bool): 연속 실패 횟수와 관계없이 바로 open 상태로 바꿀지 여부 (모델을 사용할 수 없다는 응답 등)
+        
+        Returns:
+            bool: 이번 실패로 open 상태가 되었는지 여부
+        """
+        with self._lock:
+            state = self._states.setdefault(model, {"failures": 0, "opened_at": None, "probe_started": None})
+            state["failures"] += 1
+            was_probing = state["probe_started"] is not None
+            state["probe_started"] = None
+            if trip or was_probing or state["failures"] >= self.failure_threshold:
+                state["opened_at"] = time.monotonic()
+                return True
+            return False
+    
+    def release(self, model):
+        """
+        모델 상태와 관계없는 오류(잘못된 요청, 응답 형식 오류 등)로 끝난 요청의 시험 요청 예약을 풉니다.
+        실패로 기록하지 않으므로 open 상태는 유지되고, 다음 allow()에서 다시 시험 요청을 허용합니다.
+        
+        Args:
+            model (str): 모델 이름
+        """
+        with self._lock:
+            state = self._states.get(model)
+            if state is not None:
+                state["probe_started"] = None
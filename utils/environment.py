@@ -0,0 +1,56 @@
+import os
+import shutil
+import functools
+
+# 프로젝트 폴더 (main.py가 있는 위치)
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@functools.lru_cache(maxsize=None)
+def load_environment():
+    """
+    .env 파일을 한 번만 로드하고 OpenAI API 키를 반환합니다.
+    
+    Returns:
+        str: OPENAI_API_KEY 값 (설정되지 않았으면 None)
+    """
+    from dotenv import load_dotenv
+    
+    load_dotenv()
+    return os.getenv("OPENAI_API_KEY")
+
+def _locate_binary(name):
+    """프로젝트 폴더, 현재 폴더의 <name>.exe를 우선 찾고, 없으면 PATH에서 찾음"""
+    for directory in (PROJECT_DIR, os.getcwd()):
+        path = os.path.join(directory, f"{name}.exe")
+        if os.path.exists(path):
+            return path
+    return shutil.which(name)
+
+@functools.lru_cache(maxsize=None)
+def find_ffmpeg():
+    """
+    ffmpeg/ffprobe 실행 파일을 한 번만 찾고 결과를 재사용합니다.
+    
+    프로젝트 폴더의 ffmpeg.exe/ffprobe.exe를 우선 사용하고, 없으면 PATH에서 찾습니다.
+    ffprobe가 없으면 ffmpeg를 ffprobe로도 사용합니다.
+    
+    Returns:
+        tuple: (ffmpeg 경로, ffprobe 경로). 찾지 못한 항목은 None.
+    """
+    ffmpeg_path = _locate_binary("ffmpeg")
+    ffprobe_path = find_ffprobe() or ffmpeg_path
+    return ffmpeg_path, ffprobe_path
+
+@functools.lru_cache(maxsize=None)
+def find_ffprobe():
+    """
+    실제 ffprobe 실행 파일 경로 (ffmpeg로 대체하지 않음)
+    
+    Returns:
+        str: ffprobe 경로 (찾지 못하면 None)
+    """
+    return _locate_binary("ffprobe")
+
+def has_ffmpeg():
+    """ffmpeg 사용 가능 여부"""
+    return find_ffmpeg()[0] is not None
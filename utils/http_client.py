@@ -0,0 +1,216 @@
+import time
+import json
+import random
+import threading
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+# 기본 타임아웃 (초): 연결 / 응답 대기
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_READ_TIMEOUT = 600
+
+# 재시도 설정
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BACKOFF_BASE = 1.0  # 첫 재시도 최대 대기 시간 (초)
+DEFAULT_BACKOFF_MAX = 30.0  # 재시도 대기 시간 상한 (초)
+# 서버가 Retry-After로 요청한 대기 시간은 이 값까지 그대로 따르고, 더 길면 기다리지 않고 실패 처리 (초)
+DEFAULT_RETRY_AFTER_MAX = 120.0
+
+# 연결 풀 크기 (동시에 유지할 keep-alive 연결 수)
+DEFAULT_POOL_SIZE = 16
+
+# 일시적인 오류로 보고 재시도하는 HTTP 상태 코드
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+class APIError(Exception):
+    """HTTP API 호출 실패"""
+    
+    def __init__(self, message, status_code=None, retryable=False):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retryable = retryable
+
+class StreamInterrupted(APIError):
+    """스트리밍 응답을 받는 도중 연결이 끊기거나 잘못된 데이터를 받음 (이미 받은 조각이 있을 수 있음)"""
+
+class HTTPClient:
+    """연결 풀(keep-alive)과 지수 백오프 재시도를 지원하는 HTTP 클라이언트"""
+    
+    def __init__(self, base_url, headers=None,
+                 connect_timeout=DEFAULT_CONNECT_TIMEOUT, read_timeout=DEFAULT_READ_TIMEOUT,
+                 max_retries=DEFAULT_MAX_RETRIES, backoff_base=DEFAULT_BACKOFF_BASE,
+                 backoff_max=DEFAULT_BACKOFF_MAX, retry_after_max=DEFAULT_RETRY_AFTER_MAX,
+                 pool_size=DEFAULT_POOL_SIZE):
+        """
+        HTTPClient 클래스 초기화
+        
+        Args:
+            base_url (str): 모든 요청 경로 앞에 붙는 기본 URL
+            headers (dict, optional): 모든 요청에 포함할 헤더
+            connect_timeout (float): 연결 타임아웃 (초)
+            read_timeout (float): 응답 대기 타임아웃 (초)
+            max_retries (int): 일시적 오류 시 최대 재시도 횟수
+            backoff_base (float): 첫 재시도의 최대 대기 시간 (초). 재시도마다 두 배로 증가.
+            backoff_max (float): 재시도 대기 시간 상한 (초). 서버가 Retry-After를 보내지 않은 경우에 적용.
+            retry_after_max (float): 서버가 요청한 재시도 대기 시간(Retry-After)을 따를 최대 시간 (초).
+                                     이보다 길면 일찍 재시도해 다시 429를 받지 않도록 바로 실패 처리.
+            pool_size (int): 연결 풀 크기
+        """
+        self.base_url = base_url.rstrip('/')
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_after_max = retry_after_max
+        self.retry_count = 0  # 지금까지 재시도한 횟수 (통계용)
+        self._lock = threading.Lock()
+        
+        # requests는 불러오는 데 시간이 걸리므로 클라이언트를 만들 때 불러옴
+        import requests
+        from requests.adapters import HTTPAdapter
+        self._requests = requests
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        if headers:
+            self.session.headers.update(headers)
+    
+    def request(self, method, path, timeout=None, **kwargs):
+        """
+        요청을 보내고, 429/5xx 및 연결 오류는 지수 백오프(jitter 포함)로 재시도합니다.
+        서버가 Retry-After 헤더를 보내면 그 시간만큼 기다리며, retry_after_max보다 길면 재시도하지 않습니다.
+        
+        Args:
+            method (str): HTTP 메서드
+            path (str): base_url 기준 경로
+            timeout (tuple, optional): (연결, 응답 대기) 타임아웃. 기본값은 클라이언트 설정.
+            **kwargs: requests에 전달할 인자 (json, data, files, stream 등)
+            
+        Returns:
+            requests.Response: 성공한 응답
+            
+        Raises:
+            APIError: 재시도 후에도 실패하거나 재시도할 수 없는 오류인 경우
+        """
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        attempt = 0
+        
+        while True:
+            # 재시도 시 업로드 파일을 처음부터 다시 읽도록 되감기
+            for file_tuple in (kwargs.get('files') or {}).values():
+                if isinstance(file_tuple, tuple) and hasattr(file_tuple[1], 'seek'):
+                    file_tuple[1].seek(0)
+            
+            retry_after = None
+            try:
+                response = self.session.request(method, url, timeout=timeout or self.timeout, **kwargs)
+            except (self._requests.ConnectionError, self._requests.Timeout) as e:
+                error = APIError(f"연결 오류: {e}", retryable=True)
+            else:
+                if response.status_code < 400:
+                    return response
+                
+                retryable = response.status_code in RETRYABLE_STATUS_CODES
+                error = APIError(
+                    f"HTTP {response.status_code}: {self._error_message(response)}",
+                    status_code=response.status_code,
+                    retryable=retryable
+                )
+                retry_after = self._retry_after(response)
+                response.close()
+            
+            if not error.retryable or attempt >= self.max_retries:
+                raise error
+            if retry_after is not None and retry_after > self.retry_after_max:
+                raise APIError(
+                    f"{error} (서버가 요청한 재시도 대기 시간 {retry_after:.0f}초가 "
+                    f"상한 {self.retry_after_max:g}초를 넘어 재시도하지 않음)",
+                    status_code=error.status_code,
+                    retryable=True
+                )
+            
+            delay = retry_after if retry_after is not None else self._backoff_delay(attempt)
+            attempt += 1
+            with self._lock:
+                self.retry_count += 1
+            print(f"{error} - {delay:.1f}초 후 재시도 ({attempt}/{self.max_retries})")
+            time.sleep(delay)
+    
+    def iter_events(self, response):
+        """
+        스트리밍 응답(text/event-stream)의 data 이벤트를 JSON으로 읽어 차례대로 반환합니다.
+        
+        Args:
+            response (requests.Response): stream=True로 받은 응답
+            
+        Yields:
+            dict: 이벤트 데이터 ("data: [DONE]"을 받으면 종료)
+            
+        Raises:
+            StreamInterrupted: 스트림을 읽는 중 연결이 끊기거나 잘못된 데이터를 받은 경우
+        """
+        try:
+            # chunk_size=None: 고정 크기로 모으지 않고 서버가 보낸 조각을 도착하는 대로 처리
+            for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+                # 빈 줄은 이벤트 구분자, ':'로 시작하는 줄은 주석(keep-alive)
+                if not line or not line.startswith('data:'):
+                    continue
+                data = line[5:].strip()
+                if data == '[DONE]':
+                    break
+                try:
+                    yield json.loads(data)
+                except ValueError:
+                    raise StreamInterrupted(f"스트림 데이터를 해석할 수 없습니다: {data[:200]}")
+        except (self._requests.ConnectionError, self._requests.Timeout) as e:
+            # 이미 일부를 받은 뒤이므로 같은 요청을 자동으로 재시도하지 않음
+            raise StreamInterrupted(f"스트림 연결 오류: {e}")
+        finally:
+            response.close()
+    
+    def _backoff_delay(self, attempt):
+        """지수 백오프 + full jitter 대기 시간 (초)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+    
+    @staticmethod
+    def _retry_after(response):
+        """
+        응답의 재시도 대기 헤더를 초 단위로 반환합니다. (상한은 호출하는 쪽에서 retry_after_max로 확인)
+        (OpenAI의 retry-after-ms, 표준 Retry-After 초/HTTP 날짜 형식 지원)
+        """
+        value = response.headers.get('retry-after-ms')
+        if value:
+            try:
+                return max(0.0, float(value) / 1000)
+            except ValueError:
+                pass
+        
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+    
+    @staticmethod
+    def _error_message(response):
+        """응답 본문에서 오류 메시지 추출"""
+        try:
+            body = response.json()
+            if isinstance(body, dict) and isinstance(body.get('error'), dict):
+                return body['error'].get('message', '')
+            return str(body)
+        except ValueError:
+            return response.text[:500]
+    
+    def close(self):
+        """연결 풀 정리"""
+        self.session.close()
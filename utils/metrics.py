@@ -0,0 +1,258 @@
+import os
+import time
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+# 작업 지표 파일 이름 접두사 (results 폴더의 metrics_<저장 시각>.json)
+METRICS_FILE_PREFIX = "metrics"
+
+# Prometheus 텍스트 형식 파일 확장자 (node_exporter textfile collector 등에서 결과 폴더의 *.prom을 읽음)
+# 동시에 실행한 작업이 서로 덮어쓰지 않도록 작업마다 metrics_<작업 ID>.prom으로 저장
+PROMETHEUS_FILE_SUFFIX = ".prom"
+PROMETHEUS_PREFIX = "meeting_summary"
+
+# 단계 이름과 표시 이름 (파이프라인에서 기록하는 순서)
+STAGE_LABELS = {
+    "hash": "입력 해시",
+    "probe": "정보 확인 (ffprobe)",
+    "extract": "오디오 추출 (stream copy)",
+    "decode": "디코딩",
+    "encode": "MP3 인코딩",
+    "upload": "업로드 (청크별 요청)",
+    "transcription_wait": "전사 대기",
+    "summary": "요약",
+    "save": "저장"
+}
+
+class JobMetrics:
+    """
+    작업 하나의 단계별 시간(span)과 바이트/세그먼트 수 등의 카운터를 모으는 클래스
+    
+    시간은 단조 시계(time.perf_counter)로 재고, 각 span의 시작 시각은 작업 시작 기준 오프셋(초)으로 기록합니다.
+    청크 전사, 요약처럼 여러 스레드에서 동시에 기록할 수 있습니다.
+    """
+    
+    def __init__(self, job_id=None, source_file=None):
+        """
+        JobMetrics 초기화
+        
+        Args:
+            job_id (str, optional): 작업 ID (입력 파일 해시를 확인한 뒤 정해지면 나중에 설정)
+            source_file (str, optional): 원본 파일 경로
+        """
+        self.job_id = job_id
+        self.source_file = source_file
+        self.status = None
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self.spans = []
+        self.total_seconds = None
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def span(self, stage, kind=None, **counters):
+        """
+        with 블록 실행 시간을 stage 단계로 기록합니다.
+        
+        블록 안에서 반환된 딕셔너리에 카운터(bytes, segments 등)를 추가할 수 있습니다.
+        예외가 발생하면 error 카운터를 1로 기록하고 예외는 그대로 전달합니다.
+        
+        Args:
+            stage (str): 단계 이름 (STAGE_LABELS)
+            kind (str, optional): 세부 구분 (예: 요약 유형, 저장한 결과 종류)
+            **counters: 처음부터 알고 있는 카운터 값
+        
+        Yields:
+            dict: 카운터 딕셔너리
+        """
+        start = time.perf_counter()
+        try:
+            yield counters
+        except BaseException:
+            counters["error"] = 1
+            raise
+        finally:
+            self.record(stage, start, kind=kind, **counters)
+    
+    def record(self, stage, start, seconds=None, kind=None, **counters):
+        """
+        이미 측정한 구간을 기록합니다. (디코딩처럼 여러 번 나누어 잰 시간을 합쳐 기록할 때 사용)
+        
+        Args:
+            stage (str): 단계 이름
+            start (float): 구간 시작 시각 (time.perf_counter 값)
+            seconds (float, optional): 걸린 시간 (초). 기본값은 start부터 지금까지.
+            kind (str, optional): 세부 구분
+            **counters: 카운터 값
+        """
+        if seconds is None:
+            seconds = time.perf_counter() - start
+        span = {
+            "stage": stage,
+            "kind": kind,
+            "start": round(start - self._origin, 4),
+            "seconds": round(seconds, 4),
+            "counters": counters
+        }
+        with self._lock:
+            self.spans.append(span)
+    
+    def finish(self, status):
+        """
+        작업이 끝난 시점의 전체 시간과 결과를 기록합니다.
+        
+        Args:
+            status (str): 작업 결과 ('success' 또는 'error')
+        """
+        self.status = status
+        self.total_seconds = round(time.perf_counter() - self._origin, 4)
+    
+    def stages(self):
+        """
+        단계(및 세부 구분)별로 span을 합칩니다.
+        
+        seconds는 span 시간의 합, wall_seconds는 첫 span 시작부터 마지막 span 끝까지의 시간입니다.
+        청크 업로드처럼 동시에 실행된 span은 seconds가 wall_seconds보다 클 수 있습니다.
+        
+        Returns:
+            list: 단계별 딕셔너리 목록 (stage, kind, count, seconds, wall_seconds, counters), 처음 시작한 순서
+        """
+        with self._lock:
+            spans = list(self.spans)
+        
+        stages = {}
+        for span in sorted(spans, key=lambda span: span["start"]):
+            key = (span["stage"], span["kind"])
+            stage = stages.get(key)
+            if stage is None:
+                stage = stages[key] = {
+                    "stage": span["stage"], "kind": span["kind"], "count": 0, "seconds": 0.0,
+                    "first_start": span["start"], "last_end": 0.0, "counters": {}
+                }
+            stage["count"] += 1
+            stage["seconds"] += span["seconds"]
+            stage["last_end"] = max(stage["last_end"], span["start"] + span["seconds"])
+            for name, value in span["counters"].items():
+                stage["counters"][name] = stage["counters"].get(name, 0) + value
+        
+        result = []
+        for stage in stages.values():
+            result.append({
+                "stage": stage["stage"],
+                "kind": stage["kind"],
+                "count": stage["count"],
+                "seconds": round(stage["seconds"], 4),
+                "wall_seconds": round(stage["last_end"] - stage["first_start"], 4),
+                "counters": stage["counters"]
+            })
+        return result
+    
+    def stage_seconds(self):
+        """
+        단계별 시간 합계 (작업 기록의 timings로 사용)
+        
+        Returns:
+            dict: '단계' 또는 '단계:세부 구분' -> 시간 (초), 'total' -> 전체 시간
+        """
+        timings = {
+            f"{stage['stage']}:{stage['kind']}" if stage["kind"] else stage["stage"]: round(stage["seconds"], 3)
+            for stage in self.stages()
+        }
+        if self.total_seconds is not None:
+            timings["total"] = round(self.total_seconds, 3)
+        return timings
+    
+    def to_dict(self):
+        """JSON으로 저장할 딕셔너리 (작업 정보, 단계별 합계, 개별 span)"""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span["start"])
+        return {
+            "job_id": self.job_id,
+            "source_file": self.source_file,
+            "status": self.status,
+            "started_at": self.started_at,
+            "total_seconds": self.total_seconds,
+            "stages": self.stages(),
+            "spans": spans
+        }
+    
+    @staticmethod
+    def from_dict(data):
+        """to_dict()로 저장한 딕셔너리에서 JobMetrics를 다시 만듭니다. (저장된 지표를 표시할 때 사용)"""
+        metrics = JobMetrics(data.get("job_id"), data.get("source_file"))
+        metrics.status = data.get("status")
+        metrics.started_at = data.get("started_at")
+        metrics.total_seconds = data.get("total_seconds")
+        metrics.spans = list(data.get("spans", []))
+        return metrics
+    
+    def to_prometheus(self):
+        """
+        Prometheus 텍스트 형식 (exposition format)으로 변환합니다.
+        
+        단계별 시간은 {prefix}_stage_seconds, 횟수는 {prefix}_stage_count, 카운터는
+        {prefix}_stage_<카운터 이름>으로 내보내며, job_id/stage/kind를 레이블로 붙입니다.
+        
+        Returns:
+            str: Prometheus 텍스트
+        """
+        job_labels = {"job_id": self.job_id or "", "source": os.path.basename(self.source_file or "")}
+        families = {
+            "job_seconds": ("작업 전체 시간 (초)", []),
+            "stage_seconds": ("단계별 시간 합계 (초)", []),
+            "stage_wall_seconds": ("단계별 첫 시작부터 마지막 종료까지의 시간 (초)", []),
+            "stage_count": ("단계별 span 수", [])
+        }
+        if self.total_seconds is not None:
+            families["job_seconds"][1].append((dict(job_labels, status=self.status or ""), self.total_seconds))
+        
+        for stage in self.stages():
+            labels = dict(job_labels, stage=stage["stage"], kind=stage["kind"] or "")
+            families["stage_seconds"][1].append((labels, stage["seconds"]))
+            families["stage_wall_seconds"][1].append((labels, stage["wall_seconds"]))
+            families["stage_count"][1].append((labels, stage["count"]))
+            for name, value in stage["counters"].items():
+                family = families.setdefault(f"stage_{name}", (f"단계별 {name} 합계", []))
+                family[1].append((labels, value))
+        
+        lines = []
+        for name, (help_text, samples) in families.items():
+            if not samples:
+                continue
+            metric = f"{PROMETHEUS_PREFIX}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} gauge")
+            for labels, value in samples:
+                label_text = ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels.items())
+                lines.append(f"{metric}{{{label_text}}} {value}")
+        return "\n".join(lines) + "\n"
+    
+    def save_prometheus(self, path):
+        """
+        지표를 Prometheus 텍스트 파일로 저장합니다.
+        수집기가 쓰는 중인 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체합니다.
+        
+        Args:
+            path (str): 저장할 파일 경로
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(self.to_prometheus())
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+def _escape_label(value):
+    """Prometheus 레이블 값 이스케이프"""
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+def stage_label(stage, kind=None):
+    """단계 표시 이름 (세부 구분이 있으면 괄호로 덧붙임)"""
+    label = STAGE_LABELS.get(stage, stage)
+    return f"{label} ({kind})" if kind else label
@@ -0,0 +1,441 @@
+import os
+import uuid
+import functools
+import traceback
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from utils.api import (
+    OpenAIAPI, SUMMARY_MODEL,
+    WHISPER_MODEL, TRANSCRIBE_LANGUAGE, TRANSCRIBE_RESPONSE_FORMAT
+)
+from utils.audio import AudioProcessor, TimelineMap
+from utils.cache import hash_file, make_cache_key
+from utils.metrics import JobMetrics
+from utils.storage import Storage
+from utils.transcript import Transcript
+
+# 요약 유형별 표시 이름
+SUMMARY_LABELS = {
+    "paragraph": "문단별",
+    "timestamped": "시간대별"
+}
+
+# 세그먼트(타임스탬프) 정보가 없을 때 시간대별 요약에 전달할 텍스트
+NO_TIMESTAMP_TEXT = "타임스탬프 정보가 없습니다."
+
+# 요약 진행 중 종료 요청을 확인하는 간격 (초)
+SUMMARY_POLL_INTERVAL = 0.2
+
+# 작업 ID(입력 파일 해시와 처리 옵션의 해시) 길이
+JOB_ID_LENGTH = 16
+
+class MeetingPipeline:
+    """오디오 변환, 전사, 요약, 저장을 수행하는 작업 파이프라인 (Qt 없이 실행 가능)"""
+    
+    def __init__(self, file_path, summary_types, api=None, storage=None,
+                 on_progress=None, on_log=None, should_stop=None, remove_silence=False,
+                 on_summary_delta=None, export_prometheus=False):
+        """
+        초기화
+        
+        Args:
+            file_path (str): 오디오/비디오 파일 경로
+            summary_types (list): 요약 유형 목록 ('paragraph', 'timestamped')
+            api (OpenAIAPI, optional): 공유할 API 클라이언트. 기본값은 새 클라이언트.
+            storage (Storage, optional): 공유할 저장소. 기본값은 'results' 폴더.
+            on_progress (callable, optional): 진행 상황 콜백 (진행률, 상태 메시지)
+            on_log (callable, optional): 로그 메시지 콜백
+            should_stop (callable, optional): True를 반환하면 작업을 중단하는 함수
+            remove_silence (bool): 업로드 전에 긴 무음 구간을 제거할지 여부
+            on_summary_delta (callable, optional): 요약을 스트리밍으로 받을 때 호출할 콜백 (요약 유형, 텍스트 조각).
+                                                   주어지지 않으면 요약을 한 번에 받음.
+            export_prometheus (bool): 작업 지표를 Prometheus 텍스트 형식(results/metrics_<작업 ID>.prom)으로도 저장할지 여부
+        """
+        self.file_path = file_path
+        self.summary_types = summary_types
+        self.on_progress = on_progress
+        self.on_log = on_log
+        self.should_stop = should_stop
+        self.remove_silence = remove_silence
+        self.on_summary_delta = on_summary_delta
+        self.export_prometheus = export_prometheus
+        self.checkpoint = None  # 단계별 체크포인트 (실행 시 입력 파일 해시로 결정)
+        self.metrics = None  # 단계별 시간과 카운터 (실행할 때마다 새로 만듦)
+        
+        # 유틸리티 클래스 인스턴스 생성
+        self.api = api if api is not None else OpenAIAPI()
+        self.audio_processor = AudioProcessor()
+        self.storage = storage if storage is not None else Storage()
+    
+    def run(self):
+        """
+        파이프라인 실행
+        
+        Returns:
+            dict: 처리 결과 (success, transcription, transcript, paragraph_summary, timestamped_summary 또는 error,
+                  metrics). 종료 요청으로 중단된 경우 None.
+        """
+        self.metrics = JobMetrics(source_file=os.path.abspath(self.file_path))
+        
+        try:
+            # 1. 진행 상황 업데이트: 오디오 처리 시작
+            self._progress(10, "오디오 파일 처리 중...")
+            self._log(f"파일 처리 중: {os.path.basename(self.file_path)}")
+            
+            # 파일 존재 확인
+            if not os.path.exists(self.file_path):
+                raise FileNotFoundError(f"파일을 찾을 수 없습니다: {self.file_path}")
+            
+            self._log(f"파일 크기: {os.path.getsize(self.file_path)} bytes")
+            
+            # 종료 요청 확인
+            if self.check_stopped():
+                return None
+            
+            # 입력 파일 해시와 처리 옵션으로 작업 ID를 정해 이전에 중단된 작업의 체크포인트를 찾음
+            with self.metrics.span("hash", bytes=os.path.getsize(self.file_path)):
+                audio_hash = hash_file(self.file_path)
+            self.checkpoint = self.storage.job_checkpoint(self._job_id(audio_hash))
+            # 같은 작업을 동시에 실행하면 서로의 체크포인트를 지우므로 두 번째 실행은 거부
+            self.checkpoint.acquire()
+            self.metrics.job_id = self.checkpoint.job_id
+            self._log(f"작업 ID: {self.checkpoint.job_id}")
+            
+            # 2~4. 체크포인트와 캐시 확인 후 오디오 변환 및 전사
+            cache_key = self.storage.transcription_cache_key(
+                self.file_path, WHISPER_MODEL, TRANSCRIBE_LANGUAGE, TRANSCRIBE_RESPONSE_FORMAT,
+                audio_hash=audio_hash
+            )
+            checkpoint_transcription = self.checkpoint.load_json("transcription")
+            
+            if checkpoint_transcription is not None:
+                self._progress(40, "저장된 전사 결과 사용")
+                self._log("이전 작업의 전사 결과가 있어 변환 및 전사를 건너뜁니다.")
+                transcription_response = Transcript.from_dict(checkpoint_transcription)
+            else:
+                cached_transcription = self.storage.load_cached_transcription(cache_key)
+                if cached_transcription is not None:
+                    self._progress(40, "캐시된 전사 결과 사용")
+                    self._log("같은 오디오의 전사 결과가 캐시에 있어 변환 및 전사를 건너뜁니다.")
+                    transcription_response = Transcript.from_dict(cached_transcription)
+                else:
+                    transcription_response = self._convert_and_transcribe()
+                    if transcription_response is not None and not self.check_stopped():
+                        self.storage.cache_transcription(cache_key, transcription_response)
+                
+                if transcription_response is not None and not self.check_stopped():
+                    self.checkpoint.save_json(
+                        "transcription", transcription_response.to_dict()
+                    )
+                    # 전사가 끝났으므로 변환된 오디오는 더 이상 필요 없음
+                    self.checkpoint.remove_audio()
+            
+            stats = self.storage.transcription_cache_stats()
+            self._log(f"전사 캐시: 적중 {stats['hits']}회, 미스 {stats['misses']}회, 항목 {stats['entries']}개")
+            
+            # 종료 요청 확인
+            if self.check_stopped():
+                return None
+            
+            # 5. 전사 결과 추출 및 처리
+            if not isinstance(transcription_response, Transcript):
+                error_msg = "전사 응답이 유효하지 않습니다."
+                self._log(error_msg)
+                raise RuntimeError(error_msg)
+            
+            full_text = transcription_response.text
+            
+            # 전사 결과 저장
+            self._log("전사 결과 저장 중...")
+            meeting = {"meeting_id": self._run_id(), "title": os.path.basename(self.file_path)}
+            self._log(f"실행 ID: {meeting['meeting_id']}")
+            with self.metrics.span("save", "transcription", segments=len(transcription_response)):
+                self.storage.save_transcription(transcription_response, **meeting)
+            
+            # 종료 요청 확인
+            if self.check_stopped():
+                return None
+            
+            # 6. 진행 상황 업데이트: 요약 시작
+            self._progress(50, "ChatGPT API를 통해 요약 중...")
+            
+            # 7~8. 요청된 요약 유형을 동시에 생성 (완료되는 순서대로 보고)
+            summary_inputs = {}
+            if "paragraph" in self.summary_types:
+                summary_inputs["paragraph"] = full_text
+            if "timestamped" in self.summary_types:
+                # 시간대별 요약은 전사 결과의 세그먼트를 타임스탬프와 함께 바로 나누어 사용
+                summary_inputs["timestamped"] = transcription_response if len(transcription_response) else NO_TIMESTAMP_TEXT
+            
+            summaries = self._summarize_concurrently(summary_inputs)
+            if summaries is None:
+                return None
+            
+            paragraph_summary = summaries.get("paragraph")
+            timestamped_summary = summaries.get("timestamped")
+            
+            # 종료 요청 확인
+            if self.check_stopped():
+                return None
+            
+            # 9. 요약 결과 저장
+            self._log("요약 결과 저장 중...")
+            for summary_type, summary in (("paragraph", paragraph_summary), ("timestamped", timestamped_summary)):
+                if summary:
+                    with self.metrics.span("save", f"summary_{summary_type}", chars=len(summary)):
+                        self.storage.save_summary(summary, summary_type, **meeting)
+            
+            # 모든 결과 통합 저장
+            if paragraph_summary or timestamped_summary:
+                with self.metrics.span("save", "full_result"):
+                    self.storage.save_full_result(full_text, paragraph_summary or "", timestamped_summary or "")
+            
+            # 작업 정보와 단계별 시간 기록 (길이는 마지막 세그먼트의 종료 시각으로 추정)
+            self.metrics.finish("success")
+            self.storage.record_job(
+                meeting["meeting_id"],
+                source_file=os.path.abspath(self.file_path),
+                duration=transcription_response.times(len(transcription_response) - 1)[1] if len(transcription_response) else None,
+                transcription_model=WHISPER_MODEL,
+                summary_model=SUMMARY_MODEL,
+                timings=self.metrics.stage_seconds()
+            )
+            self._save_metrics()
+            
+            # 종료 요청 확인
+            if self.check_stopped():
+                return None
+            
+            # 모든 결과가 저장되었으므로 체크포인트 삭제
+            self.checkpoint.remove()
+            
+            # 10. 완료 처리
+            self._progress(100, "처리 완료!")
+            self._log("전사 및 요약 작업이 완료되었습니다.")
+            
+            # 결과 전달
+            results = {
+                "success": True,
+                "transcription": full_text,
+                "transcript": transcription_response,
+                "paragraph_summary": paragraph_summary,
+                "timestamped_summary": timestamped_summary,
+                "metrics": self.metrics.to_dict()
+            }
+            return results
+        
+        except Exception as e:
+            # 오류 처리
+            error_message = str(e)
+            self._log(f"오류 발생: {error_message}")
+            
+            # 자세한 오류 정보 출력
+            self._log(traceback.format_exc())
+            
+            # 실패한 작업도 어느 단계까지 얼마나 걸렸는지 남김
+            self.metrics.finish("error")
+            self._save_metrics()
+            
+            return {"success": False, "error": error_message, "metrics": self.metrics.to_dict()}
+        
+        finally:
+            # 작업 디렉토리 잠금 해제
+            if self.checkpoint is not None:
+                self.checkpoint.release()
+    
+    def _job_id(self, audio_hash):
+        """
+        입력 파일 해시와 결과에 영향을 주는 옵션으로 작업 ID를 만듭니다.
+        (옵션이 다르면 변환된 오디오와 요약이 달라지므로 체크포인트를 공유하지 않음)
+        
+        Args:
+            audio_hash (str): 입력 파일의 SHA-256 해시
+            
+        Returns:
+            str: 작업 ID
+        """
+        options = {"summary_types": sorted(self.summary_types), "remove_silence": bool(self.remove_silence)}
+        return make_cache_key(audio_hash, options)[:JOB_ID_LENGTH]
+    
+    def _run_id(self):
+        """
+        저장소에 결과를 기록할 실행 ID를 반환합니다. 같은 파일을 다시 처리해도 이전 결과를 덮어쓰지 않도록
+        실행마다 새로 만들고, 중단된 작업을 이어서 실행할 때는 체크포인트에 저장된 ID를 그대로 사용합니다.
+        
+        Returns:
+            str: 실행 ID (작업 ID_임의 문자열)
+        """
+        run_id = self.checkpoint.load_text("run_id")
+        if not run_id:
+            run_id = f"{self.checkpoint.job_id}_{uuid.uuid4().hex[:8]}"
+            self.checkpoint.save_text("run_id", run_id)
+        return run_id
+    
+    def _convert_and_transcribe(self):
+        """
+        오디오를 청크로 변환한 뒤 Whisper API로 전사
+        
+        Returns:
+            Transcript: 전사 결과 (종료 요청 시 None)
+        """
+        # 2. 오디오 파일 변환 (API 제한에 맞게 무음 구간 기준으로 분할)
+        # 변환된 청크는 전사가 끝날 때까지 작업 디렉토리에 보관하여 재시작 시 재사용
+        chunks = self.checkpoint.load_chunks()
+        timeline_map = None
+        
+        try:
+            if chunks is not None:
+                self._log(f"이전 작업에서 변환된 오디오를 사용합니다. (청크 {len(chunks)}개)")
+                timeline = self.checkpoint.load_timeline()
+                if timeline is not None:
+                    timeline_map = TimelineMap(timeline)
+            else:
+                audio_dir = self.checkpoint.prepare_audio_dir()
+                # 무음을 제거하지 않는 경우, API 제한에 맞는 파일은 재인코딩 없이 업로드
+                if not self.remove_silence:
+                    chunks = self.audio_processor.prepare_for_upload(
+                        self.file_path, output_dir=audio_dir, metrics=self.metrics
+                    )
+                if chunks is not None:
+                    self._log("오디오 변환 없이 업로드합니다.")
+                else:
+                    self._log("오디오 파일을 MP3 형식으로 변환 중...")
+                    if self.remove_silence:
+                        timeline_map = TimelineMap()
+                    chunks = self.audio_processor.convert_to_mp3_chunks(
+                        self.file_path, output_dir=audio_dir, timeline_map=timeline_map, metrics=self.metrics
+                    )
+                for chunk_path, offset in chunks:
+                    self._log(f"변환된 파일 경로: {chunk_path} (시작: {offset:.1f}초)")
+                if timeline_map is not None:
+                    self._log(f"무음 제거: 총 {timeline_map.removed_ms / 1000:.1f}초 제거")
+                self.checkpoint.save_chunks(chunks, timeline_map.to_list() if timeline_map else None)
+                self._log(f"오디오 변환 완료 (청크 {len(chunks)}개)")
+        except Exception as e:
+            error_msg = f"오디오 변환 중 오류 발생: {str(e)}"
+            self._log(error_msg)
+            self._log(traceback.format_exc())
+            raise RuntimeError(error_msg)
+        
+        # 종료 요청 확인
+        if self.check_stopped():
+            return None
+        
+        # 3. 진행 상황 업데이트: 전사 시작
+        self._progress(20, "Whisper API를 통해 전사 중...")
+        self._log("음성을 텍스트로 전사하는 중...")
+        
+        # 4. OpenAI Whisper API를 사용하여 전사
+        try:
+            # 청크별 요청은 동시에 진행되므로, 전체 전사를 기다린 시간은 따로 기록
+            with self.metrics.span("transcription_wait", chunks=len(chunks)) as counters:
+                transcription_response = self.api.transcribe_chunks(
+                    chunks, stop_check=self.check_stopped, metrics=self.metrics
+                )
+                if transcription_response is not None:
+                    counters["segments"] = len(transcription_response)
+            # 무음을 제거했다면 세그먼트 시간을 원본 기준으로 되돌림
+            if transcription_response is not None and timeline_map is not None:
+                timeline_map.remap(transcription_response)
+            self._log("전사 완료")
+        except Exception as e:
+            error_msg = f"전사 중 오류 발생: {str(e)}"
+            self._log(error_msg)
+            self._log(traceback.format_exc())
+            raise RuntimeError(error_msg)
+        
+        return transcription_response
+    
+    def _summarize_concurrently(self, summary_inputs):
+        """
+        요약 유형별 요약을 동시에 생성
+        
+        Args:
+            summary_inputs (dict): 요약 유형 -> 요약할 텍스트 또는 Transcript
+            
+        Returns:
+            dict: 요약 유형 -> 요약 텍스트 (종료 요청 시 None)
+        """
+        summaries = {}
+        
+        # 이전 작업에서 완료된 요약은 다시 요청하지 않음
+        for summary_type in list(summary_inputs):
+            summary = self.checkpoint.load_text(f"summary_{summary_type}")
+            if summary is not None:
+                self._log(f"이전 작업의 {SUMMARY_LABELS[summary_type]} 요약을 사용합니다.")
+                summaries[summary_type] = summary
+                self._summary_delta(summary_type, summary)
+        
+        remaining = {
+            summary_type: text for summary_type, text in summary_inputs.items()
+            if summary_type not in summaries
+        }
+        if not remaining:
+            return summaries
+        
+        executor = ThreadPoolExecutor(max_workers=len(remaining))
+        try:
+            futures = {}
+            for summary_type, text in remaining.items():
+                self._log(f"{SUMMARY_LABELS[summary_type]} 요약 생성 중...")
+                on_delta = None
+                if self.on_summary_delta:
+                    on_delta = functools.partial(self._summary_delta, summary_type)
+                future = executor.submit(self._summarize, text, summary_type, on_delta)
+                futures[future] = summary_type
+            
+            pending = set(futures)
+            while pending:
+                # 주기적으로 깨어나 종료 요청을 확인
+                done, pending = wait(pending, timeout=SUMMARY_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    summary_type = futures[future]
+                    summaries[summary_type] = future.result()
+                    self.checkpoint.save_text(f"summary_{summary_type}", summaries[summary_type])
+                    
+                    label = SUMMARY_LABELS[summary_type]
+                    self._log(f"{label} 요약 완료")
+                    self._progress(50 + 40 * len(summaries) // len(summary_inputs), f"{label} 요약 완료")
+                
+                if self.check_stopped():
+                    return None
+            
+            return summaries
+        finally:
+            # 종료 요청 시 진행 중인 요청의 완료를 기다리지 않음
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _summarize(self, text, summary_type, on_delta):
+        """요약 하나를 생성하고 걸린 시간과 입력/출력 길이를 기록"""
+        input_chars = len(text.text) if isinstance(text, Transcript) else len(text)
+        with self.metrics.span("summary", summary_type, input_chars=input_chars) as counters:
+            summary = self.api.summarize_text(text, cache=self.storage.summary_cache, on_delta=on_delta)
+            counters["output_chars"] = len(summary)
+        return summary
+    
+    def _save_metrics(self):
+        """작업 지표를 결과 폴더에 저장 (실패해도 작업 결과에는 영향을 주지 않음)"""
+        try:
+            file_path = self.storage.save_metrics(self.metrics, prometheus=self.export_prometheus)
+            self._log(f"단계별 처리 시간 저장: {file_path}")
+        except OSError as e:
+            self._log(f"처리 시간 저장 중 오류 발생: {str(e)}")
+    
+    def check_stopped(self):
+        """종료 요청 확인"""
+        return bool(self.should_stop and self.should_stop())
+    
+    def _log(self, message):
+        """로그 메시지 전달"""
+        if self.on_log:
+            self.on_log(message)
+    
+    def _summary_delta(self, summary_type, delta):
+        """스트리밍으로 받은 요약 조각 전달"""
+        if self.on_summary_delta:
+            self.on_summary_delta(summary_type, delta)
+    
+    def _progress(self, progress, status):
+        """진행 상황 전달"""
+        if self.on_progress:
+            self.on_progress(progress, status)
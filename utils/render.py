@@ -0,0 +1,190 @@
+import json
+
+# 전사 결과 내보내기 형식 (확장자 -> 설명)
+EXPORT_FORMATS = {
+    "txt": "타임스탬프 텍스트",
+    "srt": "SRT 자막",
+    "vtt": "WebVTT 자막",
+    "md": "마크다운",
+    "json": "JSON"
+}
+
+def _clock(seconds, millisecond_separator=None):
+    """
+    초를 HH:MM:SS (또는 HH:MM:SS<구분자>mmm) 형식으로 변환합니다.
+    
+    Args:
+        seconds (float): 초 단위의 시간
+        millisecond_separator (str, optional): 밀리초 앞 구분자 (SRT는 ',', WebVTT는 '.')
+    
+    Returns:
+        str: 시간 문자열
+    """
+    total_ms = int(round(max(seconds, 0) * 1000))
+    total_seconds, milliseconds = divmod(total_ms, 1000)
+    minutes, secs = divmod(total_seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    if millisecond_separator is None:
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{millisecond_separator}{milliseconds:03d}"
+
+def iter_timestamped_text(transcript):
+    """
+    "[HH:MM:SS - HH:MM:SS] 텍스트" 형식의 타임스탬프 텍스트를 세그먼트 단위로 생성합니다.
+    
+    Args:
+        transcript (Transcript): 전사 결과
+    
+    Yields:
+        str: 출력 조각
+    """
+    for line in transcript.timestamped_lines():
+        yield line
+        yield "\n\n"
+
+def iter_srt(transcript):
+    """
+    SRT 자막을 세그먼트 단위로 생성합니다.
+    
+    Args:
+        transcript (Transcript): 전사 결과
+    
+    Yields:
+        str: 출력 조각
+    """
+    for number, (start, end, text) in enumerate(transcript.rows(), 1):
+        yield f"{number}\n{_clock(start, ',')} --> {_clock(end, ',')}\n{text.strip()}\n\n"
+
+def iter_vtt(transcript):
+    """
+    WebVTT 자막을 세그먼트 단위로 생성합니다.
+    
+    Args:
+        transcript (Transcript): 전사 결과
+    
+    Yields:
+        str: 출력 조각
+    """
+    yield "WEBVTT\n\n"
+    for start, end, text in transcript.rows():
+        # WebVTT에서 "-->"는 타이밍 구분자이므로 본문에서는 사용할 수 없음
+        yield f"{_clock(start, '.')} --> {_clock(end, '.')}\n{text.strip().replace('-->', '->')}\n\n"
+
+def iter_markdown(transcript, paragraph_summary=None, timestamped_summary=None):
+    """
+    요약과 타임스탬프가 포함된 전사 내용을 마크다운 문서로 생성합니다.
+    
+    Args:
+        transcript (Transcript): 전사 결과
+        paragraph_summary (str, optional): 문단 요약 텍스트
+        timestamped_summary (str, optional): 시간대별 요약 텍스트
+    
+    Yields:
+        str: 출력 조각
+    """
+    yield "# 회의 요약 결과\n\n"
+    
+    if paragraph_summary:
+        yield "## 요약 (문단별)\n\n"
+        yield paragraph_summary
+        yield "\n\n"
+    
+    if timestamped_summary:
+        yield "## 요약 (시간대별)\n\n"
+        yield timestamped_summary
+        yield "\n\n"
+    
+    yield "## 전체 전사 내용\n\n"
+    if len(transcript):
+        for start, _, text in transcript.rows():
+            yield f"- `[{_clock(start)}]` {text.strip()}\n"
+    else:
+        yield transcript.text
+        yield "\n"
+
+def iter_json(transcript):
+    """
+    전사 결과(text, segments)를 JSON으로 생성합니다. 세그먼트는 한 줄에 하나씩 기록합니다.
+    
+    Args:
+        transcript (Transcript): 전사 결과
+    
+    Yields:
+        str: 출력 조각
+    """
+    yield '{\n  "text": '
+    yield json.dumps(transcript.text, ensure_ascii=False)
+    yield ',\n  "segments": ['
+    separator = "\n    "
+    for start, end, text in transcript.rows():
+        yield separator
+        yield json.dumps({"start": start, "end": end, "text": text}, ensure_ascii=False)
+        separator = ",\n    "
+    yield "\n  ]\n}\n" if len(transcript) else "]\n}\n"
+
+def iter_full_result(transcription_text, paragraph_summary=None, timestamped_summary=None):
+    """
+    요약과 전체 전사 텍스트를 하나의 텍스트 문서로 생성합니다.
+    
+    Args:
+        transcription_text (str): 전사 텍스트
+        paragraph_summary (str, optional): 문단 요약 텍스트
+        timestamped_summary (str, optional): 시간대별 요약 텍스트
+    
+    Yields:
+        str: 출력 조각
+    """
+    yield "# 회의 요약 결과\n\n"
+    
+    if paragraph_summary:
+        yield "## 1. 요약 (문단별)\n"
+        yield paragraph_summary
+        yield "\n\n"
+    
+    if timestamped_summary:
+        yield "## 2. 요약 (시간대별)\n"
+        yield timestamped_summary
+        yield "\n\n"
+    
+    if transcription_text:
+        yield "## 3. 전체 전사 내용\n"
+        yield transcription_text
+
+def iter_transcript(transcript, export_format):
+    """
+    지정한 형식으로 전사 결과를 생성합니다.
+    
+    Args:
+        transcript (Transcript): 전사 결과
+        export_format (str): EXPORT_FORMATS의 형식 ('txt', 'srt', 'vtt', 'md', 'json')
+    
+    Returns:
+        generator: 출력 조각 생성기
+    """
+    renderers = {
+        "txt": iter_timestamped_text,
+        "srt": iter_srt,
+        "vtt": iter_vtt,
+        "md": iter_markdown,
+        "json": iter_json
+    }
+    if export_format not in renderers:
+        raise ValueError(f"지원하지 않는 내보내기 형식입니다: {export_format}")
+    return renderers[export_format](transcript)
+
+def write_to(sink, pieces):
+    """
+    출력 조각을 순서대로 파일 객체에 씁니다. 문서 전체를 하나의 문자열로 만들지 않습니다.
+    
+    Args:
+        sink: write() 메서드를 가진 텍스트 파일 객체
+        pieces (iterable): 출력 조각
+    
+    Returns:
+        int: 쓴 글자 수
+    """
+    written = 0
+    for piece in pieces:
+        sink.write(piece)
+        written += len(piece)
+    return written
@@ -0,0 +1,349 @@
+import os
+import re
+import json
+import sqlite3
+import threading
+
+from utils.transcript import Transcript
+from utils.transcript_file import load_transcript_binary
+
+# 결과 폴더 안의 검색 색인 파일 이름
+SEARCH_INDEX_FILE = 'search.db'
+# 검색 결과 기본 최대 개수
+DEFAULT_SEARCH_LIMIT = 100
+# 검색 결과 미리보기에서 일치 부분 앞뒤로 보여줄 토큰 수
+SNIPPET_TOKENS = 16
+
+# 색인 대상 결과 파일 (파일 이름 패턴 -> 문서 종류)
+# meeting_summary_*.txt는 전사 결과와 요약을 합친 파일이라 색인하면 같은 내용이 중복되므로 제외
+INDEXED_FILE_PATTERNS = (
+    (re.compile(r'^transcription_(\d{8}_\d{6})(_\d+)?\.json$'), "transcription"),
+    (re.compile(r'^transcription_(\d{8}_\d{6})(_\d+)?\.trx$'), "transcription"),
+    (re.compile(r'^summary_paragraph_(\d{8}_\d{6})(_\d+)?\.txt$'), "summary_paragraph"),
+    (re.compile(r'^summary_timestamped_(\d{8}_\d{6})(_\d+)?\.txt$'), "summary_timestamped"),
+)
+
+# 시간대별 요약 문단 앞의 타임스탬프 ("[HH:MM:SS]" 또는 "HH:MM:SS")
+SUMMARY_TIMESTAMP_PATTERN = re.compile(r'^\W*(\d{1,2}):(\d{2}):(\d{2})')
+
+# entries는 단어마다 접두사 검색을 하므로 2~3글자 접두사 색인을 함께 만듦 (한국어 단어 대부분이 이 길이)
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meetings (
+    meeting_id TEXT PRIMARY KEY,
+    title TEXT
+);
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    meeting_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    first_rowid INTEGER,
+    last_rowid INTEGER
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS entries USING fts5(
+    text, document_id UNINDEXED, start UNINDEXED, end UNINDEXED,
+    tokenize = 'unicode61', prefix = '2 3'
+);
+"""
+
+def make_match_query(query):
+    """
+    사용자가 입력한 검색어를 FTS5 MATCH 식으로 바꿉니다.
+    
+    단어마다 접두사 검색을 하므로 "회의"로 "회의에서", "회의록"도 찾을 수 있고,
+    따옴표나 연산자 같은 특수 문자는 일반 문자로 취급합니다. 모든 단어가 포함된 항목만 찾습니다.
+    
+    Args:
+        query (str): 검색어
+    
+    Returns:
+        str: MATCH 식 (검색할 단어가 없으면 빈 문자열)
+    """
+    terms = query.split()
+    return " ".join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+
+def _summary_units(text):
+    """
+    요약 텍스트를 빈 줄 기준 문단으로 나누고, 문단 앞에 타임스탬프가 있으면 시작 시간으로 사용합니다.
+    
+    Args:
+        text (str): 요약 텍스트
+    
+    Yields:
+        tuple: (문단 텍스트, 시작 시간(초) 또는 None)
+    """
+    for paragraph in re.split(r'\n\s*\n', text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        match = SUMMARY_TIMESTAMP_PATTERN.match(paragraph)
+        start = None
+        if match:
+            hours, minutes, seconds = (int(value) for value in match.groups())
+            start = float(hours * 3600 + minutes * 60 + seconds)
+        yield paragraph, start
+
+class SearchIndex:
+    """
+    저장된 전사 결과와 요약을 검색하는 SQLite FTS5 전문 검색 색인
+    
+    전사 결과는 세그먼트 단위로, 요약은 문단 단위로 색인하여 검색 결과가 회의와 시간을 가리키도록 합니다.
+    파일마다 색인한 시점의 수정 시각을 기록해 두어 바뀐 파일만 다시 색인합니다.
+    """
+    
+    def __init__(self, db_path):
+        """
+        SearchIndex 초기화 (데이터베이스는 처음 사용할 때 엽니다)
+        
+        Args:
+            db_path (str): 색인 데이터베이스 파일 경로
+        """
+        self.db_path = db_path
+        self._connection = None
+        self._lock = threading.Lock()
+    
+    def _connect(self):
+        """데이터베이스 연결을 반환합니다. (호출 측에서 잠금을 잡고 있어야 함)"""
+        if self._connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            connection.executescript(SCHEMA)
+            self._connection = connection
+        return self._connection
+    
+    def close(self):
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+    
+    def add_transcript(self, file_path, transcript, meeting_id, title=None, mtime=None):
+        """
+        전사 결과 파일을 세그먼트 단위로 색인합니다. 이미 색인된 파일이면 새 내용으로 바꿉니다.
+        
+        Args:
+            file_path (str): 전사 결과 파일 경로
+            transcript (Transcript 또는 dict): 전사 결과
+            meeting_id (str): 회의 ID
+            title (str, optional): 회의 제목 (예: 원본 파일 이름)
+            mtime (float, optional): 색인 시점으로 기록할 수정 시각. 기본값은 파일의 수정 시각.
+        """
+        if not isinstance(transcript, Transcript):
+            transcript = Transcript.from_dict(transcript)
+        
+        if len(transcript):
+            rows = ((text.strip(), start, end) for start, end, text in transcript.rows())
+        else:
+            rows = ((text, None, None) for text, _ in _summary_units(transcript.text))
+        self._replace_document(file_path, "transcription", meeting_id, title, rows, mtime)
+    
+    def add_summary(self, file_path, summary_text, summary_type, meeting_id, title=None, mtime=None):
+        """
+        요약 파일을 문단 단위로 색인합니다. 이미 색인된 파일이면 새 내용으로 바꿉니다.
+        
+        Args:
+            file_path (str): 요약 파일 경로
+            summary_text (str): 요약 텍스트
+            summary_type (str): 요약 유형 ('paragraph' 또는 'timestamped')
+            meeting_id (str): 회의 ID
+            title (str, optional): 회의 제목
+            mtime (float, optional): 색인 시점으로 기록할 수정 시각. 기본값은 파일의 수정 시각.
+        """
+        rows = ((text, start, None) for text, start in _summary_units(summary_text))
+        self._replace_document(file_path, f"summary_{summary_type}", meeting_id, title, rows, mtime)
+    
+    def _replace_document(self, file_path, kind, meeting_id, title, rows, mtime=None):
+        """
+        문서의 기존 색인 항목을 지우고 새 항목을 추가합니다.
+        
+        한 문서의 항목은 잠금 안에서 한 트랜잭션으로 추가되므로 rowid가 연속되며,
+        그 범위를 기록해 두었다가 다시 색인할 때 범위로 바로 삭제합니다.
+        
+        Args:
+            file_path (str): 문서 파일 경로
+            kind (str): 문서 종류
+            meeting_id (str): 회의 ID
+            title (str): 회의 제목
+            rows (iterable): (텍스트, 시작 시간, 종료 시간) 항목
+            mtime (float, optional): 수정 시각. 기본값은 파일의 수정 시각.
+        """
+        path = os.path.abspath(file_path)
+        if mtime is None:
+            mtime = os.path.getmtime(path)
+        
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                self._delete_document(connection, path)
+                connection.execute(
+                    "INSERT INTO meetings (meeting_id, title) VALUES (?, ?) "
+                    "ON CONFLICT(meeting_id) DO UPDATE SET title = COALESCE(excluded.title, meetings.title)",
+                    (meeting_id, title)
+                )
+                document_id = connection.execute(
+                    "INSERT INTO documents (path, meeting_id, kind, mtime) VALUES (?, ?, ?, ?)",
+                    (path, meeting_id, kind, mtime)
+                ).lastrowid
+                
+                first_rowid = last_rowid = None
+                for text, start, end in rows:
+                    if not text:
+                        continue
+                    last_rowid = connection.execute(
+                        "INSERT INTO entries (text, document_id, start, end) VALUES (?, ?, ?, ?)",
+                        (text, document_id, start, end)
+                    ).lastrowid
+                    if first_rowid is None:
+                        first_rowid = last_rowid
+                
+                connection.execute(
+                    "UPDATE documents SET first_rowid = ?, last_rowid = ? WHERE id = ?",
+                    (first_rowid, last_rowid, document_id)
+                )
+    
+    @staticmethod
+    def _delete_document(connection, path):
+        """문서와 그 색인 항목을 삭제합니다."""
+        row = connection.execute(
+            "SELECT id, first_rowid, last_rowid FROM documents WHERE path = ?", (path,)
+        ).fetchone()
+        if row is None:
+            return
+        
+        document_id, first_rowid, last_rowid = row
+        if first_rowid is not None:
+            connection.execute(
+                "DELETE FROM entries WHERE rowid BETWEEN ? AND ?", (first_rowid, last_rowid)
+            )
+        connection.execute("DELETE FROM documents WHERE id = ?", (document_id,))
+    
+    def sync_directory(self, results_dir):
+        """
+        결과 폴더의 파일과 색인을 맞춥니다. 새로 생기거나 바뀐 파일만 색인하고, 삭제된 파일은 색인에서 지웁니다.
+        
+        처음 색인하는 파일은 회의 정보가 없으므로 파일 이름의 저장 시각을 회의 ID로 사용합니다.
+        
+        Args:
+            results_dir (str): 결과 폴더 경로
+        
+        Returns:
+            int: 새로 색인한 파일 수
+        """
+        with self._lock:
+            connection = self._connect()
+            indexed = {
+                path: (mtime, meeting_id)
+                for path, mtime, meeting_id in connection.execute("SELECT path, mtime, meeting_id FROM documents")
+            }
+        
+        indexed_count = 0
+        seen = set()
+        with os.scandir(results_dir) as entries:
+            for entry in entries:
+                kind, meeting_id = self.classify_file(entry.name)
+                if kind is None or not entry.is_file():
+                    continue
+                
+                path = os.path.abspath(entry.path)
+                seen.add(path)
+                if path in indexed:
+                    indexed_mtime, indexed_meeting_id = indexed[path]
+                    if indexed_mtime == entry.stat().st_mtime:
+                        continue
+                    # 내용이 바뀐 파일은 처음 색인할 때의 회의 ID를 유지
+                    meeting_id = indexed_meeting_id
+                
+                try:
+                    if kind == "transcription" and path.endswith(".json"):
+                        with open(path, 'r', encoding='utf-8') as f:
+                            self.add_transcript(path, json.load(f), meeting_id)
+                    elif kind == "transcription":
+                        self.add_transcript(path, load_transcript_binary(path), meeting_id)
+                    else:
+                        with open(path, 'r', encoding='utf-8') as f:
+                            summary_type = kind[len("summary_"):]
+                            self.add_summary(path, f.read(), summary_type, meeting_id)
+                    indexed_count += 1
+                except (OSError, ValueError) as e:
+                    print(f"검색 색인 실패 ({entry.name}): {str(e)}")
+        
+        removed = [path for path in indexed if path not in seen and os.path.dirname(path) == os.path.abspath(results_dir)]
+        if removed:
+            with self._lock:
+                connection = self._connect()
+                with connection:
+                    for path in removed:
+                        self._delete_document(connection, path)
+        
+        return indexed_count
+    
+    @staticmethod
+    def classify_file(file_name):
+        """
+        결과 파일 이름으로 문서 종류와 기본 회의 ID(파일 이름의 저장 시각)를 찾습니다.
+        
+        Args:
+            file_name (str): 파일 이름
+        
+        Returns:
+            tuple: (문서 종류, 회의 ID). 색인 대상이 아니면 (None, None).
+        """
+        for pattern, kind in INDEXED_FILE_PATTERNS:
+            match = pattern.match(file_name)
+            if match:
+                return kind, match.group(1)
+        return None, None
+    
+    def search(self, query, limit=DEFAULT_SEARCH_LIMIT):
+        """
+        검색어가 포함된 세그먼트/문단을 최근에 색인된 것부터 찾습니다.
+        
+        관련도(rank) 순으로 정렬하면 일치하는 항목을 모두 점수 매겨야 해서 흔한 단어는 수백만 항목을 훑게 되므로,
+        rowid 역순으로 읽다가 limit개를 채우면 멈춥니다.
+        
+        Args:
+            query (str): 검색어 (공백으로 구분한 모든 단어를 포함하는 항목을 찾음)
+            limit (int): 최대 결과 수
+        
+        Returns:
+            list: 검색 결과 딕셔너리 목록 (meeting_id, title, kind, path, start, end, snippet).
+                  start/end는 시간 정보가 없으면 None.
+        """
+        match_query = make_match_query(query)
+        if not match_query:
+            return []
+        
+        with self._lock:
+            connection = self._connect()
+            rows = connection.execute(
+                """
+                SELECT d.meeting_id, m.title, d.kind, d.path, e.start, e.end,
+                       snippet(entries, 0, '[', ']', '…', ?)
+                FROM entries AS e
+                JOIN documents AS d ON d.id = e.document_id
+                LEFT JOIN meetings AS m ON m.meeting_id = d.meeting_id
+                WHERE entries MATCH ?
+                ORDER BY e.rowid DESC
+                LIMIT ?
+                """,
+                (SNIPPET_TOKENS, match_query, limit)
+            ).fetchall()
+        
+        keys = ("meeting_id", "title", "kind", "path", "start", "end", "snippet")
+        return [dict(zip(keys, row)) for row in rows]
+    
+    def stats(self):
+        """
+        색인 통계를 반환합니다.
+        
+        Returns:
+            dict: meetings, documents, entries
+        """
+        with self._lock:
+            connection = self._connect()
+            return {
+                "meetings": connection.execute("SELECT COUNT(*) FROM meetings").fetchone()[0],
+                "documents": connection.execute("SELECT COUNT(*) FROM documents").fetchone()[0],
+                "entries": connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            }
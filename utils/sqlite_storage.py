@@ -0,0 +1,419 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+from utils.storage import Storage
+from utils.transcript import Transcript
+from utils import render
+
+# 결과 폴더 안의 데이터베이스 파일 이름
+SQLITE_STORAGE_FILE = 'meetings.db'
+
+# export_job()이 파일을 만드는 결과 폴더 안의 디렉토리 (검색 색인은 결과 폴더 바로 아래 파일만 동기화하므로
+# 데이터베이스에서 이미 색인된 결과가 중복으로 색인되지 않음)
+EXPORT_DIR_NAME = 'exports'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    source_file TEXT,
+    source_name TEXT,
+    duration REAL,
+    transcription_model TEXT,
+    summary_model TEXT,
+    timings TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_created_at ON jobs (created_at);
+CREATE INDEX IF NOT EXISTS jobs_source_name ON jobs (source_name);
+CREATE TABLE IF NOT EXISTS transcripts (
+    job_id TEXT PRIMARY KEY REFERENCES jobs (job_id) ON DELETE CASCADE,
+    text TEXT NOT NULL,
+    segment_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS segments (
+    job_id TEXT NOT NULL REFERENCES jobs (job_id) ON DELETE CASCADE,
+    idx INTEGER NOT NULL,
+    start REAL NOT NULL,
+    end REAL NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (job_id, idx)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS summaries (
+    job_id TEXT NOT NULL REFERENCES jobs (job_id) ON DELETE CASCADE,
+    summary_type TEXT NOT NULL,
+    text TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (job_id, summary_type)
+) WITHOUT ROWID;
+"""
+
+def _now():
+    """현재 시각 (ISO 8601, 초 단위)"""
+    return datetime.now().isoformat(timespec='seconds')
+
+class SQLiteStorage(Storage):
+    """
+    결과를 하나의 SQLite 데이터베이스(WAL 모드)에 저장하는 Storage
+    
+    작업(job)마다 원본 파일, 길이, 모델, 단계별 처리 시간을 기록하고 전사 결과는 세그먼트 행으로,
+    요약은 유형별 행으로 저장합니다. 저장은 모두 트랜잭션으로 이루어지며, 스레드마다 연결을 따로 열어
+    일괄 처리의 여러 작업이 동시에 읽고 쓸 수 있습니다 (WAL 모드에서는 쓰기 중에도 읽기가 막히지 않고,
+    쓰기 트랜잭션은 짧게 유지합니다). 캐시, 체크포인트, 검색 색인은 파일 저장소와 같은 위치를 사용하고,
+    결과 파일이 필요하면 export_job()으로 기존 형식의 파일을 만듭니다.
+    """
+    
+    def __init__(self, base_dir=None, cache_dir=None, db_path=None, **cache_options):
+        """
+        SQLiteStorage 초기화
+        
+        Args:
+            base_dir (str, optional): 결과 디렉토리. 기본값은 현재 디렉토리의 'results' 폴더.
+            cache_dir (str, optional): 캐시 디렉토리. 기본값은 base_dir 옆의 'cache' 폴더.
+            db_path (str, optional): 데이터베이스 파일 경로. 기본값은 base_dir 안의 'meetings.db'.
+            **cache_options: Storage의 캐시 크기 옵션
+        """
+        super().__init__(base_dir, cache_dir, **cache_options)
+        self.db_path = db_path if db_path is not None else os.path.join(self.base_dir, SQLITE_STORAGE_FILE)
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        
+        # 테이블이 없으면 만듦 (WAL 모드는 연결할 때 설정되며 데이터베이스 파일에 유지됨)
+        self._connection().executescript(SCHEMA)
+    
+    def _connection(self):
+        """현재 스레드의 데이터베이스 연결을 반환합니다. (처음 호출 시 엶)"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # isolation_level=None: 트랜잭션은 _transaction()에서 직접 시작
+            connection = sqlite3.connect(
+                self.db_path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+    
+    @contextmanager
+    def _transaction(self):
+        """
+        쓰기 트랜잭션을 엽니다. 예외가 발생하면 롤백합니다.
+        
+        BEGIN IMMEDIATE로 시작 시점에 쓰기 잠금을 잡아, 읽기로 시작한 트랜잭션이 나중에 쓰기로
+        바뀌면서 다른 작업과 교착 상태(SQLITE_BUSY)가 되는 일을 막습니다.
+        """
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+    
+    def close(self):
+        """모든 스레드의 데이터베이스 연결과 검색 색인을 닫습니다."""
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+        self._local = threading.local()
+        super().close()
+    
+    @staticmethod
+    def _ensure_job(connection, job_id, source_name=None):
+        """작업 행이 없으면 만들고, 있으면 수정 시각(과 이름)을 갱신합니다."""
+        now = _now()
+        connection.execute(
+            "INSERT INTO jobs (job_id, source_name, created_at, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(job_id) DO UPDATE SET updated_at = excluded.updated_at, "
+            "source_name = COALESCE(excluded.source_name, jobs.source_name)",
+            (job_id, source_name, now, now)
+        )
+    
+    def _location(self, job_id, kind):
+        """저장 위치를 나타내는 문자열 (데이터베이스 경로#작업 ID/종류)"""
+        return f"{self.db_path}#{job_id}/{kind}"
+    
+    def save_transcription(self, transcription_data, file_name=None, meeting_id=None, title=None):
+        """
+        전사 결과를 데이터베이스에 저장하고 검색 색인에 추가합니다. 같은 작업의 기존 전사 결과는 바뀝니다.
+        
+        Args:
+            transcription_data (dict 또는 Transcript): 전사 데이터
+            file_name (str, optional): 지정하면 데이터베이스 대신 결과 폴더의 파일로 저장
+            meeting_id (str, optional): 작업 ID. 기본값은 새로 만든 ID.
+            title (str, optional): 원본 파일 이름
+        
+        Returns:
+            str: 저장 위치
+        """
+        if file_name is not None:
+            return super().save_transcription(transcription_data, file_name, meeting_id, title)
+        
+        transcript = transcription_data
+        if not isinstance(transcript, Transcript):
+            transcript = Transcript.from_dict(transcript)
+        job_id = meeting_id or uuid.uuid4().hex[:16]
+        
+        with self._transaction() as connection:
+            self._ensure_job(connection, job_id, title)
+            connection.execute(
+                "INSERT OR REPLACE INTO transcripts (job_id, text, segment_count) VALUES (?, ?, ?)",
+                (job_id, transcript.text, len(transcript))
+            )
+            connection.execute("DELETE FROM segments WHERE job_id = ?", (job_id,))
+            connection.executemany(
+                "INSERT INTO segments (job_id, idx, start, end, text) VALUES (?, ?, ?, ?, ?)",
+                ((job_id, index, start, end, text) for index, (start, end, text) in enumerate(transcript.rows()))
+            )
+        
+        location = self._location(job_id, "transcription")
+        self._index_file(
+            location, job_id,
+            lambda meeting: self.search_index.add_transcript(location, transcript, meeting, title, mtime=time.time())
+        )
+        return location
+    
+    def save_summary(self, summary_text, summary_type="paragraph", file_name=None, meeting_id=None, title=None):
+        """
+        요약 결과를 데이터베이스에 저장하고 검색 색인에 추가합니다. 같은 작업의 같은 유형 요약은 바뀝니다.
+        
+        Args:
+            summary_text (str): 요약 텍스트
+            summary_type (str): 요약 유형 ('paragraph' 또는 'timestamped')
+            file_name (str, optional): 지정하면 데이터베이스 대신 결과 폴더의 파일로 저장
+            meeting_id (str, optional): 작업 ID. 기본값은 새로 만든 ID.
+            title (str, optional): 원본 파일 이름
+        
+        Returns:
+            str: 저장 위치
+        """
+        if file_name is not None:
+            return super().save_summary(summary_text, summary_type, file_name, meeting_id, title)
+        
+        job_id = meeting_id or uuid.uuid4().hex[:16]
+        with self._transaction() as connection:
+            self._ensure_job(connection, job_id, title)
+            connection.execute(
+                "INSERT OR REPLACE INTO summaries (job_id, summary_type, text, created_at) VALUES (?, ?, ?, ?)",
+                (job_id, summary_type, summary_text, _now())
+            )
+        
+        location = self._location(job_id, f"summary_{summary_type}")
+        self._index_file(
+            location, job_id,
+            lambda meeting: self.search_index.add_summary(
+                location, summary_text, summary_type, meeting, title, mtime=time.time()
+            )
+        )
+        return location
+    
+    def save_full_result(self, transcription_text, paragraph_summary, timestamped_summary=None, file_name=None):
+        """
+        통합 결과는 저장된 전사 결과와 요약으로 언제든 만들 수 있으므로 따로 저장하지 않습니다.
+        file_name을 지정한 경우에만 결과 폴더의 파일로 저장합니다.
+        
+        Returns:
+            str: 저장된 파일 경로 또는 데이터베이스 경로
+        """
+        if file_name is not None:
+            return super().save_full_result(transcription_text, paragraph_summary, timestamped_summary, file_name)
+        return self.db_path
+    
+    def record_job(self, job_id, source_file=None, duration=None, transcription_model=None,
+                   summary_model=None, timings=None):
+        """
+        작업 정보를 기록합니다. 주어진 값만 갱신합니다.
+        
+        Args:
+            job_id (str): 작업 ID
+            source_file (str, optional): 원본 파일 경로
+            duration (float, optional): 녹음 길이 (초)
+            transcription_model (str, optional): 전사 모델
+            summary_model (str, optional): 요약 모델
+            timings (dict, optional): 단계별 처리 시간 (초)
+        """
+        source_name = os.path.basename(source_file) if source_file else None
+        with self._transaction() as connection:
+            self._ensure_job(connection, job_id, source_name)
+            connection.execute(
+                "UPDATE jobs SET source_file = COALESCE(?, source_file), duration = COALESCE(?, duration), "
+                "transcription_model = COALESCE(?, transcription_model), "
+                "summary_model = COALESCE(?, summary_model), timings = COALESCE(?, timings) "
+                "WHERE job_id = ?",
+                (
+                    source_file, duration, transcription_model, summary_model,
+                    json.dumps(timings) if timings is not None else None, job_id
+                )
+            )
+    
+    def list_jobs(self, source_name=None, since=None, limit=None):
+        """
+        저장된 작업 목록을 최근 작업부터 반환합니다.
+        
+        Args:
+            source_name (str, optional): 원본 파일 이름에 포함된 문자열로 거르기
+            since (str, optional): 이 시각(ISO 8601) 이후에 만든 작업만
+            limit (int, optional): 최대 개수
+        
+        Returns:
+            list: 작업 정보 딕셔너리 목록 (job_id, source_file, source_name, duration, transcription_model,
+                  summary_model, timings, created_at, updated_at, segment_count, summary_types)
+        """
+        conditions, params = [], []
+        if source_name:
+            conditions.append("j.source_name LIKE ?")
+            params.append(f"%{source_name}%")
+        if since:
+            conditions.append("j.created_at >= ?")
+            params.append(since)
+        return self._select_jobs(conditions, params, limit)
+    
+    def _select_jobs(self, conditions, params, limit=None):
+        """
+        조건에 맞는 작업 정보를 최근 작업부터 조회합니다.
+        
+        Args:
+            conditions (list): WHERE 조건 목록 (AND로 연결)
+            params (list): 조건의 매개변수
+            limit (int, optional): 최대 개수
+        
+        Returns:
+            list: 작업 정보 딕셔너리 목록
+        """
+        sql = (
+            "SELECT j.job_id, j.source_file, j.source_name, j.duration, j.transcription_model, "
+            "j.summary_model, j.timings, j.created_at, j.updated_at, t.segment_count, "
+            "(SELECT group_concat(summary_type) FROM summaries AS s WHERE s.job_id = j.job_id) "
+            "FROM jobs AS j LEFT JOIN transcripts AS t ON t.job_id = j.job_id"
+        )
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY j.created_at DESC, j.job_id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = list(params) + [limit]
+        
+        jobs = []
+        for row in self._connection().execute(sql, params):
+            job = dict(zip(
+                ("job_id", "source_file", "source_name", "duration", "transcription_model",
+                 "summary_model", "timings", "created_at", "updated_at", "segment_count"),
+                row[:10]
+            ))
+            job["timings"] = json.loads(job["timings"]) if job["timings"] else {}
+            job["segment_count"] = job["segment_count"] or 0
+            job["summary_types"] = sorted(row[10].split(",")) if row[10] else []
+            jobs.append(job)
+        return jobs
+    
+    def get_job(self, job_id):
+        """
+        작업 정보를 반환합니다.
+        
+        Args:
+            job_id (str): 작업 ID
+        
+        Returns:
+            dict: 작업 정보 (list_jobs와 같은 형식). 없으면 None.
+        """
+        jobs = self._select_jobs(["j.job_id = ?"], [job_id])
+        return jobs[0] if jobs else None
+    
+    def load_transcript(self, job_id):
+        """
+        저장된 전사 결과를 불러옵니다.
+        
+        Args:
+            job_id (str): 작업 ID
+        
+        Returns:
+            Transcript: 전사 결과. 없으면 None.
+        """
+        connection = self._connection()
+        row = connection.execute("SELECT text FROM transcripts WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        
+        segments = connection.execute(
+            "SELECT start, end, text FROM segments WHERE job_id = ? ORDER BY idx", (job_id,)
+        ).fetchall()
+        return Transcript(
+            row[0],
+            (segment[0] for segment in segments),
+            (segment[1] for segment in segments),
+            (segment[2] for segment in segments)
+        )
+    
+    def load_summary(self, job_id, summary_type="paragraph"):
+        """
+        저장된 요약을 불러옵니다.
+        
+        Args:
+            job_id (str): 작업 ID
+            summary_type (str): 요약 유형
+        
+        Returns:
+            str: 요약 텍스트. 없으면 None.
+        """
+        row = self._connection().execute(
+            "SELECT text FROM summaries WHERE job_id = ? AND summary_type = ?", (job_id, summary_type)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def export_job(self, job_id, output_dir=None):
+        """
+        작업의 결과를 파일 저장소와 같은 형식의 파일로 내보냅니다.
+        (transcription_*.json, summary_<유형>_*.txt, meeting_summary_*.txt)
+        
+        Args:
+            job_id (str): 작업 ID
+            output_dir (str, optional): 파일을 만들 디렉토리. 기본값은 결과 폴더의 'exports/<작업 ID>'.
+        
+        Returns:
+            list: 만든 파일 경로 목록
+        """
+        if output_dir is None:
+            output_dir = os.path.join(self.base_dir, EXPORT_DIR_NAME, job_id)
+        os.makedirs(output_dir, exist_ok=True)
+        
+        transcript = self.load_transcript(job_id)
+        summaries = {
+            summary_type: self.load_summary(job_id, summary_type)
+            for summary_type in ("paragraph", "timestamped")
+        }
+        paths = []
+        
+        if transcript is not None:
+            file_path, f = self._open_result_file(None, "transcription", ".json", output_dir)
+            with f:
+                render.write_to(f, render.iter_json(transcript))
+            paths.append(file_path)
+        
+        for summary_type, summary_text in summaries.items():
+            if summary_text:
+                file_path, f = self._open_result_file(None, f"summary_{summary_type}", ".txt", output_dir)
+                with f:
+                    f.write(summary_text)
+                paths.append(file_path)
+        
+        if transcript is not None and any(summaries.values()):
+            file_path, f = self._open_result_file(None, "meeting_summary", ".txt", output_dir)
+            with f:
+                render.write_to(f, render.iter_full_result(
+                    transcript.text, summaries["paragraph"] or "", summaries["timestamped"] or ""
+                ))
+            paths.append(file_path)
+        
+        return paths
@@ -1,91 +1,244 @@
 import os
 import json
+import sqlite3
 from datetime import datetime
 
+from utils.cache import FileCache, hash_file, make_cache_key
+from utils.checkpoint import JobCheckpoint
+from utils.metrics import METRICS_FILE_PREFIX, PROMETHEUS_FILE_SUFFIX
+from utils.search_index import SearchIndex, SEARCH_INDEX_FILE, DEFAULT_SEARCH_LIMIT
+from utils.transcript import Transcript
+from utils.transcript_file import save_transcript_binary, TRANSCRIPT_BINARY_EXTENSION
+from utils import render
+
+# 전사 결과 캐시 최대 크기 (200MB)
+TRANSCRIPTION_CACHE_MAX_BYTES = 200 * 1024 * 1024
+# 요약 결과 캐시 최대 크기 (50MB) 및 최대 항목 수
+SUMMARY_CACHE_MAX_BYTES = 50 * 1024 * 1024
+SUMMARY_CACHE_MAX_ENTRIES = 1000
+
+# 전사 결과 저장 형식 ('json': 읽기 쉬운 JSON, 'bin': 압축된 이진 형식 (.trx))
+TRANSCRIPT_FORMATS = ("json", "bin")
+
 class Storage:
     """로컬 파일 저장 및 관리를 위한 클래스"""
     
-    def __init__(self, base_dir=None):
+    def __init__(self, base_dir=None, cache_dir=None,
+                 transcription_cache_max_bytes=TRANSCRIPTION_CACHE_MAX_BYTES,
+                 summary_cache_max_bytes=SUMMARY_CACHE_MAX_BYTES,
+                 summary_cache_max_entries=SUMMARY_CACHE_MAX_ENTRIES,
+                 transcript_format="json"):
         """
         Storage 클래스 초기화
         
         Args:
             base_dir (str, optional): 결과를 저장할 기본 디렉토리. 기본값은 현재 디렉토리의 'results' 폴더.
+            cache_dir (str, optional): 캐시 디렉토리. 기본값은 base_dir 옆의 'cache' 폴더.
+            transcription_cache_max_bytes (int, optional): 전사 캐시 최대 크기 (바이트)
+            summary_cache_max_bytes (int, optional): 요약 캐시 최대 크기 (바이트). None이면 제한 없음.
+            summary_cache_max_entries (int, optional): 요약 캐시 최대 항목 수. None이면 제한 없음.
+            transcript_format (str, optional): 전사 결과 저장 형식 (TRANSCRIPT_FORMATS). 기본값은 'json'.
         """
+        if transcript_format not in TRANSCRIPT_FORMATS:
+            raise ValueError(f"지원하지 않는 전사 결과 저장 형식입니다: {transcript_format}")
+        self.transcript_format = transcript_format
+        
         if base_dir is None:
             # 기본 저장 디렉토리는 프로젝트 폴더 내의 'results' 디렉토리
             self.base_dir = os.path.join(os.getcwd(), 'results')
         else:
             self.base_dir = base_dir
         
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.dirname(os.path.abspath(self.base_dir)), 'cache')
+        self.cache_dir = cache_dir
+        
         # 필요한 경우 디렉토리 생성
         os.makedirs(self.base_dir, exist_ok=True)
+        
+        # 같은 오디오를 다시 전사하지 않도록 전사 결과 캐시 (LRU)
+        self.transcription_cache = FileCache(
+            os.path.join(self.cache_dir, 'transcriptions'),
+            max_bytes=transcription_cache_max_bytes
+        )
+        
+        # 같은 프롬프트/모델/옵션의 요약을 다시 요청하지 않도록 요약 캐시 (LRU)
+        self.summary_cache = FileCache(
+            os.path.join(self.cache_dir, 'summaries'),
+            max_bytes=summary_cache_max_bytes,
+            max_entries=summary_cache_max_entries
+        )
+        
+        # 저장한 전사 결과와 요약의 전문 검색 색인 (results/search.db)
+        self.search_index = SearchIndex(os.path.join(self.base_dir, SEARCH_INDEX_FILE))
+    
+    def close(self):
+        """검색 색인 연결을 닫습니다."""
+        self.search_index.close()
+    
+    def transcription_cache_key(self, audio_file_path, model, language, response_format, audio_hash=None):
+        """
+        입력 오디오 내용과 전사 설정으로 캐시 키를 만듭니다.
+        
+        Args:
+            audio_file_path (str): 입력 오디오/비디오 파일 경로
+            model (str): 전사 모델
+            language (str): 전사 언어
+            response_format (str): 응답 형식
+            audio_hash (str, optional): 이미 계산한 파일 해시 (없으면 새로 계산)
+            
+        Returns:
+            str: 캐시 키
+        """
+        if audio_hash is None:
+            audio_hash = hash_file(audio_file_path)
+        return make_cache_key(audio_hash, model, language, response_format)
+    
+    def job_checkpoint(self, job_id):
+        """
+        작업 ID에 해당하는 체크포인트를 반환합니다. (results/jobs/<작업 ID>)
+        
+        Args:
+            job_id (str): 작업 ID
+            
+        Returns:
+            JobCheckpoint: 작업 체크포인트
+        """
+        return JobCheckpoint(os.path.join(self.base_dir, 'jobs', job_id))
+    
+    def load_cached_transcription(self, cache_key):
+        """
+        캐시된 전사 결과를 불러옵니다.
+        
+        Args:
+            cache_key (str): transcription_cache_key()로 만든 캐시 키
+            
+        Returns:
+            dict: 전사 데이터 (text, segments). 캐시에 없으면 None.
+        """
+        return self.transcription_cache.get(cache_key)
     
-    def save_transcription(self, transcription_data, file_name=None):
+    def cache_transcription(self, cache_key, transcription_data):
         """
-        전사 결과를 JSON 파일로 저장합니다.
+        전사 결과를 캐시에 저장합니다.
         
         Args:
-            transcription_data (dict 또는 TranscriptionResponse): 전사 데이터
+            cache_key (str): transcription_cache_key()로 만든 캐시 키
+            transcription_data (dict 또는 Transcript): 전사 데이터
+        """
+        self.transcription_cache.put(cache_key, self._transcription_to_dict(transcription_data))
+    
+    def transcription_cache_stats(self):
+        """
+        전사 캐시 통계를 반환합니다.
+        
+        Returns:
+            dict: hits, misses, entries, bytes
+        """
+        return self.transcription_cache.stats()
+    
+    def save_transcription(self, transcription_data, file_name=None, meeting_id=None, title=None):
+        """
+        전사 결과를 JSON 파일(또는 transcript_format이 'bin'이면 압축된 이진 파일)로 저장하고 검색 색인에 추가합니다.
+        
+        Args:
+            transcription_data (dict 또는 Transcript): 전사 데이터
             file_name (str, optional): 저장할 파일 이름. 기본값은 타임스탬프를 포함한 이름.
+            meeting_id (str, optional): 검색 결과에 표시할 회의 ID. 기본값은 파일 이름의 저장 시각.
+            title (str, optional): 검색 결과에 표시할 회의 제목 (예: 원본 파일 이름)
             
         Returns:
             str: 저장된 파일의 경로
         """
-        if file_name is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            file_name = f"transcription_{timestamp}.json"
+        if self.transcript_format == "bin":
+            transcript = transcription_data
+            if not isinstance(transcript, Transcript):
+                transcript = Transcript.from_dict(transcript)
+            # 파일 이름만 선점한 뒤 이진 파일로 교체
+            file_path, f = self._open_result_file(file_name, "transcription", TRANSCRIPT_BINARY_EXTENSION)
+            f.close()
+            save_transcript_binary(transcript, file_path, compress=True)
+            self._index_file(
+                file_path, meeting_id,
+                lambda meeting: self.search_index.add_transcript(file_path, transcript, meeting, title)
+            )
+            return file_path
+        
+        file_path, f = self._open_result_file(file_name, "transcription", ".json")
         
-        file_path = os.path.join(self.base_dir, file_name)
+        # JSON으로 저장 (Transcript는 세그먼트 단위로 바로 기록)
+        with f:
+            if isinstance(transcription_data, Transcript):
+                render.write_to(f, render.iter_json(transcription_data))
+            else:
+                json.dump(transcription_data, f, ensure_ascii=False, indent=2)
+        
+        self._index_file(
+            file_path, meeting_id,
+            lambda meeting: self.search_index.add_transcript(file_path, transcription_data, meeting, title)
+        )
+        return file_path
+    
+    def export_transcript(self, transcript, export_format, file_name=None):
+        """
+        전사 결과를 자막/문서 형식으로 내보냅니다.
         
-        # TranscriptionResponse 객체를 딕셔너리로 변환
-        if hasattr(transcription_data, '__dict__'):
-            # 사용자 정의 객체인 경우
-            data_dict = {
-                "text": getattr(transcription_data, 'text', ''),
-                "segments": []
-            }
+        Args:
+            transcript (Transcript): 전사 결과
+            export_format (str): 내보내기 형식 ('txt', 'srt', 'vtt', 'md', 'json')
+            file_name (str, optional): 저장할 파일 이름. 기본값은 타임스탬프를 포함한 이름.
             
-            # segments 처리 (있는 경우)
-            segments = getattr(transcription_data, 'segments', [])
-            for segment in segments:
-                segment_dict = {
-                    "start": getattr(segment, 'start', 0),
-                    "end": getattr(segment, 'end', 0),
-                    "text": getattr(segment, 'text', '')
-                }
-                data_dict["segments"].append(segment_dict)
-        else:
-            # 이미 딕셔너리인 경우
-            data_dict = transcription_data
+        Returns:
+            str: 저장된 파일의 경로
+        """
+        pieces = render.iter_transcript(transcript, export_format)
+        file_path, f = self._open_result_file(file_name, "transcript", f".{export_format}")
         
-        # JSON으로 저장
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data_dict, f, ensure_ascii=False, indent=2)
+        with f:
+            render.write_to(f, pieces)
         
         return file_path
     
-    def save_summary(self, summary_text, summary_type="paragraph", file_name=None):
+    @staticmethod
+    def _transcription_to_dict(transcription_data):
         """
-        요약 결과를 텍스트 파일로 저장합니다.
+        전사 데이터를 JSON으로 저장할 수 있는 딕셔너리로 변환합니다.
+        
+        Args:
+            transcription_data (dict 또는 Transcript): 전사 데이터
+            
+        Returns:
+            dict: text와 segments를 포함한 딕셔너리
+        """
+        if isinstance(transcription_data, Transcript):
+            return transcription_data.to_dict()
+        
+        # 이미 딕셔너리인 경우
+        return transcription_data
+    
+    def save_summary(self, summary_text, summary_type="paragraph", file_name=None, meeting_id=None, title=None):
+        """
+        요약 결과를 텍스트 파일로 저장하고 검색 색인에 추가합니다.
         
         Args:
             summary_text (str): 요약 텍스트
             summary_type (str): 요약 유형 ('paragraph' 또는 'timestamped')
             file_name (str, optional): 저장할 파일 이름. 기본값은 타임스탬프를 포함한 이름.
+            meeting_id (str, optional): 검색 결과에 표시할 회의 ID. 기본값은 파일 이름의 저장 시각.
+            title (str, optional): 검색 결과에 표시할 회의 제목
             
         Returns:
             str: 저장된 파일의 경로
         """
-        if file_name is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            file_name = f"summary_{summary_type}_{timestamp}.txt"
-        
-        file_path = os.path.join(self.base_dir, file_name)
+        file_path, f = self._open_result_file(file_name, f"summary_{summary_type}", ".txt")
         
-        with open(file_path, 'w', encoding='utf-8') as f:
+        with f:
             f.write(summary_text)
         
+        self._index_file(
+            file_path, meeting_id,
+            lambda meeting: self.search_index.add_summary(file_path, summary_text, summary_type, meeting, title)
+        )
         return file_path
     
     def save_full_result(self, transcription_text, paragraph_summary, timestamped_summary=None, file_name=None):
@@ -101,27 +254,123 @@ class Storage:
         Returns:
             str: 저장된 파일의 경로
         """
-        if file_name is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            file_name = f"meeting_summary_{timestamp}.txt"
+        file_path, f = self._open_result_file(file_name, "meeting_summary", ".txt")
         
-        file_path = os.path.join(self.base_dir, file_name)
+        with f:
+            render.write_to(f, render.iter_full_result(transcription_text, paragraph_summary, timestamped_summary))
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write("# 회의 요약 결과\n\n")
+        return file_path
+    
+    def save_metrics(self, metrics, file_name=None, prometheus=False):
+        """
+        작업의 단계별 시간과 카운터를 결과 폴더에 JSON 파일로 저장합니다.
+        
+        Args:
+            metrics (JobMetrics): 작업 지표
+            file_name (str, optional): 저장할 파일 이름. 기본값은 타임스탬프를 포함한 이름.
+            prometheus (bool): Prometheus 텍스트 형식 파일도 저장할지 여부. 작업마다 metrics_<작업 ID>.prom
+                               (작업 ID가 없으면 JSON 파일과 같은 이름)으로 저장하며, 같은 작업을 다시 실행하면 덮어씀.
             
-            if paragraph_summary:
-                f.write("## 1. 요약 (문단별)\n")
-                f.write(paragraph_summary)
-                f.write("\n\n")
+        Returns:
+            str: 저장된 JSON 파일의 경로
+        """
+        file_path, f = self._open_result_file(file_name, METRICS_FILE_PREFIX, ".json")
+        
+        with f:
+            json.dump(metrics.to_dict(), f, ensure_ascii=False, indent=2)
+        
+        if prometheus:
+            if metrics.job_id:
+                prometheus_name = f"{METRICS_FILE_PREFIX}_{metrics.job_id}{PROMETHEUS_FILE_SUFFIX}"
+            else:
+                prometheus_name = os.path.splitext(os.path.basename(file_path))[0] + PROMETHEUS_FILE_SUFFIX
+            metrics.save_prometheus(os.path.join(self.base_dir, prometheus_name))
+        return file_path
+    
+    def record_job(self, job_id, source_file=None, duration=None, transcription_model=None,
+                   summary_model=None, timings=None):
+        """
+        작업 정보(원본 파일, 길이, 모델, 처리 시간)를 기록합니다.
+        파일 저장소는 결과 파일만 남기므로 아무것도 하지 않으며, SQLiteStorage가 재정의합니다.
+        
+        Args:
+            job_id (str): 작업 ID
+            source_file (str, optional): 원본 파일 경로
+            duration (float, optional): 녹음 길이 (초)
+            transcription_model (str, optional): 전사 모델
+            summary_model (str, optional): 요약 모델
+            timings (dict, optional): 단계별 처리 시간 (초)
+        """
+    
+    def _index_file(self, file_path, meeting_id, add):
+        """
+        저장한 파일을 검색 색인에 추가합니다. 색인에 실패해도 저장 결과에는 영향을 주지 않습니다.
+        
+        Args:
+            file_path (str): 저장한 파일 경로
+            meeting_id (str): 회의 ID (None이면 파일 이름의 저장 시각 또는 파일 이름)
+            add (callable): 회의 ID를 받아 색인을 추가하는 함수
+        """
+        if meeting_id is None:
+            file_name = os.path.basename(file_path)
+            meeting_id = SearchIndex.classify_file(file_name)[1] or os.path.splitext(file_name)[0]
+        
+        try:
+            add(meeting_id)
+        except (sqlite3.Error, OSError) as e:
+            print(f"검색 색인 추가 실패: {str(e)}")
+    
+    def sync_search_index(self):
+        """
+        결과 폴더의 파일 중 아직 색인되지 않았거나 바뀐 파일을 색인합니다.
+        
+        Returns:
+            int: 새로 색인한 파일 수
+        """
+        return self.search_index.sync_directory(self.base_dir)
+    
+    def search(self, query, limit=DEFAULT_SEARCH_LIMIT):
+        """
+        저장된 전사 결과와 요약에서 검색어를 찾습니다.
+        
+        Args:
+            query (str): 검색어
+            limit (int): 최대 결과 수
             
-            if timestamped_summary:
-                f.write("## 2. 요약 (시간대별)\n")
-                f.write(timestamped_summary)
-                f.write("\n\n")
+        Returns:
+            list: 검색 결과 딕셔너리 목록 (meeting_id, title, kind, path, start, end, snippet)
+        """
+        return self.search_index.search(query, limit)
+    
+    def _open_result_file(self, file_name, prefix, extension, directory=None):
+        """
+        결과 파일을 쓰기 모드로 엽니다.
+        
+        파일 이름이 없으면 타임스탬프를 포함한 이름으로 새 파일을 만들고, 같은 이름의 파일이
+        이미 있으면 번호를 붙여 동시에 끝난 작업끼리 서로 덮어쓰지 않도록 합니다.
+        
+        Args:
+            file_name (str, optional): 저장할 파일 이름
+            prefix (str): 자동 생성 이름의 접두사
+            extension (str): 자동 생성 이름의 확장자
+            directory (str, optional): 저장할 디렉토리. 기본값은 결과 폴더.
             
-            if transcription_text:
-                f.write("## 3. 전체 전사 내용\n")
-                f.write(transcription_text)
+        Returns:
+            tuple: (파일 경로, 열린 파일 객체)
+        """
+        if directory is None:
+            directory = self.base_dir
+        if file_name is not None:
+            file_path = os.path.join(directory, file_name)
+            return file_path, open(file_path, 'w', encoding='utf-8')
         
-        return file_path 
\ No newline at end of file
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        suffix = 0
+        while True:
+            file_name = f"{prefix}_{timestamp}{f'_{suffix}' if suffix else ''}{extension}"
+            file_path = os.path.join(directory, file_name)
+            try:
+                # 'x' 모드: 파일이 이미 있으면 실패하므로 이름 선점이 원자적으로 이루어짐
+                return file_path, open(file_path, 'x', encoding='utf-8')
+            except FileExistsError:
+                suffix += 1
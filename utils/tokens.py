@@ -0,0 +1,85 @@
+import functools
+
+# tiktoken에 등록되지 않은 모델에 사용할 인코딩
+DEFAULT_ENCODING = "o200k_base"
+
+# 메시지 하나에 붙는 역할/구분 토큰 수와 응답 시작 토큰 수 (ChatCompletion 형식)
+MESSAGE_OVERHEAD_TOKENS = 4
+REPLY_OVERHEAD_TOKENS = 3
+
+@functools.lru_cache(maxsize=None)
+def _encoding(model):
+    """
+    모델의 tiktoken 인코딩을 한 번만 불러옵니다.
+    
+    Args:
+        model (str): 모델 이름 (None이면 DEFAULT_ENCODING)
+    
+    Returns:
+        tiktoken.Encoding: 인코딩 (tiktoken이 없거나 인코딩 파일을 받을 수 없으면 None)
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    
+    try:
+        try:
+            return tiktoken.encoding_for_model(model) if model else tiktoken.get_encoding(DEFAULT_ENCODING)
+        except KeyError:
+            return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        # 처음 사용할 때 인코딩 파일을 내려받으므로 오프라인이면 실패할 수 있음
+        print(f"tiktoken 인코딩을 불러올 수 없어 토큰 수를 추정합니다: {e}")
+        return None
+
+def has_tokenizer(model=None):
+    """모델의 토큰 수를 정확히 셀 수 있는지 여부 (tiktoken 사용 가능 여부)"""
+    return _encoding(model) is not None
+
+def estimate_tokens(text):
+    """
+    텍스트의 토큰 수를 대략적으로 추정합니다.
+    
+    영문/숫자는 약 4글자당 1토큰, 한글 등 비ASCII 문자는 1글자당 1토큰으로 계산하여
+    실제보다 약간 많게 추정합니다.
+    
+    Args:
+        text (str): 텍스트
+    
+    Returns:
+        int: 추정 토큰 수
+    """
+    non_ascii = sum(1 for char in text if ord(char) > 127)
+    return non_ascii + (len(text) - non_ascii + 3) // 4
+
+def count_tokens(text, model=None):
+    """
+    텍스트의 토큰 수를 셉니다. tiktoken이 있으면 모델의 토크나이저로 세고, 없으면 estimate_tokens()로 추정합니다.
+    
+    Args:
+        text (str): 텍스트
+        model (str, optional): 모델 이름
+    
+    Returns:
+        int: 토큰 수
+    """
+    encoding = _encoding(model)
+    if encoding is None:
+        return estimate_tokens(text)
+    return len(encoding.encode(text, disallowed_special=()))
+
+def count_message_tokens(messages, model=None):
+    """
+    ChatCompletion 요청 메시지 목록의 입력 토큰 수를 셉니다.
+    
+    Args:
+        messages (list): {"role", "content"} 메시지 목록
+        model (str, optional): 모델 이름
+    
+    Returns:
+        int: 입력 토큰 수 (메시지 형식에 붙는 토큰 포함)
+    """
+    return REPLY_OVERHEAD_TOKENS + sum(
+        MESSAGE_OVERHEAD_TOKENS + count_tokens(message["content"], model) for message in messages
+    )
@@ -0,0 +1,234 @@
+import bisect
+import itertools
+from array import array
+
+def format_timestamp(seconds):
+    """
+    초를 HH:MM:SS 형식으로 변환합니다.
+    
+    Args:
+        seconds (float): 초 단위의 시간
+    
+    Returns:
+        str: HH:MM:SS 형식의 시간 문자열
+    """
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+class Segment:
+    """전사 세그먼트 하나 (시작/종료 시간(초)과 텍스트)"""
+    
+    __slots__ = ("start", "end", "text")
+    
+    def __init__(self, start, end, text):
+        self.start = start
+        self.end = end
+        self.text = text
+    
+    def __repr__(self):
+        return f"Segment({self.start!r}, {self.end!r}, {self.text!r})"
+
+class Transcript:
+    """
+    전사 결과 (전체 텍스트와 세그먼트 목록)
+    
+    세그먼트는 객체 목록 대신 열 단위로 저장합니다. 시작/종료 시간은 float 배열에,
+    세그먼트 텍스트는 하나의 문자열에 이어 붙이고 각 세그먼트의 위치를 오프셋 배열에 기록하여,
+    긴 회의에서도 세그먼트 수와 관계없이 객체 몇 개만 사용합니다.
+    세그먼트는 시작 시간 순서로 정렬되어 있다고 가정하며, 시간 구간 검색은 이진 탐색으로 수행합니다.
+    """
+    
+    __slots__ = ("text", "_starts", "_ends", "_offsets", "_blob")
+    
+    def __init__(self, text="", starts=(), ends=(), texts=()):
+        """
+        Transcript 초기화
+        
+        Args:
+            text (str): 전체 전사 텍스트
+            starts (iterable): 세그먼트 시작 시간 목록 (초)
+            ends (iterable): 세그먼트 종료 시간 목록 (초)
+            texts (iterable): 세그먼트 텍스트 목록
+        """
+        texts = list(texts)
+        self.text = text or ""
+        self._starts = array('d', starts)
+        self._ends = array('d', ends)
+        self._blob = "".join(texts)
+        self._offsets = array('q', itertools.accumulate((len(t) for t in texts), initial=0))
+        
+        if not len(self._starts) == len(self._ends) == len(texts):
+            raise ValueError("세그먼트 시작/종료 시간과 텍스트의 개수가 다릅니다.")
+    
+    @classmethod
+    def from_dict(cls, data):
+        """
+        API 응답 또는 저장된 JSON(text, segments)으로 Transcript를 만듭니다.
+        
+        Args:
+            data (dict): text와 segments(start, end, text)를 포함한 딕셔너리
+        
+        Returns:
+            Transcript: 전사 결과
+        """
+        segments = data.get('segments') or []
+        return cls(
+            data.get('text', ''),
+            (segment.get('start', 0) for segment in segments),
+            (segment.get('end', 0) for segment in segments),
+            (segment.get('text', '') for segment in segments)
+        )
+    
+    @classmethod
+    def concat(cls, transcripts, offsets):
+        """
+        여러 전사 결과를 시간 오프셋을 더해 하나로 합칩니다.
+        
+        Args:
+            transcripts (list): 순서대로 정렬된 Transcript 목록
+            offsets (list): 각 전사 결과의 시작 오프셋 (초)
+        
+        Returns:
+            Transcript: 합쳐진 전사 결과
+        """
+        texts = [transcript.text.strip() for transcript in transcripts if transcript.text]
+        merged = cls(" ".join(texts))
+        for transcript, offset in zip(transcripts, offsets):
+            merged._starts.extend(start + offset for start in transcript._starts)
+            merged._ends.extend(end + offset for end in transcript._ends)
+            base = merged._offsets[-1]
+            merged._offsets.extend(base + position for position in transcript._offsets[1:])
+        merged._blob = "".join(transcript._blob for transcript in transcripts)
+        return merged
+    
+    def to_dict(self):
+        """
+        JSON으로 저장할 수 있는 딕셔너리로 변환합니다.
+        
+        Returns:
+            dict: text와 segments를 포함한 딕셔너리
+        """
+        return {
+            "text": self.text,
+            "segments": [
+                {"start": start, "end": end, "text": text}
+                for start, end, text in self.rows()
+            ]
+        }
+    
+    def __len__(self):
+        return len(self._starts)
+    
+    def __getitem__(self, index):
+        """index번째 세그먼트 (Segment)"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("세그먼트 인덱스가 범위를 벗어났습니다.")
+        return Segment(self._starts[index], self._ends[index], self.segment_text(index))
+    
+    def __iter__(self):
+        for start, end, text in self.rows():
+            yield Segment(start, end, text)
+    
+    @property
+    def segments(self):
+        """세그먼트 목록 (Segment). 반복만 필요하면 rows()가 더 가볍습니다."""
+        return list(self)
+    
+    def times(self, index):
+        """index번째 세그먼트의 (시작, 종료) 시간 (초)"""
+        return self._starts[index], self._ends[index]
+    
+    def segment_text(self, index):
+        """index번째 세그먼트의 텍스트"""
+        return self._blob[self._offsets[index]:self._offsets[index + 1]]
+    
+    def rows(self, start_index=0, stop_index=None):
+        """
+        세그먼트를 (시작, 종료, 텍스트) 튜플로 반환합니다.
+        
+        Args:
+            start_index (int): 첫 세그먼트 인덱스
+            stop_index (int, optional): 마지막 세그먼트 다음 인덱스. 기본값은 끝까지.
+        
+        Yields:
+            tuple: (시작 시간(초), 종료 시간(초), 텍스트)
+        """
+        if stop_index is None:
+            stop_index = len(self)
+        for index in range(start_index, stop_index):
+            yield self._starts[index], self._ends[index], self.segment_text(index)
+    
+    def timestamped_lines(self, start_index=0, stop_index=None):
+        """
+        세그먼트를 "[HH:MM:SS - HH:MM:SS] 텍스트" 형식의 줄로 반환합니다.
+        
+        Args:
+            start_index (int): 첫 세그먼트 인덱스
+            stop_index (int, optional): 마지막 세그먼트 다음 인덱스. 기본값은 끝까지.
+        
+        Yields:
+            str: 타임스탬프가 포함된 세그먼트 텍스트 (줄바꿈 제외)
+        """
+        for start, end, text in self.rows(start_index, stop_index):
+            yield f"[{format_timestamp(start)} - {format_timestamp(end)}] {text}"
+    
+    def index_range(self, start, end):
+        """
+        시간 구간과 겹치는 세그먼트의 인덱스 범위를 찾습니다.
+        
+        Args:
+            start (float): 구간 시작 (초)
+            end (float): 구간 끝 (초)
+        
+        Returns:
+            tuple: (첫 세그먼트 인덱스, 마지막 세그먼트 다음 인덱스)
+        """
+        first = bisect.bisect_right(self._ends, start)
+        last = bisect.bisect_left(self._starts, end, lo=first)
+        return first, last
+    
+    def slice(self, start, end):
+        """
+        시간 구간과 겹치는 세그먼트만 담은 전사 결과를 반환합니다.
+        
+        Args:
+            start (float): 구간 시작 (초)
+            end (float): 구간 끝 (초)
+        
+        Returns:
+            Transcript: 구간의 전사 결과 (text는 구간 세그먼트 텍스트를 이어 붙인 값)
+        """
+        return self.take(*self.index_range(start, end))
+    
+    def take(self, start_index, stop_index):
+        """
+        인덱스 범위의 세그먼트만 담은 전사 결과를 반환합니다.
+        
+        Args:
+            start_index (int): 첫 세그먼트 인덱스
+            stop_index (int): 마지막 세그먼트 다음 인덱스
+        
+        Returns:
+            Transcript: 부분 전사 결과
+        """
+        part = Transcript()
+        part._starts = self._starts[start_index:stop_index]
+        part._ends = self._ends[start_index:stop_index]
+        base = self._offsets[start_index]
+        part._offsets = array('q', (position - base for position in self._offsets[start_index:stop_index + 1]))
+        part._blob = self._blob[base:self._offsets[stop_index]]
+        part.text = part._blob.strip()
+        return part
+    
+    def remap_times(self, convert, convert_end=None):
+        """
+        모든 세그먼트의 시작/종료 시간을 변환합니다.
+        
+        Args:
+            convert (callable): 시간(초)을 받아 새 시간(초)을 반환하는 함수
+            convert_end (callable, optional): 종료 시간에 사용할 함수. 기본값은 convert.
+        """
+        self._starts = array('d', map(convert, self._starts))
+        self._ends = array('d', map(convert_end or convert, self._ends))
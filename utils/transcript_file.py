@@ -0,0 +1,343 @@
+import os
+import sys
+import json
+import mmap
+import zlib
+import bisect
+import struct
+import tempfile
+from array import array
+
+from utils.transcript import Transcript
+from utils import render
+
+# 이진 전사 파일 확장자
+TRANSCRIPT_BINARY_EXTENSION = ".trx"
+
+MAGIC = b"MTRX"
+FORMAT_VERSION = 1
+FLAG_COMPRESSED = 1
+
+# 헤더: 매직, 버전, 플래그, 세그먼트 수, 블록당 세그먼트 수, 블록 수, 전체 텍스트 크기, 세그먼트 텍스트 크기 (리틀 엔디언)
+HEADER = struct.Struct("<4sHHQIIQQ")
+
+# 압축 시 한 블록으로 묶어 압축하는 세그먼트 수 (구간을 읽을 때 이 단위로만 압축을 풂)
+COMPRESSION_BLOCK_SEGMENTS = 256
+COMPRESSION_LEVEL = 6
+
+def _little_endian(values):
+    """배열을 리틀 엔디언 바이트로 변환합니다."""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+def save_transcript_binary(transcript, path, compress=False):
+    """
+    전사 결과를 이진 형식으로 저장합니다.
+    
+    시작/종료 시간은 float32 열로, 세그먼트 텍스트는 UTF-8로 이어 붙인 하나의 블록과
+    세그먼트별 바이트 오프셋으로 기록합니다. 압축하면 세그먼트 텍스트를 COMPRESSION_BLOCK_SEGMENTS개씩
+    zlib으로 압축하여, 읽을 때 필요한 블록만 풀 수 있도록 합니다.
+    다른 프로세스가 쓰는 중인 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체합니다.
+    
+    Args:
+        transcript (Transcript): 전사 결과
+        path (str): 저장할 파일 경로
+        compress (bool): 텍스트를 압축할지 여부
+    
+    Returns:
+        int: 저장한 파일 크기 (바이트)
+    """
+    count = len(transcript)
+    starts = array('f')
+    ends = array('f')
+    offsets = array('Q', [0])
+    encoded = []
+    for start, end, text in transcript.rows():
+        starts.append(start)
+        ends.append(end)
+        data = text.encode('utf-8')
+        encoded.append(data)
+        offsets.append(offsets[-1] + len(data))
+    
+    full_text = transcript.text.encode('utf-8')
+    flags = 0
+    block_count = 0
+    block_offsets = array('Q')
+    if compress:
+        flags |= FLAG_COMPRESSED
+        full_text = zlib.compress(full_text, COMPRESSION_LEVEL)
+        blocks = [
+            zlib.compress(b"".join(encoded[index:index + COMPRESSION_BLOCK_SEGMENTS]), COMPRESSION_LEVEL)
+            for index in range(0, count, COMPRESSION_BLOCK_SEGMENTS)
+        ]
+        block_count = len(blocks)
+        block_offsets.append(0)
+        for block in blocks:
+            block_offsets.append(block_offsets[-1] + len(block))
+        encoded = blocks
+    
+    blob_size = sum(len(data) for data in encoded)
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, flags, count,
+        COMPRESSION_BLOCK_SEGMENTS if compress else 0, block_count,
+        len(full_text), blob_size
+    )
+    
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            f.write(_little_endian(starts))
+            f.write(_little_endian(ends))
+            f.write(_little_endian(offsets))
+            f.write(_little_endian(block_offsets))
+            f.write(full_text)
+            for data in encoded:
+                f.write(data)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    
+    return os.path.getsize(path)
+
+class TranscriptFile:
+    """
+    이진 전사 파일을 메모리 매핑으로 읽는 클래스
+    
+    파일을 열 때는 헤더만 확인하고, 시간 열은 매핑된 메모리를 그대로 보므로 시간 구간 검색은
+    파일 전체를 읽지 않고 이진 탐색으로 수행합니다. 세그먼트 텍스트도 필요한 범위만 읽습니다.
+    with 문으로 사용하거나 다 쓴 뒤 close()를 호출해야 합니다.
+    """
+    
+    def __init__(self, path):
+        """
+        TranscriptFile 초기화
+        
+        Args:
+            path (str): 이진 전사 파일 경로
+        
+        Raises:
+            ValueError: 이진 전사 파일이 아니거나 지원하지 않는 버전인 경우
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        try:
+            self._open_views()
+        except Exception:
+            self.close()
+            raise
+    
+    def _open_views(self):
+        """헤더를 읽고 각 열을 매핑된 메모리의 뷰로 엽니다."""
+        if len(self._mmap) < HEADER.size:
+            raise ValueError(f"이진 전사 파일이 아닙니다: {self.path}")
+        
+        (magic, version, self.flags, self.count, self.block_segments,
+         block_count, self._text_size, blob_size) = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"이진 전사 파일이 아닙니다: {self.path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 이진 전사 파일 버전입니다: {version}")
+        
+        self._buffer = memoryview(self._mmap)
+        self._views = [self._buffer]
+        position = HEADER.size
+        self._starts, position = self._column('f', position, self.count)
+        self._ends, position = self._column('f', position, self.count)
+        self._offsets, position = self._column('Q', position, self.count + 1)
+        self._block_offsets, position = self._column('Q', position, block_count + 1 if self.compressed else 0)
+        self._text_position = position
+        self._blob_position = position + self._text_size
+        
+        if self._blob_position + blob_size > len(self._mmap):
+            raise ValueError(f"이진 전사 파일이 손상되었습니다: {self.path}")
+        
+        self._cached_block = (None, b"")  # 마지막으로 압축을 푼 블록 (번호, 내용)
+    
+    def _column(self, typecode, position, length):
+        """
+        position부터 length개 값의 열을 반환합니다.
+        
+        리틀 엔디언 시스템에서는 매핑된 메모리를 그대로 보는 뷰를, 빅 엔디언 시스템에서는 변환한 배열을 반환합니다.
+        
+        Returns:
+            tuple: (열, 열 다음 위치)
+        """
+        size = array(typecode).itemsize * length
+        raw = self._buffer[position:position + size]
+        if sys.byteorder == "big":
+            values = array(typecode, raw.tobytes())
+            values.byteswap()
+            raw.release()
+            return values, position + size
+        
+        view = raw.cast(typecode)
+        self._views.extend((raw, view))
+        return view, position + size
+    
+    @property
+    def compressed(self):
+        """세그먼트 텍스트가 압축되어 있는지 여부"""
+        return bool(self.flags & FLAG_COMPRESSED)
+    
+    def close(self):
+        """메모리 매핑을 닫습니다."""
+        for view in reversed(getattr(self, "_views", [])):
+            view.release()
+        self._views = []
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __len__(self):
+        return self.count
+    
+    @property
+    def text(self):
+        """전체 전사 텍스트"""
+        data = self._buffer[self._text_position:self._blob_position].tobytes()
+        if self.compressed:
+            data = zlib.decompress(data)
+        return data.decode('utf-8')
+    
+    def times(self, index):
+        """index번째 세그먼트의 (시작, 종료) 시간 (초)"""
+        return self._starts[index], self._ends[index]
+    
+    def index_range(self, start, end):
+        """
+        시간 구간과 겹치는 세그먼트의 인덱스 범위를 찾습니다. (Transcript.index_range와 같음)
+        
+        Args:
+            start (float): 구간 시작 (초)
+            end (float): 구간 끝 (초)
+        
+        Returns:
+            tuple: (첫 세그먼트 인덱스, 마지막 세그먼트 다음 인덱스)
+        """
+        first = bisect.bisect_right(self._ends, start)
+        last = bisect.bisect_left(self._starts, end, lo=first)
+        return first, last
+    
+    def _block(self, block_index):
+        """압축된 블록의 내용을 반환합니다. (마지막 블록은 다시 풀지 않음)"""
+        if self._cached_block[0] != block_index:
+            begin = self._blob_position + self._block_offsets[block_index]
+            end = self._blob_position + self._block_offsets[block_index + 1]
+            self._cached_block = (block_index, zlib.decompress(self._buffer[begin:end]))
+        return self._cached_block[1]
+    
+    def _text_bytes(self, start_index, stop_index):
+        """세그먼트 범위의 텍스트를 UTF-8 바이트로 반환합니다."""
+        begin = self._offsets[start_index]
+        end = self._offsets[stop_index]
+        if not self.compressed:
+            return self._buffer[self._blob_position + begin:self._blob_position + end].tobytes()
+        
+        # 범위에 걸친 블록만 압축을 풀어 이어 붙임
+        first_block = start_index // self.block_segments
+        last_block = (stop_index - 1) // self.block_segments
+        data = b"".join(self._block(block) for block in range(first_block, last_block + 1))
+        base = self._offsets[first_block * self.block_segments]
+        return data[begin - base:end - base]
+    
+    def segment_text(self, index):
+        """index번째 세그먼트의 텍스트"""
+        return self._text_bytes(index, index + 1).decode('utf-8')
+    
+    def read(self, start_index=0, stop_index=None):
+        """
+        인덱스 범위의 세그먼트를 Transcript로 읽습니다.
+        
+        Args:
+            start_index (int): 첫 세그먼트 인덱스
+            stop_index (int, optional): 마지막 세그먼트 다음 인덱스. 기본값은 끝까지.
+        
+        Returns:
+            Transcript: 부분 전사 결과 (전체를 읽으면 text는 저장된 전체 텍스트, 일부면 구간 세그먼트 텍스트를 이어 붙인 값)
+        """
+        if stop_index is None:
+            stop_index = self.count
+        stop_index = max(start_index, stop_index)
+        
+        texts = []
+        if stop_index > start_index:
+            data = self._text_bytes(start_index, stop_index)
+            base = self._offsets[start_index]
+            texts = [
+                data[self._offsets[index] - base:self._offsets[index + 1] - base].decode('utf-8')
+                for index in range(start_index, stop_index)
+            ]
+        
+        if start_index == 0 and stop_index == self.count:
+            text = self.text
+        else:
+            text = "".join(texts).strip()
+        return Transcript(text, self._starts[start_index:stop_index], self._ends[start_index:stop_index], texts)
+    
+    def slice(self, start, end):
+        """
+        시간 구간과 겹치는 세그먼트만 읽습니다.
+        
+        Args:
+            start (float): 구간 시작 (초)
+            end (float): 구간 끝 (초)
+        
+        Returns:
+            Transcript: 구간의 전사 결과
+        """
+        return self.read(*self.index_range(start, end))
+
+def load_transcript_binary(path):
+    """
+    이진 전사 파일 전체를 Transcript로 불러옵니다.
+    
+    Args:
+        path (str): 이진 전사 파일 경로
+    
+    Returns:
+        Transcript: 전사 결과
+    """
+    with TranscriptFile(path) as transcript_file:
+        return transcript_file.read()
+
+def json_to_binary(json_path, binary_path, compress=False):
+    """
+    JSON 전사 파일(text, segments)을 이진 형식으로 변환합니다.
+    
+    Args:
+        json_path (str): JSON 전사 파일 경로
+        binary_path (str): 저장할 이진 파일 경로
+        compress (bool): 텍스트를 압축할지 여부
+    
+    Returns:
+        int: 저장한 파일 크기 (바이트)
+    """
+    with open(json_path, 'r', encoding='utf-8') as f:
+        transcript = Transcript.from_dict(json.load(f))
+    return save_transcript_binary(transcript, binary_path, compress)
+
+def binary_to_json(binary_path, json_path):
+    """
+    이진 전사 파일을 JSON(text, segments)으로 변환합니다.
+    
+    Args:
+        binary_path (str): 이진 전사 파일 경로
+        json_path (str): 저장할 JSON 파일 경로
+    """
+    transcript = load_transcript_binary(binary_path)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        render.write_to(f, render.iter_json(transcript))